@@ -1,3 +1,17 @@
-from django.contrib import admin
+# Django modules
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
 
-# Register your models here.
+
+class SoftDeleteAdminMixin:
+    """
+    Admin mixin that keeps soft deleted rows visible, since the default
+    manager of AbstractBaseModel hides them.
+    """
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset: QuerySet = self.model.all_with_deleted.get_queryset()  # type: ignore
+        ordering = self.get_ordering(request)  # type: ignore
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class AbstractsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"  # type: ignore
     name = "apps.abstracts"
+
+    def ready(self) -> None:
+        from apps.abstracts.metrics import instrument_connection
+        from apps.abstracts.sqlite import configure_sqlite
+
+        connection_created.connect(configure_sqlite, dispatch_uid="abstracts_configure_sqlite")
+        connection_created.connect(instrument_connection, dispatch_uid="abstracts_instrument_connection")
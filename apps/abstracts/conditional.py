@@ -0,0 +1,69 @@
+# Python modules
+import hashlib
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+# Django modules
+from django.db.models import Count, Max, Q
+from django.db.models.query import QuerySet
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class CollectionValidators(NamedTuple):
+    """
+    ETag / Last-Modified validators for a collection of AbstractBaseModel rows.
+
+    Both are derived from ``max(updated_at)`` over all rows, soft deleted ones
+    included (soft delete bumps updated_at), and the count of live rows, so a
+    client can revalidate a list without the server serializing any row.
+    """
+
+    etag: str
+    last_modified: Optional[datetime]
+
+    @classmethod
+    def for_queryset(cls, queryset: QuerySet) -> "CollectionValidators":
+        """
+        Compute the validators with one aggregate query. Pass a queryset from
+        ``all_with_deleted`` so deletions move the timestamp forward.
+        """
+        return cls.from_stats(queryset.order_by().aggregate(**cls.aggregates()))
+
+    @classmethod
+    async def afor_queryset(cls, queryset: QuerySet) -> "CollectionValidators":
+        """Async for_queryset() for async views."""
+        return cls.from_stats(await queryset.order_by().aaggregate(**cls.aggregates()))
+
+    @staticmethod
+    def aggregates() -> dict[str, Any]:
+        return {
+            "last_modified": Max("updated_at"),
+            "count": Count("pk", filter=Q(deleted_at__isnull=True)),
+        }
+
+    @classmethod
+    def from_stats(cls, stats: dict[str, Any]) -> "CollectionValidators":
+        last_modified: Optional[datetime] = stats["last_modified"]
+        fingerprint: str = f"{stats['count']}:{last_modified.isoformat() if last_modified else ''}"
+
+        return cls(
+            etag=quote_etag(hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()),
+            last_modified=last_modified,
+        )
+
+    def not_modified(self, request: HttpRequest) -> Optional[HttpResponseBase]:
+        """Return a 304 (or 412) response if the client's copy is current."""
+        return get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=int(self.last_modified.timestamp()) if self.last_modified else None,
+        )
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        """Attach the validators to a full response."""
+        response["ETag"] = self.etag
+        if self.last_modified is not None:
+            response["Last-Modified"] = http_date(self.last_modified.timestamp())
+        return response
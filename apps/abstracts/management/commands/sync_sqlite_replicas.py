@@ -0,0 +1,32 @@
+import sqlite3
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+SQLITE_ENGINE = "django.db.backends.sqlite3"
+
+
+class Command(BaseCommand):
+    help = "Copy the SQLite primary into the SQLite read replicas (local replica simulation)"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        primary: dict[str, Any] = settings.DATABASES[DEFAULT_DB_ALIAS]
+        if primary["ENGINE"] != SQLITE_ENGINE:
+            raise CommandError("The primary database is not SQLite.")
+
+        if not settings.DATABASE_REPLICAS:
+            self.stdout.write(self.style.WARNING("No replicas configured (set SQLITE_REPLICAS)."))
+            return
+
+        with sqlite3.connect(primary["NAME"]) as source:
+            for alias in settings.DATABASE_REPLICAS:
+                replica: dict[str, Any] = settings.DATABASES[alias]
+                if replica["ENGINE"] != SQLITE_ENGINE:
+                    raise CommandError(f"Replica '{alias}' is not SQLite.")
+
+                with sqlite3.connect(replica["NAME"]) as target:
+                    source.backup(target)
+                self.stdout.write(self.style.SUCCESS(f"✅ Copied {primary['NAME']} to {alias} ({replica['NAME']})."))
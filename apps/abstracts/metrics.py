@@ -0,0 +1,244 @@
+"""
+Lightweight per-view request metrics.
+
+MetricsMiddleware times every request and counts the SQL it runs, keyed by
+the resolved view name (the DRF route name, e.g. ``expense-list-expenses``).
+Totals are exposed in the Prometheus text format by metrics_view and per
+request through the Server-Timing header.
+
+Metrics live in process memory: with several server workers every worker
+reports its own series, so scrape each worker or aggregate by instance.
+"""
+
+# Python modules
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from hmac import compare_digest
+from typing import Any, Callable, Optional
+
+# Django modules
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
+
+
+UNMATCHED_VIEW = "unmatched"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class RequestTimings:
+    """SQL work done while serving one request."""
+
+    queries: int = 0
+    sql_seconds: float = 0.0
+
+
+@dataclass
+class ViewStats:
+    """Accumulated metrics of one (view, method) pair."""
+
+    bucket_counts: list[int]
+    count: int = 0
+    seconds: float = 0.0
+    queries: int = 0
+    sql_seconds: float = 0.0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+# Set by the middleware for the duration of a request; copied into the
+# worker threads that run ORM calls for async views.
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def record_sql(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+    """Execute wrapper adding each query to the current request's timings."""
+    timings: Optional[RequestTimings] = _request_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    started: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.sql_seconds += time.perf_counter() - started
+
+
+def instrument_connection(sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """connection_created receiver installing record_sql on every connection."""
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
+
+
+class MetricsRegistry:
+    """Thread-safe per-process store of request metrics."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.lock: threading.Lock = threading.Lock()
+        self.views: dict[tuple[str, str], ViewStats] = {}
+
+    def observe(self, view: str, method: str, status: int, seconds: float, timings: RequestTimings) -> None:
+        with self.lock:
+            stats: Optional[ViewStats] = self.views.get((view, method))
+            if stats is None:
+                stats = self.views[(view, method)] = ViewStats(bucket_counts=[0] * (len(self.buckets) + 1))
+
+            stats.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+            stats.count += 1
+            stats.seconds += seconds
+            stats.queries += timings.queries
+            stats.sql_seconds += timings.sql_seconds
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def reset(self) -> None:
+        with self.lock:
+            self.views.clear()
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text exposition format."""
+        with self.lock:
+            views: list[tuple[tuple[str, str], ViewStats]] = sorted(
+                (key, ViewStats(
+                    bucket_counts=list(stats.bucket_counts),
+                    count=stats.count,
+                    seconds=stats.seconds,
+                    queries=stats.queries,
+                    sql_seconds=stats.sql_seconds,
+                    statuses=dict(stats.statuses),
+                ))
+                for key, stats in self.views.items()
+            )
+
+        lines: list[str] = [
+            "# HELP http_request_duration_seconds Request latency by view.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (view, method), stats in views:
+            labels: str = f'view="{escape_label(view)}",method="{method}"'
+            cumulative: int = 0
+            for bound, bucket_count in zip((*self.buckets, None), stats.bucket_counts):
+                cumulative += bucket_count
+                le: str = "+Inf" if bound is None else repr(bound)
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.seconds}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+        lines += [
+            "# HELP http_responses_total Responses by view and status code.",
+            "# TYPE http_responses_total counter",
+        ]
+        for (view, method), stats in views:
+            for status, status_count in sorted(stats.statuses.items()):
+                lines.append(
+                    f'http_responses_total{{view="{escape_label(view)}",method="{method}",status="{status}"}} {status_count}'
+                )
+
+        lines += [
+            "# HELP db_queries_total SQL queries run while serving a view.",
+            "# TYPE db_queries_total counter",
+        ]
+        for (view, method), stats in views:
+            lines.append(f'db_queries_total{{view="{escape_label(view)}",method="{method}"}} {stats.queries}')
+
+        lines += [
+            "# HELP db_query_duration_seconds_total Time spent in SQL while serving a view.",
+            "# TYPE db_query_duration_seconds_total counter",
+        ]
+        for (view, method), stats in views:
+            lines.append(
+                f'db_query_duration_seconds_total{{view="{escape_label(view)}",method="{method}"}} {stats.sql_seconds}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry: MetricsRegistry = MetricsRegistry(settings.METRICS_LATENCY_BUCKETS)
+
+
+def view_name(request: HttpRequest) -> str:
+    """Name of the resolved route, e.g. ``expense-list-expenses``."""
+    match: Any = getattr(request, "resolver_match", None)
+    if match is None or not match.view_name:
+        return UNMATCHED_VIEW
+    return match.view_name
+
+
+def server_timing(seconds: float, timings: RequestTimings) -> str:
+    return (
+        f"app;dur={seconds * 1000:.1f}, "
+        f'db;dur={timings.sql_seconds * 1000:.1f};desc="{timings.queries} queries"'
+    )
+
+
+class MetricsMiddleware:
+    """
+    Records latency and SQL per view. Put it first in MIDDLEWARE so the
+    whole stack is measured. Works in both sync and async middleware chains.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self.is_async: bool = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+
+        timings: RequestTimings = RequestTimings()
+        token = _request_timings.set(timings)
+        started: float = time.perf_counter()
+        try:
+            response: HttpResponseBase = self.get_response(request)
+        finally:
+            _request_timings.reset(token)
+
+        self.record(request, response, time.perf_counter() - started, timings)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        timings: RequestTimings = RequestTimings()
+        token = _request_timings.set(timings)
+        started: float = time.perf_counter()
+        try:
+            response: HttpResponseBase = await self.get_response(request)
+        finally:
+            _request_timings.reset(token)
+
+        self.record(request, response, time.perf_counter() - started, timings)
+        return response
+
+    def record(self, request: HttpRequest, response: HttpResponseBase, seconds: float, timings: RequestTimings) -> None:
+        # Streaming responses are measured up to the first byte.
+        registry.observe(view_name(request), request.method, response.status_code, seconds, timings)
+        if settings.METRICS_SERVER_TIMING:
+            response["Server-Timing"] = server_timing(seconds, timings)
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus scrape endpoint, guarded by METRICS_AUTH_TOKEN. Without a
+    token it is only served with DEBUG on, and is a 404 otherwise.
+    """
+    token: str = settings.METRICS_AUTH_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            raise Http404()
+    elif not compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401)
+
+    return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,9 +1,56 @@
 from typing import Any
 
-from django.db.models import DateTimeField, Model
+from django.db.models import DateTimeField, Manager, Model, QuerySet
 from django.utils import timezone
 
 
+class SoftDeleteQuerySet(QuerySet):
+    """
+    QuerySet whose bulk delete soft-deletes rows with a single UPDATE.
+    """
+
+    def delete(self) -> tuple[int, dict[str, int]]:  # type: ignore
+        """
+        Soft delete all matched rows by stamping deleted_at (and updated_at,
+        so change tracking sees the deletion) in one UPDATE.
+        Mirrors the return value of QuerySet.delete().
+        """
+        now = timezone.now()
+        deleted_count: int = self.filter(deleted_at__isnull=True).update(deleted_at=now, updated_at=now)
+        return deleted_count, {self.model._meta.label: deleted_count}
+
+    def hard_delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Permanently delete all matched rows.
+        """
+        return super().delete()
+
+    def alive(self) -> "SoftDeleteQuerySet":
+        """Return rows that have not been soft deleted."""
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self) -> "SoftDeleteQuerySet":
+        """Return soft deleted rows only."""
+        return self.filter(deleted_at__isnull=False)
+
+
+class SoftDeleteManager(Manager.from_queryset(SoftDeleteQuerySet)):  # type: ignore
+    """
+    Default manager that hides soft deleted rows.
+    """
+
+    def get_queryset(self) -> SoftDeleteQuerySet:
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class AllObjectsManager(Manager.from_queryset(SoftDeleteQuerySet)):  # type: ignore
+    """
+    Manager that includes soft deleted rows.
+    """
+
+    pass
+
+
 class AbstractBaseModel(Model):
     """
     Abstract base model that provides common fields and methods for all models.
@@ -13,12 +60,16 @@ class AbstractBaseModel(Model):
     updated_at = DateTimeField(auto_now=True)
     deleted_at = DateTimeField(null=True, blank=True)
 
+    objects = SoftDeleteManager()
+    all_with_deleted = AllObjectsManager()
+
     class Meta:
         abstract = True
 
     def delete(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:  # type: ignore
         """
         Soft delete the model instance by setting the deleted_at field to the current timestamp.
+        updated_at is refreshed too so the deletion shows up as a change.
         """
         self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", "updated_at"])
@@ -0,0 +1,167 @@
+# Python modules
+import base64
+import binascii
+import json
+from typing import Any, Mapping, Optional
+
+# Django modules
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q
+from django.db.models.query import QuerySet
+
+# Django REST Framework
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+
+# Project modules
+from apps.abstracts.serializers import ValuesSerializer
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a descending ``(key_field, id)`` ordering.
+
+    The cursor is an opaque token holding the position of the last row of
+    the previous page, so every page is a single indexed range query and
+    rows inserted concurrently never shift or duplicate items across pages.
+
+    Pagination is opt-in (is_requested()) so existing clients keep getting
+    the plain list. That unpaginated mode loads every matching row and is
+    deprecated; new clients should always pass page_size or cursor.
+    """
+
+    key_field: str = "date"
+    cursor_query_param: str = "cursor"
+    page_size_query_param: str = "page_size"
+    page_size: int = 50
+    max_page_size: int = 500
+
+    next_cursor: Optional[str] = None
+
+    def is_requested(self, request: DRFRequest) -> bool:
+        """Check whether the client asked for a paginated response."""
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def get_page_size(self, request: DRFRequest) -> int:
+        """Return the requested page size clamped to ``max_page_size``."""
+        raw_value: Optional[str] = request.query_params.get(self.page_size_query_param)
+
+        if not raw_value:
+            return self.page_size
+
+        try:
+            page_size: int = int(raw_value)
+        except ValueError:
+            raise ValidationError(
+                detail={self.page_size_query_param: ["A valid integer is required."]}
+            )
+
+        if page_size < 1:
+            raise ValidationError(
+                detail={self.page_size_query_param: ["Ensure this value is greater than or equal to 1."]}
+            )
+
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, instance: Model | Mapping[str, Any]) -> str:
+        """Build an opaque cursor pointing at the given row (an instance or serialized row)."""
+        if isinstance(instance, Mapping):
+            key_value, pk = instance[self.key_field], instance["id"]
+        else:
+            key_value, pk = getattr(instance, self.key_field), instance.pk
+        payload: str = json.dumps([str(key_value), pk], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request: DRFRequest, queryset: QuerySet) -> Optional[tuple[Any, int]]:
+        """Decode the cursor query parameter into a ``(key, id)`` position."""
+        token: Optional[str] = request.query_params.get(self.cursor_query_param)
+
+        if not token:
+            return None
+
+        try:
+            padded: str = token + "=" * (-len(token) % 4)
+            raw_key, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            key_value: Any = queryset.model._meta.get_field(self.key_field).to_python(raw_key)
+            # bool is an int subclass, so reject true/false explicitly.
+            if key_value is None or not isinstance(pk, int) or isinstance(pk, bool):
+                raise ValueError
+        except (binascii.Error, DjangoValidationError, TypeError, ValueError):
+            raise ValidationError(
+                detail={self.cursor_query_param: ["Invalid cursor."]}
+            )
+
+        return key_value, pk
+
+    def get_page_queryset(self, queryset: QuerySet, request: DRFRequest) -> tuple[QuerySet, int]:
+        """Return the unevaluated page query (one extra row) and the page size."""
+        page_size: int = self.get_page_size(request)
+        queryset = queryset.order_by(f"-{self.key_field}", "-id")
+
+        position: Optional[tuple[Any, int]] = self.decode_cursor(request, queryset)
+        if position is not None:
+            key_value, pk = position
+            queryset = queryset.filter(
+                Q(**{f"{self.key_field}__lt": key_value})
+                | Q(**{self.key_field: key_value, "id__lt": pk})
+            )
+
+        return queryset[:page_size + 1], page_size
+
+    def build_page(self, rows: list[Any], page_size: int) -> list[Any]:
+        """Trim the extra row fetched by get_page_queryset and set next_cursor."""
+        has_next: bool = len(rows) > page_size
+        rows = rows[:page_size]
+
+        self.next_cursor = self.encode_cursor(rows[-1]) if has_next else None
+
+        return rows
+
+    def paginate_queryset(self, queryset: QuerySet, request: DRFRequest, view: Any = None) -> list[Model]:
+        """Return one page of rows following the requested cursor."""
+        page_queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.build_page(list(page_queryset), page_size)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: DRFRequest) -> list[Model]:
+        """Async paginate_queryset() for async views."""
+        page_queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.build_page([row async for row in page_queryset], page_size)
+
+    def paginate_values(self, queryset: QuerySet, request: DRFRequest, serializer: ValuesSerializer) -> list[dict[str, Any]]:
+        """paginate_queryset() returning the page already serialized by a ValuesSerializer."""
+        page_queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.build_page(serializer.serialize(page_queryset), page_size)
+
+    async def apaginate_values(
+        self,
+        queryset: QuerySet,
+        request: DRFRequest,
+        serializer: ValuesSerializer,
+    ) -> list[dict[str, Any]]:
+        """Async paginate_values() for async views."""
+        page_queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.build_page(await serializer.aserialize(page_queryset), page_size)
+
+    def get_paginated_response(self, data: Any) -> DRFResponse:
+        """Wrap the serialized page together with the continuation token."""
+        return DRFResponse(
+            data={
+                "next": self.next_cursor,
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,99 @@
+"""
+orjson-backed JSON renderer and parser.
+
+Both produce and accept exactly what DRF's JSONRenderer and JSONParser do.
+Values orjson has no native encoding for (Decimal, datetime, lazy strings,
+querysets) go through DRF's JSONEncoder.default, and anything orjson
+refuses (integers over 64 bits, indented output, ASCII-only output,
+non-UTF-8 request bodies) is handed to the stdlib implementation. orjson
+writes NaN and Infinity as null; such payloads are rendered by the stdlib
+too, so the strict JSONRenderer still rejects them. Without orjson
+installed both classes behave as their DRF parents.
+"""
+
+# Python modules
+import io
+import math
+from typing import Any, Mapping, Optional
+
+# Django modules
+from django.conf import settings
+
+# Django REST Framework
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+ORJSON_OPTIONS: int = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+
+def has_non_finite_float(data: Any) -> bool:
+    """Whether data holds a NaN or Infinity float that orjson writes as null."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite_float(value) for value in data)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer serializing with orjson when it is installed."""
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            rendered: bytes = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Only scan the data when orjson wrote a null it may have made up.
+        if b"null" in rendered and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as JSONRenderer, keeping the output a JavaScript subset.
+        return rendered.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser decoding UTF-8 bodies with orjson when it is installed."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        encoding: str = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        body: bytes = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Let the stdlib parser decide, so accepted input and error
+            # messages stay the same as JSONParser's.
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
@@ -0,0 +1,204 @@
+"""
+Primary / read-replica database routing.
+
+Writes and reads go to ``default`` unless a view opts in with
+``@read_from_replica``; those reads go to a random alias listed in
+``DATABASE_REPLICAS``. Reads stay on the primary for the rest of a request
+that wrote, and for ``REPLICA_READ_YOUR_WRITES_SECONDS`` after it for the
+same user (ReplicaPinningMiddleware), so clients see their own writes
+despite replication lag. Async views use ``areplica_reads``, which checks
+the pin with the cache's async API. Without replicas no pin is read or
+written.
+"""
+
+# Python modules
+import random
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Optional
+
+# Django modules
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpRequest, HttpResponseBase
+
+
+PRIMARY_PIN_KEY = "db:primary-pin:{user_id}"
+
+# app_label of the DatabaseCache table model.
+CACHE_APP_LABEL = "django_cache"
+
+
+@dataclass
+class RoutingState:
+    """Per-request routing flags, shared with threads the request runs in."""
+
+    use_replica: bool = False
+    wrote: bool = False
+
+
+_routing_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+def pin_to_primary(user_id: int) -> None:
+    """Send the user's replica reads to the primary for a short window."""
+    cache.set(
+        PRIMARY_PIN_KEY.format(user_id=user_id),
+        True,
+        timeout=settings.REPLICA_READ_YOUR_WRITES_SECONDS,
+    )
+
+
+async def apin_to_primary(user_id: int) -> None:
+    """Async pin_to_primary, for cache backends that must not block the event loop."""
+    await cache.aset(
+        PRIMARY_PIN_KEY.format(user_id=user_id),
+        True,
+        timeout=settings.REPLICA_READ_YOUR_WRITES_SECONDS,
+    )
+
+
+def is_pinned_to_primary(user_id: Optional[int]) -> bool:
+    if user_id is None or not settings.DATABASE_REPLICAS:
+        return False
+    return cache.get(PRIMARY_PIN_KEY.format(user_id=user_id), False)
+
+
+async def ais_pinned_to_primary(user_id: Optional[int]) -> bool:
+    if user_id is None or not settings.DATABASE_REPLICAS:
+        return False
+    return await cache.aget(PRIMARY_PIN_KEY.format(user_id=user_id), False)
+
+
+@contextmanager
+def _use_replica(use_replica: bool) -> Iterator[None]:
+    state: Optional[RoutingState] = _routing_state.get()
+    token = None
+    if state is None:
+        state = RoutingState()
+        token = _routing_state.set(state)
+
+    previous: bool = state.use_replica
+    state.use_replica = use_replica
+    try:
+        yield
+    finally:
+        state.use_replica = previous
+        if token is not None:
+            _routing_state.reset(token)
+
+
+@contextmanager
+def replica_reads(user_id: Optional[int] = None) -> Iterator[None]:
+    """Route reads inside the block to a replica unless the user is pinned."""
+    with _use_replica(not is_pinned_to_primary(user_id)):
+        yield
+
+
+@asynccontextmanager
+async def areplica_reads(user_id: Optional[int] = None) -> AsyncIterator[None]:
+    """replica_reads for async views."""
+    with _use_replica(not await ais_pinned_to_primary(user_id)):
+        yield
+
+
+def read_from_replica(view_method: Callable) -> Callable:
+    """Decorator for read-only ViewSet actions that tolerate replication lag."""
+
+    @wraps(view_method)
+    def wrapper(self: Any, request: Any, *args: Any, **kwargs: Any) -> Any:
+        with replica_reads(getattr(request.user, "pk", None)):
+            return view_method(self, request, *args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    """Database router implementing the policy described in the module docstring."""
+
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        state: Optional[RoutingState] = _routing_state.get()
+        replicas: list[str] = settings.DATABASE_REPLICAS
+
+        # A database cache must never serve stale entries from a replica.
+        if model._meta.app_label == CACHE_APP_LABEL:
+            return DEFAULT_DB_ALIAS
+        if replicas and state is not None and state.use_replica and not state.wrote:
+            return random.choice(replicas)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        state: Optional[RoutingState] = _routing_state.get()
+        # Cache writes are not user writes and must not pin the user.
+        if state is not None and model._meta.app_label != CACHE_APP_LABEL:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        # Replicas receive the schema from the primary.
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaPinningMiddleware:
+    """
+    Tracks writes per request and pins the writing user to the primary
+    afterwards. Must come after the authentication middleware. Works in
+    both sync (WSGI) and async (ASGI) middleware chains.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self.is_async: bool = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+
+        state: RoutingState = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response: HttpResponseBase = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        self.pin_writer(request, state)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        state: RoutingState = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response: HttpResponseBase = await self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        user_id: Optional[int] = self.writer_id(request, state)
+        if user_id is not None:
+            await apin_to_primary(user_id)
+        return response
+
+    def pin_writer(self, request: HttpRequest, state: RoutingState) -> None:
+        user_id: Optional[int] = self.writer_id(request, state)
+        if user_id is not None:
+            pin_to_primary(user_id)
+
+    def writer_id(self, request: HttpRequest, state: RoutingState) -> Optional[int]:
+        """The authenticated user to pin after a request that wrote, if any."""
+        # DRF (and AsyncViewSet) copy the authenticated user onto the Django request.
+        user: Any = getattr(request, "user", None)
+        if state.wrote and settings.DATABASE_REPLICAS and getattr(user, "is_authenticated", False):
+            return user.pk
+        return None
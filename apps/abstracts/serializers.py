@@ -0,0 +1,182 @@
+# Python modules
+import decimal
+from datetime import date, datetime
+from functools import cached_property
+from typing import Any, Callable, Iterable, Optional
+
+# Django modules
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.query import QuerySet
+
+# Django REST Framework
+from rest_framework import ISO_8601
+from rest_framework.fields import (
+    CharField,
+    DateField,
+    DecimalField,
+    Field,
+    IntegerField,
+    ReadOnlyField,
+)
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.serializers import DateTimeField, Serializer, ValidationError
+from rest_framework.settings import api_settings
+
+# Project modules
+from apps.abstracts.sync import SyncCursor
+
+
+ConverterFactory = Callable[[], Callable[[Any], Any]]
+
+
+class SyncQuerySerializer(Serializer):
+    """Serializer for validating the delta sync parameters."""
+
+    since = DateTimeField(required=False)
+    cursor = CharField(required=False)
+
+    def validate_cursor(self, value: str) -> SyncCursor:
+        try:
+            return SyncCursor.decode(value)
+        except ValueError:
+            raise ValidationError("Invalid cursor.")
+
+    def validate(self, attrs: dict) -> dict:
+        if "since" in attrs and "cursor" in attrs:
+            raise ValidationError("Provide either 'since' or 'cursor'.")
+        return attrs
+
+
+class TombstoneSerializer(Serializer):
+    """A row deleted since the last sync."""
+
+    id = IntegerField()
+    deleted_at = DateTimeField()
+
+
+def is_iso_8601(field: Field, default_format: Any) -> bool:
+    """Whether a date or datetime field renders ISO 8601 strings."""
+    output_format: Any = getattr(field, "format", default_format)
+    return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path producing the same output as a ModelSerializer.
+
+    The readable fields of serializer_class are compiled once into a
+    values_list() lookup and a converter per column, so serializing a row
+    is a tuple-to-dict conversion instead of binding fields and resolving
+    attributes on a model instance. Columns whose representation is the
+    database value itself (ids, text) are copied as-is; decimals and dates
+    are formatted the way the DRF fields format them, and any other field
+    type goes through its own to_representation().
+    """
+
+    def __init__(self, serializer_class: type[Serializer]) -> None:
+        self.serializer_class: type[Serializer] = serializer_class
+
+    @cached_property
+    def compiled(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple[tuple[int, ConverterFactory], ...]]:
+        """Output names, values_list() lookups and (column, converter factory) pairs."""
+        names: list[str] = []
+        lookups: list[str] = []
+        converters: list[tuple[int, ConverterFactory]] = []
+
+        for field in self.serializer_class().fields.values():
+            if field.write_only:
+                continue
+            if not field.source or field.source == "*":
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{field.field_name} has no model column to read."
+                )
+
+            factory: Optional[ConverterFactory] = self.get_converter_factory(field)
+            if factory is not None:
+                converters.append((len(names), factory))
+            names.append(field.field_name)
+            lookups.append(field.source.replace(".", "__"))
+
+        return tuple(names), tuple(lookups), tuple(converters)
+
+    @staticmethod
+    def get_converter_factory(field: Field) -> Optional[ConverterFactory]:
+        """
+        Factory of the converter from a column value to the field's
+        representation, or None when the representation is the value itself.
+        Factories run once per to_representation() call, so converters can
+        capture per-request state such as the active time zone.
+        """
+        if isinstance(field, (IntegerField, CharField, ReadOnlyField)):
+            return None
+        if isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+            return None
+
+        if (
+            isinstance(field, DecimalField)
+            and field.decimal_places is not None
+            and getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+            and not field.localize
+            and not field.normalize_output
+        ):
+            quantum: decimal.Decimal = decimal.Decimal(".1") ** field.decimal_places
+            context: decimal.Context = decimal.getcontext().copy()
+            if field.max_digits is not None:
+                context.prec = field.max_digits
+            rounding: Optional[str] = field.rounding
+
+            def format_decimal(value: decimal.Decimal) -> str:
+                return f"{value.quantize(quantum, rounding=rounding, context=context):f}"
+
+            return lambda: format_decimal
+
+        if isinstance(field, DateTimeField) and is_iso_8601(field, api_settings.DATETIME_FORMAT):
+            def datetime_converter() -> Callable[[Any], Any]:
+                field_timezone: Any = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+                if field_timezone is None:
+                    return field.to_representation
+
+                def format_datetime(value: datetime) -> str:
+                    if value.utcoffset() is None:
+                        return field.to_representation(value)
+                    text: str = value.astimezone(field_timezone).isoformat()
+                    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+                return format_datetime
+
+            return datetime_converter
+
+        if isinstance(field, DateField) and is_iso_8601(field, api_settings.DATE_FORMAT):
+            return lambda: date.isoformat
+
+        return lambda: field.to_representation
+
+    def to_representation(self, rows: Iterable[tuple[Any, ...]]) -> list[dict[str, Any]]:
+        """Turn values_list() rows into serialized dicts."""
+        names, _, factories = self.compiled
+
+        if not factories:
+            return [dict(zip(names, row)) for row in rows]
+
+        converters: list[tuple[int, Callable[[Any], Any]]] = [(index, factory()) for index, factory in factories]
+        data: list[dict[str, Any]] = []
+        for row in rows:
+            values: list[Any] = list(row)
+            for index, convert in converters:
+                value: Any = values[index]
+                if value is not None:
+                    values[index] = convert(value)
+            data.append(dict(zip(names, values)))
+        return data
+
+    def get_rows(self, queryset: QuerySet) -> QuerySet:
+        """The queryset narrowed to the serialized columns."""
+        return queryset.values_list(*self.compiled[1])
+
+    def serialize(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        """Serialize every row of the queryset."""
+        return self.to_representation(self.get_rows(queryset))
+
+    async def aserialize(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        """Async serialize() for async views."""
+        return self.to_representation([row async for row in self.get_rows(queryset)])
@@ -0,0 +1,16 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+def configure_sqlite(sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """connection_created receiver applying SQLITE_PRAGMAS to SQLite connections."""
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for pragma, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
@@ -0,0 +1,111 @@
+"""
+Delta sync over ``updated_at``.
+
+updated_at is stamped in Python before the transaction commits, so a row
+can become visible with an updated_at older than rows already handed
+out. Watermarks therefore never pass ``now - SYNC_WATERMARK_LAG_SECONDS``:
+rows written within the lag are sent again on the next sync (clients
+apply changes by id, so repeats are harmless) instead of being skipped
+for good. Responses hold at most SYNC_PAGE_SIZE rows; the rest is fetched
+by passing the returned ``next`` cursor, which continues after the last
+``(updated_at, id)`` sent.
+"""
+
+# Python modules
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+# Django modules
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+
+@dataclass(frozen=True)
+class SyncCursor:
+    """Position after the last row of a sync page, and the sync's ``since``."""
+
+    updated_at: datetime
+    id: int
+    since: Optional[datetime]
+
+    def encode(self) -> str:
+        """Opaque token for the ``cursor`` query parameter."""
+        payload: str = json.dumps(
+            [self.updated_at.isoformat(), self.id, self.since.isoformat() if self.since else None],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncCursor":
+        """Parse a token made by encode(); raises ValueError when it is invalid."""
+        try:
+            padded: str = token + "=" * (-len(token) % 4)
+            updated_at, pk, since = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            cursor: SyncCursor = cls(
+                updated_at=datetime.fromisoformat(updated_at),
+                id=pk,
+                since=datetime.fromisoformat(since) if since is not None else None,
+            )
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError("Invalid cursor.")
+
+        if not isinstance(cursor.id, int) or timezone.is_naive(cursor.updated_at):
+            raise ValueError("Invalid cursor.")
+        return cursor
+
+
+def collect_changes(
+    queryset: QuerySet,
+    since: Optional[datetime],
+    cursor: Optional[SyncCursor] = None,
+) -> dict[str, Any]:
+    """
+    Collect one page of rows changed after ``since`` for a delta sync, in
+    one query.
+
+    ``queryset`` must include soft deleted rows (``all_with_deleted``): rows
+    whose deleted_at is set are returned as tombstones. Without ``since`` the
+    live rows are returned. A ``cursor`` continues the sync it was issued
+    for. ``next`` is set while more rows remain; the watermark to send back
+    as ``since`` stays at ``since`` until the last page.
+    """
+    if cursor is not None:
+        since = cursor.since
+
+    if since is None:
+        queryset = queryset.filter(deleted_at__isnull=True)
+    else:
+        queryset = queryset.filter(updated_at__gt=since)
+
+    if cursor is not None:
+        queryset = queryset.filter(
+            Q(updated_at__gt=cursor.updated_at) | Q(updated_at=cursor.updated_at, id__gt=cursor.id)
+        )
+
+    page_size: int = settings.SYNC_PAGE_SIZE
+    rows: list[Any] = list(queryset.order_by("updated_at", "id")[:page_size + 1])
+    has_next: bool = len(rows) > page_size
+    rows = rows[:page_size]
+
+    next_cursor: Optional[str] = None
+    watermark: Optional[datetime] = since
+    if has_next:
+        next_cursor = SyncCursor(rows[-1].updated_at, rows[-1].pk, since).encode()
+    else:
+        newest: Optional[datetime] = rows[-1].updated_at if rows else cursor.updated_at if cursor else None
+        if newest is not None:
+            watermark = min(newest, timezone.now() - timedelta(seconds=settings.SYNC_WATERMARK_LAG_SECONDS))
+
+    return {
+        "watermark": watermark,
+        "next": next_cursor,
+        "changed": [row for row in rows if row.deleted_at is None],
+        "deleted": [row for row in rows if row.deleted_at is not None],
+    }
@@ -0,0 +1,54 @@
+# Python modules
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+# Django modules
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponseBase
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin(ABC):
+    """
+    TestCase mixin asserting that an API action stays within a SQL query
+    budget however much data the user owns.
+
+    assertQueryBudget sends the request, adds GROWTH more rows through
+    grow() and sends it again: both runs must fit the budget and issue the
+    same number of queries, so N+1 patterns fail. Caches are cleared
+    before each run, so budgets cover the cold path. Test cases must
+    implement grow().
+    """
+
+    GROWTH: int = 50
+
+    @abstractmethod
+    def grow(self, count: int) -> None:
+        """Add count more rows of the data the tested actions read."""
+
+    def assertQueryBudget(self, budget: int, send: Callable[[], HttpResponseBase]) -> None:
+        small: list[dict[str, Any]] = self.capture_queries(send)
+        self.grow(self.GROWTH)
+        large: list[dict[str, Any]] = self.capture_queries(send)
+
+        self.assertLessEqual(len(small), budget, self.describe(small))
+        self.assertEqual(
+            len(large),
+            len(small),
+            f"Query count grows with the data set:\n{self.describe(large)}",
+        )
+
+    def capture_queries(self, send: Callable[[], HttpResponseBase]) -> list[dict[str, Any]]:
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response: HttpResponseBase = send()
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        self.assertLess(response.status_code, 400, getattr(response, "content", b""))
+        return queries.captured_queries
+
+    @staticmethod
+    def describe(queries: list[dict[str, Any]]) -> str:
+        return "\n".join(f"{index}. {query['sql']}" for index, query in enumerate(queries, start=1))
@@ -0,0 +1,487 @@
+# Python modules
+import io
+import tempfile
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest import skipUnless
+from unittest.mock import patch
+
+# Django modules
+from django.core.cache import cache
+from django.core.cache.backends.db import DatabaseCache
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import Serializer
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.metrics import registry
+from apps.abstracts.pagination import KeysetPagination
+from apps.abstracts.routers import (
+    PrimaryReplicaRouter,
+    ReplicaPinningMiddleware,
+    is_pinned_to_primary,
+    pin_to_primary,
+    replica_reads,
+)
+from apps.abstracts import renderers
+from apps.abstracts.renderers import ORJSONParser, ORJSONRenderer
+from apps.abstracts.serializers import ValuesSerializer
+from apps.abstracts.static import HASHED_CACHE_CONTROL, UNHASHED_CACHE_CONTROL, serve_static
+from apps.auths.models import CustomUser
+from apps.category.models import Category
+from apps.category.serializers import CategoryListSerializer, category_list_values
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+from apps.expense.serializers import ExpenseListSerializer, expense_list_values
+from settings.database import database_from_url
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class PrimaryReplicaRouterTestCase(SimpleTestCase):
+    """Checks replica routing decisions and read-your-writes stickiness."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.router: PrimaryReplicaRouter = PrimaryReplicaRouter()
+
+    def test_reads_use_primary_unless_opted_in(self) -> None:
+        self.assertEqual(self.router.db_for_read(Expense), "default")
+
+        with replica_reads(user_id=1):
+            self.assertEqual(self.router.db_for_read(Expense), "replica")
+
+        self.assertEqual(self.router.db_for_read(Expense), "default")
+
+    def test_reads_after_write_stay_on_primary(self) -> None:
+        with replica_reads(user_id=1):
+            self.assertEqual(self.router.db_for_write(Expense), "default")
+            self.assertEqual(self.router.db_for_read(Expense), "default")
+
+    def test_pinned_user_reads_primary(self) -> None:
+        pin_to_primary(1)
+
+        with replica_reads(user_id=1):
+            self.assertEqual(self.router.db_for_read(Expense), "default")
+        with replica_reads(user_id=2):
+            self.assertEqual(self.router.db_for_read(Expense), "replica")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_pin_lookup_without_replicas(self) -> None:
+        pin_to_primary(1)
+
+        with patch.object(cache, "get", side_effect=AssertionError("cache read")):
+            self.assertFalse(is_pinned_to_primary(1))
+            with replica_reads(user_id=1):
+                self.assertEqual(self.router.db_for_read(Expense), "default")
+
+    def test_middleware_pins_writing_user(self) -> None:
+        def write_view(request: HttpRequest) -> HttpResponse:
+            request.user = CustomUser(pk=7)
+            self.router.db_for_write(Expense)
+            return HttpResponse()
+
+        def read_view(request: HttpRequest) -> HttpResponse:
+            request.user = CustomUser(pk=8)
+            self.router.db_for_read(Expense)
+            return HttpResponse()
+
+        ReplicaPinningMiddleware(write_view)(RequestFactory().post("/"))
+        ReplicaPinningMiddleware(read_view)(RequestFactory().get("/"))
+
+        self.assertTrue(is_pinned_to_primary(7))
+        self.assertFalse(is_pinned_to_primary(8))
+
+    def test_database_cache_uses_primary_without_pinning(self) -> None:
+        cache_model: type = DatabaseCache("expense_tracker_cache", {}).cache_model_class
+
+        with replica_reads(user_id=1):
+            self.assertEqual(self.router.db_for_read(cache_model), "default")
+            self.assertEqual(self.router.db_for_write(cache_model), "default")
+            self.assertEqual(self.router.db_for_read(Expense), "replica")
+
+    def test_replicas_are_not_migrated(self) -> None:
+        self.assertFalse(self.router.allow_migrate("replica", "expense"))
+        self.assertTrue(self.router.allow_migrate("default", "expense"))
+
+
+
+class DatabaseFromUrlTestCase(SimpleTestCase):
+    """Checks DATABASES entries built from database URLs."""
+
+    def test_sqlite_relative_and_absolute_paths(self) -> None:
+        self.assertEqual(
+            database_from_url("sqlite:///db.sqlite3", conn_max_age=60),
+            {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": "db.sqlite3",
+                "CONN_MAX_AGE": 60,
+                "CONN_HEALTH_CHECKS": False,
+            },
+        )
+        self.assertEqual(
+            database_from_url("sqlite:////var/lib/app/db%20file.sqlite3")["NAME"],
+            "/var/lib/app/db file.sqlite3",
+        )
+        self.assertEqual(database_from_url("sqlite://")["NAME"], ":memory:")
+
+    def test_postgres_with_query_options(self) -> None:
+        for scheme in ("postgres", "postgresql", "pgsql"):
+            entry: dict = database_from_url(
+                f"{scheme}://app:p%40ss@db.internal:6432/expenses?sslmode=require&application_name=api",
+                conn_max_age=60,
+                conn_health_checks=True,
+                statement_timeout_ms=5000,
+            )
+            self.assertEqual(
+                entry,
+                {
+                    "ENGINE": "django.db.backends.postgresql",
+                    "NAME": "expenses",
+                    "USER": "app",
+                    "PASSWORD": "p@ss",
+                    "HOST": "db.internal",
+                    "PORT": "6432",
+                    "CONN_MAX_AGE": 60,
+                    "CONN_HEALTH_CHECKS": True,
+                    "OPTIONS": {
+                        "sslmode": "require",
+                        "application_name": "api",
+                        "options": "-c statement_timeout=5000",
+                    },
+                },
+            )
+
+        entry = database_from_url("postgres://db/expenses")
+        self.assertEqual((entry["USER"], entry["PASSWORD"], entry["PORT"], entry["OPTIONS"]), ("", "", "", {}))
+
+    def test_pool_forces_conn_max_age_zero(self) -> None:
+        entry: dict = database_from_url(
+            "postgres://app@db/expenses",
+            conn_max_age=60,
+            pool=True,
+            pool_min_size=1,
+            pool_max_size=4,
+            pool_timeout=3,
+        )
+        self.assertEqual(entry["CONN_MAX_AGE"], 0)
+        self.assertEqual(entry["OPTIONS"]["pool"], {"min_size": 1, "max_size": 4, "timeout": 3})
+
+    def test_unknown_scheme(self) -> None:
+        for url in ("mysql://app@db/expenses", "db.sqlite3"):
+            with self.assertRaisesMessage(ValueError, "Unsupported database URL scheme"):
+                database_from_url(url)
+
+
+class ServeStaticTestCase(SimpleTestCase):
+    """Checks cache headers of the production static file view."""
+
+    def setUp(self) -> None:
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for name in ("app.css", "app.0123456789ab.css"):
+            (Path(directory.name) / name).write_text("body {}")
+        self.enterContext(override_settings(STATIC_ROOT=directory.name))
+        self.enterContext(
+            patch("apps.abstracts.static.hashed_names", return_value=frozenset({"app.0123456789ab.css"}))
+        )
+
+    def test_hashed_files_are_cached_for_good(self) -> None:
+        response = serve_static(RequestFactory().get("/"), "app.0123456789ab.css")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], HASHED_CACHE_CONTROL)
+        response.close()
+
+        response = serve_static(RequestFactory().get("/"), "app.css")
+        self.assertEqual(response["Cache-Control"], UNHASHED_CACHE_CONTROL)
+        response.close()
+
+
+class MetricsMiddlewareTestCase(TestCase):
+    """Checks per-view latency and SQL metrics and their exposition."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        registry.reset()
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="metrics@example.com",
+            username="metrics",
+            password="StrongPass123!",
+        )
+        Category.objects.create(user=self.user, name="Food")
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(METRICS_AUTH_TOKEN="scrape-secret")
+    def test_records_queries_per_view(self) -> None:
+        response = self.client.get("/api/expense-tracker/v1/categories/list")
+        self.assertRegex(response["Server-Timing"], r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="[1-9]\d* queries"$')
+
+        stats = registry.views[("category-list-categories", "GET")]
+        self.assertEqual((stats.count, stats.statuses), (1, {200: 1}))
+        self.assertEqual(stats.queries, int(response["Server-Timing"].split('desc="')[1].split()[0]))
+
+        body: str = self.client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).content.decode()
+        self.assertIn(
+            'http_request_duration_seconds_count{view="category-list-categories",method="GET"} 1',
+            body,
+        )
+        self.assertIn(
+            'http_request_duration_seconds_bucket{view="category-list-categories",method="GET",le="+Inf"} 1',
+            body,
+        )
+        self.assertIn(f'db_queries_total{{view="category-list-categories",method="GET"}} {stats.queries}', body)
+
+    @override_settings(METRICS_AUTH_TOKEN="scrape-secret")
+    def test_scrape_token(self) -> None:
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+
+        response = self.client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_AUTH_TOKEN="")
+    def test_no_token_only_served_in_debug(self) -> None:
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+
+class ValuesSerializerTestCase(TestCase):
+    """Checks the values()-based list serializers render the same JSON as DRF."""
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="values@example.com",
+            username="values",
+            password="StrongPass123!",
+        )
+        self.category: Category = Category.objects.create(user=self.user, name="Food")
+        Category.objects.create(user=self.user, name="Rent").delete()
+        for amount, description in (
+            (Decimal("12.5"), "Lunch"),
+            (Decimal("100"), ""),
+            (Decimal("0.01"), "Gum"),
+            (Decimal("99999.99"), "Laptop"),
+        ):
+            Expense.objects.create(
+                user=self.user,
+                category=self.category,
+                amount=amount,
+                description=description,
+                date=date(2024, 2, 29),
+            )
+
+    def assertSameJSON(self, serializer_class: type[Serializer], values_serializer: ValuesSerializer, queryset: QuerySet) -> None:
+        renderer: JSONRenderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(values_serializer.serialize(queryset)),
+            renderer.render(serializer_class(queryset, many=True).data),
+        )
+
+    def test_expenses_match_model_serializer(self) -> None:
+        self.assertSameJSON(
+            ExpenseListSerializer,
+            expense_list_values,
+            Expense.objects.filter(user=self.user).order_by("-date", "-id"),
+        )
+
+    def test_categories_match_model_serializer(self) -> None:
+        queryset: QuerySet = Category.all_with_deleted.filter(user=self.user).order_by("id")
+        self.assertSameJSON(CategoryListSerializer, category_list_values, queryset)
+
+        with timezone.override("Asia/Almaty"):
+            self.assertSameJSON(CategoryListSerializer, category_list_values, queryset)
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """Checks the orjson renderer and parser match DRF's JSON classes."""
+
+    payload: dict = {
+        "amount": Decimal("12.50"),
+        "date": date(2024, 2, 29),
+        "created_at": datetime(2024, 2, 29, 8, 30, 0, 123456, tzinfo=dt_timezone.utc),
+        "naive": datetime(2024, 2, 29, 8, 30),
+        "text": "Café \u2028 \u2029 ✓",
+        "lazy": gettext_lazy("Expense not found."),
+        "nested": [{"id": 1, "ratio": 0.1}, None, True],
+        1: "non-string key",
+    }
+
+    def test_render_matches_json_renderer(self) -> None:
+        self.assertEqual(ORJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+        self.assertEqual(
+            ORJSONRenderer().render(self.payload, "application/json; indent=2"),
+            JSONRenderer().render(self.payload, "application/json; indent=2"),
+        )
+        self.assertEqual(ORJSONRenderer().render({"big": 2**70}), JSONRenderer().render({"big": 2**70}))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_non_finite_floats_use_stdlib(self) -> None:
+        for value in (float("nan"), float("inf"), -float("inf")):
+            data: dict = {"nested": [{"ratio": value}, None]}
+            with self.assertRaisesMessage(ValueError, "Out of range float values are not JSON compliant"):
+                JSONRenderer().render(data)
+            with self.assertRaisesMessage(ValueError, "Out of range float values are not JSON compliant"):
+                ORJSONRenderer().render(data)
+
+        lenient: JSONRenderer = JSONRenderer()
+        lenient.strict = False
+        fast: ORJSONRenderer = ORJSONRenderer()
+        fast.strict = False
+        self.assertEqual(fast.render({"ratio": float("nan")}), lenient.render({"ratio": float("nan")}))
+
+    def test_parse_matches_json_parser(self) -> None:
+        body: bytes = JSONRenderer().render(self.payload)
+        context: dict = {"encoding": "utf-8"}
+
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body), "application/json", context),
+            JSONParser().parse(io.BytesIO(body), "application/json", context),
+        )
+        with self.assertRaisesMessage(ParseError, "JSON parse error"):
+            ORJSONParser().parse(io.BytesIO(b'{"amount": NaN}'), "application/json", context)
+
+    @skipUnless(renderers.orjson, "orjson is not installed")
+    def test_uses_orjson(self) -> None:
+        with patch.object(JSONRenderer, "render", side_effect=AssertionError("stdlib fallback")):
+            ORJSONRenderer().render(self.payload)
+
+
+class KeysetPaginationTestCase(TestCase):
+    """Checks cursor paging of list_expenses."""
+
+    url: str = "/api/expense-tracker/v1/expenses/list"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="pages@example.com",
+            username="pages",
+            password="StrongPass123!",
+        )
+        # Several rows per date so the id tie-breaker decides the order.
+        for day in (1, 1, 1, 2, 2, 3, 3, 3):
+            Expense.objects.create(user=self.user, amount=Decimal("1.00"), date=date(2024, 1, day))
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def expected_ids(self) -> list[int]:
+        return list(
+            Expense.objects.filter(user=self.user).order_by("-date", "-id").values_list("id", flat=True)
+        )
+
+    def test_cursor_round_trip(self) -> None:
+        ids: list[int] = []
+        params: dict = {"page_size": 3}
+        while True:
+            page: dict = self.client.get(self.url, params).json()
+            self.assertLessEqual(len(page["results"]), 3)
+            ids += [row["id"] for row in page["results"]]
+            if page["next"] is None:
+                break
+            params = {"page_size": 3, "cursor": page["next"]}
+
+        self.assertEqual(ids, self.expected_ids())
+
+    def test_concurrent_inserts_do_not_shift_pages(self) -> None:
+        expected: list[int] = self.expected_ids()
+        first: dict = self.client.get(self.url, {"page_size": 4}).json()
+
+        # New rows on dates already paged past, including one sharing the
+        # boundary date, must not duplicate or hide rows on the next page.
+        Expense.objects.create(user=self.user, amount=Decimal("2.00"), date=date(2024, 1, 2))
+        Expense.objects.create(user=self.user, amount=Decimal("2.00"), date=date(2024, 1, 3))
+
+        second: dict = self.client.get(self.url, {"page_size": 4, "cursor": first["next"]}).json()
+        self.assertEqual(
+            [row["id"] for row in first["results"] + second["results"]],
+            expected,
+        )
+        self.assertIsNone(second["next"])
+
+    def test_invalid_cursor(self) -> None:
+        # Garbage, a string pk, a bad date and a boolean pk.
+        cursors: tuple[str, ...] = (
+            "not-a-cursor",
+            "WyIyMDI0LTAxLTAxIiwieCJd",
+            "WyJub3QtYS1kYXRlIiwxXQ",
+            "WyIyMDI0LTAxLTAxIix0cnVlXQ",
+        )
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {"cursor": cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("cursor", response.json())
+
+    def test_page_size_is_capped(self) -> None:
+        with patch.object(KeysetPagination, "max_page_size", 5):
+            page: dict = self.client.get(self.url, {"page_size": 1000}).json()
+        self.assertEqual(len(page["results"]), 5)
+        self.assertIsNotNone(page["next"])
+
+        response = self.client.get(self.url, {"page_size": 0})
+        self.assertEqual(response.status_code, 400)
+
+
+class SoftDeleteTestCase(TestCase):
+    """Checks the soft-delete managers and queryset."""
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="soft@example.com",
+            username="soft",
+            password="StrongPass123!",
+        )
+        self.expenses: list[Expense] = [
+            Expense.objects.create(user=self.user, amount=Decimal("3.00"), date=date(2024, 1, day))
+            for day in range(1, 5)
+        ]
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        self.expenses[0].delete()
+
+    def test_managers_split_live_and_deleted_rows(self) -> None:
+        live, tombstone = self.expenses[1:], self.expenses[0]
+
+        self.assertQuerySetEqual(Expense.objects.order_by("id"), live)
+        self.assertQuerySetEqual(Expense.all_with_deleted.order_by("id"), self.expenses)
+        self.assertQuerySetEqual(Expense.all_with_deleted.dead(), [tombstone])
+        self.assertQuerySetEqual(Expense.all_with_deleted.alive().order_by("id"), live)
+        self.assertIsNotNone(Expense.all_with_deleted.get(pk=tombstone.pk).deleted_at)
+
+    def test_queryset_delete_is_one_update(self) -> None:
+        before: Expense = Expense.objects.get(pk=self.expenses[1].pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            count, per_model = Expense.objects.filter(pk__in=[e.pk for e in self.expenses[1:3]]).delete()
+
+        # The other queries lock the rows and move the rollup (ExpenseQuerySet).
+        stamps: list[str] = [query["sql"] for query in queries if 'SET "deleted_at"' in query["sql"]]
+        self.assertEqual(len(stamps), 1)
+        self.assertTrue(stamps[0].startswith("UPDATE"))
+        self.assertEqual((count, per_model), (2, {"expense.Expense": 2}))
+
+        after: Expense = Expense.all_with_deleted.get(pk=before.pk)
+        self.assertIsNotNone(after.deleted_at)
+        self.assertEqual(after.updated_at, after.deleted_at)
+        self.assertGreater(after.updated_at, before.updated_at)
+        self.assertEqual(Expense.objects.count(), 1)
+
+    def test_delete_skips_rows_already_deleted(self) -> None:
+        stamp = Expense.all_with_deleted.get(pk=self.expenses[0].pk).deleted_at
+
+        count, _ = Expense.all_with_deleted.filter(user=self.user).delete()
+
+        self.assertEqual(count, 3)
+        self.assertEqual(Expense.all_with_deleted.get(pk=self.expenses[0].pk).deleted_at, stamp)
+
+    def test_hard_delete_removes_rows(self) -> None:
+        Expense.all_with_deleted.filter(user=self.user).hard_delete()
+        self.assertFalse(Expense.all_with_deleted.filter(user=self.user).exists())
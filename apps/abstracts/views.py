@@ -1,3 +1,98 @@
-from django.shortcuts import render
+# Python modules
+from typing import Any, Callable, Optional
 
-# Create your views here.
+# Django modules
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+# Django REST Framework
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.serializers import Serializer
+from rest_framework.settings import api_settings
+from rest_framework.status import HTTP_405_METHOD_NOT_ALLOWED
+
+# Project modules
+from apps.auths.authentication import ClaimsJWTAuthentication
+
+
+class AsyncViewSet(View):
+    """
+    Minimal async counterpart of a DRF ViewSet for ASGI deployments.
+
+    DRF views are synchronous, so these views are plain Django async views
+    that keep the DRF contract: handlers receive a DRF Request (query_params,
+    parsed JSON data, request.user) and return a DRF Response, rendered
+    with the first DEFAULT_RENDERER_CLASSES renderer, or a plain
+    HttpResponse. Routes map HTTP methods to handler names like a ViewSet:
+
+        ExpenseAsyncViewSet.as_view(actions={"get": "list_expenses"})
+
+    Every action requires a valid JWT; claims tokens are authenticated
+    without any database access. Like APIView, routes are CSRF exempt
+    since bearer tokens are not sent by browsers on their own, and request
+    bodies go through DEFAULT_PARSER_CLASSES. Unlike a ViewSet, no
+    permission or throttle classes run: handlers must scope every query to
+    request.user themselves, and rate limits belong in front of the app.
+    """
+
+    view_is_async = True  # type: ignore[assignment]
+    actions: dict[str, str] = {}
+    authentication: ClaimsJWTAuthentication = ClaimsJWTAuthentication()
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable[..., Any]:
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        handler_name: Optional[str] = self.actions.get(request.method.lower())
+        if handler_name is None:
+            return self.render(
+                {"detail": f'Method "{request.method}" not allowed.'},
+                HTTP_405_METHOD_NOT_ALLOWED,
+            )
+
+        drf_request: DRFRequest = DRFRequest(
+            request,
+            parsers=[parser_class() for parser_class in api_settings.DEFAULT_PARSER_CLASSES],
+        )
+        try:
+            authenticated: Optional[tuple[Any, Any]] = await self.authentication.aauthenticate(drf_request)
+            if authenticated is None:
+                raise NotAuthenticated()
+            drf_request.user, drf_request.auth = authenticated
+
+            response: HttpResponseBase = await getattr(self, handler_name)(drf_request, *args, **kwargs)
+        except APIException as exc:
+            return self.render({"detail": exc.detail}, exc.status_code)
+
+        if not isinstance(response, DRFResponse):
+            return response
+
+        rendered: HttpResponse = self.render(response.data, response.status_code)
+        for header, value in response.items():
+            if header.lower() != "content-type":
+                rendered[header] = value
+        return rendered
+
+    def render(self, data: Any, status: int) -> HttpResponse:
+        renderer: BaseRenderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        return HttpResponse(
+            renderer.render(data),
+            status=status,
+            content_type=f"{renderer.media_type}; charset={renderer.charset}" if renderer.charset else renderer.media_type,
+        )
+
+    @staticmethod
+    def save_if_valid(serializer: Serializer) -> Optional[Model]:
+        """
+        Validate and save in one call, meant for sync_to_async: validation
+        may query and writes run in transactions, which the async ORM lacks.
+        """
+        if not serializer.is_valid():
+            return None
+        return serializer.save()
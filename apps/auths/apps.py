@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AuthsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.auths'
+
+    def ready(self) -> None:
+        from apps.auths import signals  # noqa: F401
@@ -0,0 +1,115 @@
+"""
+Stateless JWT authentication.
+
+Access tokens issued by ClaimsRefreshToken carry the user's is_active and
+is_staff flags, so ClaimsJWTAuthentication can build request.user from the
+token alone instead of selecting the CustomUser row on every request. The
+resulting user is a CustomUser instance with only id, is_active and is_staff
+loaded; pass it through load_user() when a view needs the profile fields.
+"""
+
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+# Django REST Framework
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+# Project modules
+from apps.auths.models import CustomUser
+
+
+CLAIM_FIELDS: tuple[str, ...] = ("is_active", "is_staff")
+
+# Fields load_user() caches, never the password hash or permissions. Keep
+# them in model field order, as CustomUser.from_db() expects.
+USER_CACHE_FIELDS: tuple[str, ...] = ("id", "email", "username", "first_name", "last_name", "birth_date", *CLAIM_FIELDS)
+
+USER_CACHE_KEY = "auths:user:{user_id}"
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token whose access tokens carry the flags listed in CLAIM_FIELDS."""
+
+    @classmethod
+    def for_user(cls, user: CustomUser) -> "ClaimsRefreshToken":
+        token: ClaimsRefreshToken = super().for_user(user)  # type: ignore
+        for field in CLAIM_FIELDS:
+            token[field] = getattr(user, field)
+        return token
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that trusts the token's claims for request.user.
+
+    Tokens issued before the claims were added fall back to the regular
+    database lookup. A deactivated user keeps access until the access token
+    expires (SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"]).
+    """
+
+    def get_user(self, validated_token: Token) -> CustomUser:  # type: ignore
+        if any(field not in validated_token for field in CLAIM_FIELDS):
+            return super().get_user(validated_token)  # type: ignore
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return CustomUser.from_db(
+            DEFAULT_DB_ALIAS,
+            ["id", *CLAIM_FIELDS],
+            [user_id, *(validated_token[field] for field in CLAIM_FIELDS)],
+        )
+
+    async def aauthenticate(self, request: Any) -> Optional[tuple[CustomUser, Token]]:
+        """
+        Async authenticate(). Claims tokens need no I/O; tokens without
+        claims load the user through the ORM in a worker thread.
+        """
+        header: Optional[bytes] = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token: Optional[bytes] = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token: Token = self.get_validated_token(raw_token)
+        if all(field in validated_token for field in CLAIM_FIELDS):
+            return self.get_user(validated_token), validated_token
+        return await sync_to_async(self.get_user)(validated_token), validated_token
+
+
+def load_user(user: CustomUser) -> CustomUser:
+    """
+    Return a CustomUser with the USER_CACHE_FIELDS loaded for a claims-only
+    user. Only those values are cached, for AUTH_USER_CACHE_TIMEOUT seconds;
+    the remaining fields stay deferred.
+    """
+    if not user.get_deferred_fields():
+        return user
+
+    key: str = USER_CACHE_KEY.format(user_id=user.pk)
+    values: Optional[tuple[Any, ...]] = cache.get(key)
+    if values is None:
+        values = CustomUser.objects.values_list(*USER_CACHE_FIELDS).get(pk=user.pk)
+        cache.set(key, values, timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+    return CustomUser.from_db(DEFAULT_DB_ALIAS, list(USER_CACHE_FIELDS), list(values))
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop the cached user fields, e.g. after a profile change."""
+    cache.delete(USER_CACHE_KEY.format(user_id=user_id))
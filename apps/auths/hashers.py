@@ -0,0 +1,56 @@
+"""
+Password hashers whose cost parameters come from settings.
+
+Each keeps the algorithm name of its Django parent, so existing hashes stay
+verifiable. must_update() compares the stored parameters with the current
+settings, so a successful login rehashes the password whenever the
+configured cost changes, upwards or downwards.
+"""
+
+# Django modules
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 using PASSWORD_PBKDF2_ITERATIONS."""
+
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt using PASSWORD_SCRYPT_WORK_FACTOR (N), block size and parallelism."""
+
+    @property
+    def work_factor(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id using PASSWORD_ARGON2_* costs. Requires the argon2-cffi package."""
+
+    @property
+    def time_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_PARALLELISM
@@ -5,8 +5,12 @@ from typing import Any, Optional
 from rest_framework.serializers import Serializer, CharField, EmailField, IntegerField, ListField
 from rest_framework.exceptions import ValidationError
 
+# Django modules
+from django.contrib.auth.hashers import make_password
+
 # Project modules
 from apps.auths.models import CustomUser
+from apps.auths.throttling import is_unknown_email, remember_unknown_email
 
 
 class UserLoginResponseSerializer(Serializer):
@@ -100,15 +104,22 @@ class UserLoginSerializer(Serializer):
         email: str = attrs["email"]
         password: str = attrs["password"]
 
-        user: Optional[CustomUser] = CustomUser.objects.filter(email=email).first()
+        user: Optional[CustomUser] = None
+        if not is_unknown_email(email):
+            user = CustomUser.objects.filter(email=email).first()
 
         if not user:
+            remember_unknown_email(email)
+            # Hash anyway so unknown emails cost as much as a wrong password.
+            make_password(password)
             raise ValidationError(
                 detail={
                     "email": [f"User with email '{email}' does not exist."]
                 }
             )
 
+        # check_password also rehashes and saves the password when the
+        # preferred hasher or its cost settings changed (apps.auths.hashers).
         if not user.check_password(raw_password=password):
             raise ValidationError(
                 detail={
@@ -0,0 +1,24 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Project modules
+from apps.auths.authentication import invalidate_user
+from apps.auths.models import CustomUser
+from apps.auths.throttling import forget_unknown_email
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid="auths_user_cache_post_save")
+@receiver(post_delete, sender=CustomUser, dispatch_uid="auths_user_cache_post_delete")
+def invalidate_user_cache(sender: type[CustomUser], instance: CustomUser, **kwargs: Any) -> None:
+    """Drop the cached full user whenever the row changes."""
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid="auths_unknown_email_post_save")
+def forget_registered_email(sender: type[CustomUser], instance: CustomUser, **kwargs: Any) -> None:
+    """Let a freshly registered (or renamed) email log in immediately."""
+    forget_unknown_email(instance.email)
@@ -1,3 +1,220 @@
-from django.test import TestCase
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+# Django REST Framework
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.testing import QueryBudgetMixin
+from apps.auths.authentication import USER_CACHE_KEY, ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from settings.conf import password_hashers
+
+
+class ClaimsJWTAuthenticationTestCase(TestCase):
+    """Checks that token claims replace the per-request user query."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="claims@example.com",
+            username="claims",
+            password="StrongPass123!",
+        )
+        self.client: APIClient = APIClient()
+
+    def authenticate(self, user: CustomUser, **claims: bool) -> None:
+        refresh: ClaimsRefreshToken = ClaimsRefreshToken.for_user(user)
+        for claim, value in claims.items():
+            refresh[claim] = value
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+
+    def test_authenticated_request_skips_user_query(self) -> None:
+        self.authenticate(self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/expense-tracker/v1/expenses/monthly")
+        self.assertEqual(response.status_code, 200)
+
+    def test_full_user_is_loaded_once_and_cached(self) -> None:
+        self.authenticate(self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/auths/v1/users/me")
+        self.assertEqual(response.json()["email"], "claims@example.com")
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/auths/v1/users/me")
+
+    def test_cached_user_has_no_password_hash(self) -> None:
+        self.authenticate(self.user)
+        self.client.get("/api/auths/v1/users/me")
+
+        cached = cache.get(USER_CACHE_KEY.format(user_id=self.user.pk))
+        self.assertIsNotNone(cached)
+        self.assertNotIn(self.user.password, cached)
+
+    def test_inactive_claim_is_rejected(self) -> None:
+        self.authenticate(self.user, is_active=False)
+
+        response = self.client.get("/api/auths/v1/users/me")
+        self.assertEqual(response.status_code, 401)
+
+
+class PasswordRehashTestCase(TestCase):
+    """Checks that logins move stored hashes to the configured profile and cost."""
+
+    url: str = "/api/auths/v1/users/login"
+
+    @override_settings(PASSWORD_PBKDF2_ITERATIONS=2_000)
+    def setUp(self) -> None:
+        cache.clear()
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="rehash@example.com",
+            username="rehash",
+            password="StrongPass123!",
+        )
+        self.credentials: dict[str, str] = {"email": "rehash@example.com", "password": "StrongPass123!"}
+
+    def stored_hash(self) -> str:
+        return CustomUser.objects.values_list("password", flat=True).get(pk=self.user.pk)
+
+    @override_settings(PASSWORD_PBKDF2_ITERATIONS=1_000)
+    def test_cost_change_rehashes_on_login(self) -> None:
+        self.assertTrue(self.stored_hash().startswith("pbkdf2_sha256$2000$"))
+
+        response = self.client.post(self.url, self.credentials, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.stored_hash().startswith("pbkdf2_sha256$1000$"))
+
+    @override_settings(PASSWORD_HASHERS=password_hashers("scrypt"), PASSWORD_SCRYPT_WORK_FACTOR=2**10)
+    def test_profile_change_rehashes_on_login(self) -> None:
+        response = self.client.post(self.url, self.credentials, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.stored_hash().startswith("scrypt$"))
+
+
+class LoginThrottleTestCase(TestCase):
+    """Checks that abusive logins are rejected before any lookup or hashing."""
+
+    url: str = "/api/auths/v1/users/login"
+
+    def setUp(self) -> None:
+        cache.clear()
+        CustomUser.objects.create_user(
+            email="throttle@example.com",
+            username="throttle",
+            password="StrongPass123!",
+        )
+
+    def login(self, email: str, ip: str = "10.0.0.1", **headers: str):
+        return self.client.post(
+            self.url,
+            {"email": email, "password": "WrongPass123!"},
+            content_type="application/json",
+            REMOTE_ADDR=ip,
+            **headers,
+        )
+
+    def test_email_throttle_spans_ips(self) -> None:
+        for attempt in range(10):
+            self.assertEqual(self.login("throttle@example.com", ip=f"10.0.1.{attempt}").status_code, 400)
+
+        with self.assertNumQueries(0):
+            response = self.login("throttle@example.com", ip="10.0.2.1")
+        self.assertEqual(response.status_code, 429)
+
+    def test_ip_throttle_spans_emails(self) -> None:
+        for attempt in range(30):
+            self.assertEqual(self.login(f"nobody{attempt}@example.com").status_code, 400)
+
+        self.assertEqual(self.login("throttle@example.com").status_code, 429)
+        self.assertEqual(self.login("throttle@example.com", ip="10.0.0.2").status_code, 400)
+
+    def test_spoofed_forwarded_for_keeps_ip_bucket(self) -> None:
+        for attempt in range(30):
+            response = self.login(f"nobody{attempt}@example.com", HTTP_X_FORWARDED_FOR=f"192.0.2.{attempt}")
+            self.assertEqual(response.status_code, 400)
+
+        response = self.login("throttle@example.com", HTTP_X_FORWARDED_FOR="198.51.100.1")
+        self.assertEqual(response.status_code, 429)
+
+    def test_trusted_proxy_forwarded_for(self) -> None:
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}):
+            for attempt in range(30):
+                response = self.login(
+                    f"nobody{attempt}@example.com",
+                    ip="10.0.0.254",
+                    HTTP_X_FORWARDED_FOR=f"192.0.2.{attempt}, 203.0.113.7",
+                )
+                self.assertEqual(response.status_code, 400)
+
+            # Same proxy, another client: only that client's bucket counts.
+            response = self.login("throttle@example.com", ip="10.0.0.254", HTTP_X_FORWARDED_FOR="203.0.113.8")
+            self.assertEqual(response.status_code, 400)
+            response = self.login("throttle@example.com", ip="10.0.0.254", HTTP_X_FORWARDED_FOR="203.0.113.7")
+            self.assertEqual(response.status_code, 429)
+
+    def test_unknown_email_is_cached_until_registration(self) -> None:
+        self.login("later@example.com")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.login("later@example.com").status_code, 400)
+
+        CustomUser.objects.create_user(email="later@example.com", username="later", password="WrongPass123!")
+        self.assertEqual(self.login("later@example.com").status_code, 200)
+
+
+class CustomUserQueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """Upper bounds on SQL queries per CustomUserViewSet action, independent of data size."""
+
+    url: str = "/api/auths/v1/users"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="user-budget@example.com",
+            username="user-budget",
+            password="StrongPass123!",
+        )
+        self.users: int = 0
+        self.grow(10)
+        self.client: APIClient = APIClient()
+
+    def grow(self, count: int) -> None:
+        CustomUser.objects.bulk_create(
+            CustomUser(email=f"member{self.users + index}@example.com", username=f"member{self.users + index}")
+            for index in range(count)
+        )
+        self.users += count
+
+    def test_login(self) -> None:
+        self.assertQueryBudget(
+            1,
+            lambda: self.client.post(
+                f"{self.url}/login",
+                {"email": "user-budget@example.com", "password": "StrongPass123!"},
+                format="json",
+            ),
+        )
+
+    def test_register(self) -> None:
+        names = iter(range(1000))
+
+        def register():
+            name: str = f"newcomer{next(names)}"
+            return self.client.post(
+                f"{self.url}/register",
+                {"email": f"{name}@example.com", "username": name, "password": "StrongPass123!"},
+                format="json",
+            )
+
+        self.assertQueryBudget(1, register)
+
+    def test_fetch_personal_info(self) -> None:
+        token: str = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/me"))
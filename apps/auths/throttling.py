@@ -0,0 +1,69 @@
+"""
+Login abuse protection.
+
+The throttles run in DRF's initial() before the serializer, so rejected
+attempts never reach the database or the password hasher. Counters live in
+the default Django cache; use a shared backend when running several workers.
+"""
+
+# Python modules
+import hashlib
+from typing import Any, Optional
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+
+# Django REST Framework
+from rest_framework.request import Request as DRFRequest
+from rest_framework.throttling import SimpleRateThrottle
+
+
+UNKNOWN_EMAIL_KEY = "auths:unknown-email:{digest}"
+
+
+def email_digest(email: str) -> str:
+    """Stable, cache-key safe digest of a normalized email."""
+    return hashlib.sha256(email.strip().lower().encode()).hexdigest()
+
+
+class LoginIPThrottle(SimpleRateThrottle):
+    """
+    Limits login attempts per client IP (rate: DEFAULT_THROTTLE_RATES["login_ip"]).
+    The IP is REMOTE_ADDR, or the X-Forwarded-For entry of the outermost of
+    REST_FRAMEWORK["NUM_PROXIES"] trusted proxies.
+    """
+
+    scope = "login_ip"
+
+    def get_cache_key(self, request: DRFRequest, view: Any) -> str:
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginEmailThrottle(SimpleRateThrottle):
+    """Limits login attempts per target email (rate: DEFAULT_THROTTLE_RATES["login_email"])."""
+
+    scope = "login_email"
+
+    def get_cache_key(self, request: DRFRequest, view: Any) -> Optional[str]:
+        email: Any = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email:
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": email_digest(email)}
+
+
+def is_unknown_email(email: str) -> bool:
+    """Whether a recent login already found no user with this email."""
+    return cache.get(UNKNOWN_EMAIL_KEY.format(digest=email_digest(email)), False)
+
+
+def remember_unknown_email(email: str) -> None:
+    cache.set(
+        UNKNOWN_EMAIL_KEY.format(digest=email_digest(email)),
+        True,
+        timeout=settings.LOGIN_UNKNOWN_EMAIL_CACHE_TIMEOUT,
+    )
+
+
+def forget_unknown_email(email: str) -> None:
+    cache.delete(UNKNOWN_EMAIL_KEY.format(digest=email_digest(email)))
@@ -1,18 +1,19 @@
 # Python modules
 from typing import Any
-from rest_framework_simplejwt.tokens import RefreshToken
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 # Django REST Framework
 from rest_framework.viewsets import ViewSet
 from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
-from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_405_METHOD_NOT_ALLOWED, HTTP_201_CREATED
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_405_METHOD_NOT_ALLOWED, HTTP_201_CREATED, HTTP_429_TOO_MANY_REQUESTS
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.decorators import action
 
 # Project modules
+from apps.auths.authentication import ClaimsRefreshToken, load_user
 from apps.auths.models import CustomUser
+from apps.auths.throttling import LoginEmailThrottle, LoginIPThrottle
 from apps.auths.serializers import UserLoginSerializer, UserLoginResponseSerializer, UserLoginErrorsSerializer, HTTP405MethodNotAllowedSerializer, UserRegisterSerializer
 
 
@@ -39,7 +40,11 @@ class CustomUserViewSet(ViewSet):
             HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
                 description="Method not allowed. You used wrong HTTP request type. Only POST can be used to reach this endpoint.",
                 response=HTTP405MethodNotAllowedSerializer,
-            )
+            ),
+            HTTP_429_TOO_MANY_REQUESTS: OpenApiResponse(
+                description="Too many login attempts from this IP or for this email. Retry after the Retry-After header.",
+                response=HTTP405MethodNotAllowedSerializer,
+            ),
         }
     )
     @action(
@@ -47,7 +52,8 @@ class CustomUserViewSet(ViewSet):
         detail=False,
         url_path="login",
         url_name="login",
-        permission_classes=(AllowAny,)
+        permission_classes=(AllowAny,),
+        throttle_classes=(LoginIPThrottle, LoginEmailThrottle),
     )
     def login(
         self,
@@ -77,7 +83,7 @@ class CustomUserViewSet(ViewSet):
         user: CustomUser = serializer.validated_data.pop("user")
 
         # Generate JWT tokens
-        refresh_token: RefreshToken = RefreshToken.for_user(user)
+        refresh_token: ClaimsRefreshToken = ClaimsRefreshToken.for_user(user)
         access_token: str = str(refresh_token.access_token)
 
         return DRFResponse(
@@ -127,7 +133,7 @@ class CustomUserViewSet(ViewSet):
 
         user: CustomUser = serializer.save()
 
-        refresh_token: RefreshToken = RefreshToken.for_user(user)
+        refresh_token: ClaimsRefreshToken = ClaimsRefreshToken.for_user(user)
         access_token: str = str(refresh_token.access_token)
         
         return DRFResponse(
@@ -167,7 +173,7 @@ class CustomUserViewSet(ViewSet):
         Fetch personal account information of the authenticated user.
         """
 
-        user: CustomUser = request.user 
+        user: CustomUser = load_user(request.user)
 
         return DRFResponse(
             data={
@@ -0,0 +1,236 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.core.asgi import get_asgi_application
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandParser
+from django.core.wsgi import get_wsgi_application
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+from apps.auths.authentication import ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from apps.benchmarks.utils import percentiles_ms, wsgi_request
+from apps.category.models import Category
+from apps.expense.models import Expense
+
+
+BENCHMARK_EMAIL = "asgi-benchmark@example.com"
+
+# (label, sync path, async path, query string)
+ENDPOINTS: tuple[tuple[str, str, str, dict[str, Any]], ...] = (
+    (
+        "expenses/list",
+        "/api/expense-tracker/v1/expenses/list",
+        "/api/expense-tracker/v1/async/expenses/list",
+        {"page_size": 50},
+    ),
+    (
+        "categories/list",
+        "/api/expense-tracker/v1/categories/list",
+        "/api/expense-tracker/v1/async/categories/list",
+        {},
+    ),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare latency and throughput of the sync endpoints behind the WSGI "
+        "handler with their async variants behind the ASGI handler"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Requests per endpoint and handler.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests in flight at once on the ASGI event loop.",
+        )
+        parser.add_argument(
+            "--wsgi-workers",
+            type=int,
+            default=4,
+            help="Threads serving WSGI requests, like sync server workers.",
+        )
+        parser.add_argument(
+            "--db-latency-ms",
+            type=float,
+            default=0.0,
+            help="Delay added to every SQL query to simulate a remote database.",
+        )
+        parser.add_argument(
+            "--expenses",
+            type=int,
+            default=200,
+            help="Expenses owned by the benchmark user.",
+        )
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header sent with every request; must pass ALLOWED_HOSTS.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.cleanup(CustomUser.objects.filter(email=BENCHMARK_EMAIL))
+        user: CustomUser = CustomUser.objects.create_user(
+            email=BENCHMARK_EMAIL,
+            username="asgi-benchmark",
+            password="Benchmark123!",
+        )
+        category: Category = Category.objects.create(user=user, name="ASGI benchmark")
+        Expense.objects.bulk_create(
+            Expense(user=user, category=category, amount=Decimal("9.99"), date=date.today())
+            for _ in range(options["expenses"])
+        )
+
+        self.host: str = options["host"]
+        self.authorization: str = f"Bearer {ClaimsRefreshToken.for_user(user).access_token}"
+        self.db_latency: float = options["db_latency_ms"] / 1000
+
+        connection_created.connect(self.add_latency)
+        if connection.connection is not None:
+            self.add_latency(connection=connection)
+
+        try:
+            for label, sync_path, async_path, params in ENDPOINTS:
+                query: str = urlencode(params)
+
+                latencies, seconds = self.run_wsgi(
+                    get_wsgi_application(), sync_path, query, options["requests"], options["wsgi_workers"]
+                )
+                self.report(label, f"wsgi workers={options['wsgi_workers']}", latencies, seconds)
+
+                latencies, seconds = asyncio.run(
+                    self.run_asgi(get_asgi_application(), async_path, query, options["requests"], options["concurrency"])
+                )
+                self.report(label, f"asgi concurrency={options['concurrency']}", latencies, seconds)
+        finally:
+            connection_created.disconnect(self.add_latency)
+            self.cleanup(CustomUser.objects.filter(pk=user.pk))
+
+        self.stdout.write(self.style.SUCCESS("✅ ASGI benchmark finished."))
+
+    def cleanup(self, users: Any) -> None:
+        """Delete benchmark users; expenses go first because they protect categories."""
+        Expense.all_with_deleted.filter(user__in=users).hard_delete()
+        users.delete()
+
+    def add_latency(self, connection: Any, **kwargs: Any) -> None:
+        """Delay every query on this connection by --db-latency-ms."""
+        if self.db_latency and self.delay not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self.delay)
+
+    def delay(self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+        time.sleep(self.db_latency)
+        return execute(sql, params, many, context)
+
+    def run_wsgi(
+        self,
+        application: WSGIHandler,
+        path: str,
+        query: str,
+        count: int,
+        workers: int,
+    ) -> tuple[list[float], float]:
+        """Serve count requests through the WSGI handler from a thread pool."""
+
+        def request() -> float:
+            started: float = time.perf_counter()
+            status, _ = wsgi_request(
+                application,
+                "GET",
+                path,
+                host=self.host,
+                query=query,
+                headers={"Authorization": self.authorization},
+            )
+            assert status == 200, status
+            return time.perf_counter() - started
+
+        request()  # warm caches
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started: float = time.perf_counter()
+            latencies: list[float] = list(executor.map(lambda _: request(), range(count)))
+            elapsed: float = time.perf_counter() - started
+
+        return latencies, elapsed
+
+    async def run_asgi(
+        self,
+        application: ASGIHandler,
+        path: str,
+        query: str,
+        count: int,
+        concurrency: int,
+    ) -> tuple[list[float], float]:
+        """Serve count requests through the ASGI handler on one event loop."""
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+        async def request() -> float:
+            async with semaphore:
+                started: float = time.perf_counter()
+                messages: list[dict[str, Any]] = [{"type": "http.request", "body": b"", "more_body": False}]
+                disconnected: asyncio.Future = asyncio.get_running_loop().create_future()
+                statuses: list[int] = []
+
+                async def receive() -> dict[str, Any]:
+                    if messages:
+                        return messages.pop()
+                    return await disconnected
+
+                async def send(message: dict[str, Any]) -> None:
+                    if message["type"] == "http.response.start":
+                        statuses.append(message["status"])
+
+                await application(
+                    {
+                        "type": "http",
+                        "asgi": {"version": "3.0"},
+                        "http_version": "1.1",
+                        "method": "GET",
+                        "scheme": "http",
+                        "path": path,
+                        "raw_path": path.encode(),
+                        "query_string": query.encode(),
+                        "root_path": "",
+                        "headers": [
+                            (b"host", self.host.encode()),
+                            (b"authorization", self.authorization.encode()),
+                        ],
+                        "client": ("127.0.0.1", 0),
+                        "server": (self.host, 80),
+                    },
+                    receive,
+                    send,
+                )
+                assert statuses[0] == 200, statuses[0]
+                return time.perf_counter() - started
+
+        await request()  # warm caches
+
+        started: float = time.perf_counter()
+        latencies: list[float] = await asyncio.gather(*(request() for _ in range(count)))
+        elapsed: float = time.perf_counter() - started
+
+        return latencies, elapsed
+
+    def report(self, label: str, mode: str, latencies: list[float], seconds: float) -> None:
+        cuts: dict[str, float] = percentiles_ms(latencies)
+        self.stdout.write(
+            f"{label:<16} {mode:<22} requests/s={len(latencies) / seconds:8.0f} "
+            f"p50_ms={cuts['p50_ms']:7.1f} p95_ms={cuts['p95_ms']:7.1f} p99_ms={cuts['p99_ms']:7.1f}"
+        )
@@ -0,0 +1,104 @@
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from apps.auths.authentication import ClaimsJWTAuthentication, ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from apps.auths.views import CustomUserViewSet
+from apps.category.models import Category
+from apps.category.views import CategoryViewSet
+from apps.expense.models import Expense
+from apps.expense.views import ExpenseViewSet
+
+
+BENCHMARK_EMAIL = "auth-benchmark@example.com"
+
+ENDPOINTS: tuple[tuple[str, type, str], ...] = (
+    ("categories/list", CategoryViewSet, "list_categories"),
+    ("expenses/list", ExpenseViewSet, "list_expenses"),
+    ("expenses/monthly", ExpenseViewSet, "monthly_totals"),
+    ("users/me", CustomUserViewSet, "fetch_personal_info"),
+)
+
+AUTHENTICATION_CLASSES: tuple[type, ...] = (JWTAuthentication, ClaimsJWTAuthentication)
+
+
+class Command(BaseCommand):
+    help = "Compare queries and throughput per request for the JWT authentication classes"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Requests per endpoint and authentication class.",
+        )
+        parser.add_argument(
+            "--expenses",
+            type=int,
+            default=20,
+            help="Expenses owned by the benchmark user.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.cleanup(CustomUser.objects.filter(email=BENCHMARK_EMAIL))
+        user: CustomUser = CustomUser.objects.create_user(
+            email=BENCHMARK_EMAIL,
+            username="auth-benchmark",
+            password="Benchmark123!",
+        )
+        category: Category = Category.objects.create(user=user, name="Auth benchmark")
+        Expense.objects.bulk_create(
+            Expense(user=user, category=category, amount=Decimal("9.99"), date=date.today())
+            for _ in range(options["expenses"])
+        )
+
+        header: str = f"Bearer {ClaimsRefreshToken.for_user(user).access_token}"
+        factory = APIRequestFactory()
+
+        try:
+            for label, viewset, action_name in ENDPOINTS:
+                for authentication_class in AUTHENTICATION_CLASSES:
+                    view: Callable = viewset.as_view(
+                        {"get": action_name},
+                        authentication_classes=[authentication_class],
+                    )
+                    queries, seconds = self.measure(
+                        view,
+                        lambda: factory.get("/", HTTP_AUTHORIZATION=header),
+                        options["requests"],
+                    )
+                    self.stdout.write(
+                        f"{label:<18} {authentication_class.__name__:<24} "
+                        f"queries/request={queries:5.2f} "
+                        f"requests/s={options['requests'] / seconds:8.0f}"
+                    )
+        finally:
+            self.cleanup(CustomUser.objects.filter(pk=user.pk))
+
+        self.stdout.write(self.style.SUCCESS("✅ Authentication benchmark finished."))
+
+    def cleanup(self, users: Any) -> None:
+        """Delete benchmark users; expenses go first because they protect categories."""
+        Expense.all_with_deleted.filter(user__in=users).hard_delete()
+        users.delete()
+
+    def measure(self, view: Callable, build_request: Callable, count: int) -> tuple[float, float]:
+        """Return average queries per request and total seconds for count requests."""
+        view(build_request())  # warm caches
+
+        with CaptureQueriesContext(connection) as queries:
+            started: float = time.perf_counter()
+            for _ in range(count):
+                response = view(build_request())
+                assert response.status_code == 200, response.status_code
+            elapsed: float = time.perf_counter() - started
+
+        return len(queries) / count, elapsed
@@ -0,0 +1,104 @@
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.auths.models import CustomUser
+from apps.benchmarks.utils import current_rss_kb, peak_rss_kb
+from apps.expense.models import Expense
+from apps.expense.views import ExpenseViewSet
+
+
+BENCHMARK_EMAIL = "export-benchmark@example.com"
+
+
+class Command(BaseCommand):
+    help = "Measure throughput and memory of the streaming expense export"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[10_000, 100_000, 1_000_000],
+            help="Row counts to export, measured in ascending order.",
+        )
+        parser.add_argument(
+            "--export-format",
+            choices=("csv", "ndjson"),
+            default="csv",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Rows inserted per bulk_create call while seeding.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the benchmark user and expenses afterwards.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        CustomUser.objects.filter(email=BENCHMARK_EMAIL).delete()
+        user: CustomUser = CustomUser.objects.create_user(
+            email=BENCHMARK_EMAIL,
+            username="export-benchmark",
+            password="Benchmark123!",
+        )
+
+        export = ExpenseViewSet.as_view({"get": "export_expenses"})
+        factory = APIRequestFactory()
+        seeded: int = 0
+
+        try:
+            for rows in sorted(options["rows"]):
+                self.seed(user, seeded, rows, options["batch_size"])
+                seeded = max(seeded, rows)
+
+                request = factory.get("/", {"export_format": options["export_format"]})
+                force_authenticate(request, user=user)
+
+                rss_before: int | None = current_rss_kb()
+                rss_max: int = rss_before or 0
+                started: float = time.perf_counter()
+
+                response = export(request)
+                size: int = 0
+                for chunk in response.streaming_content:
+                    size += len(chunk)
+                    rss_now: int | None = current_rss_kb()
+                    if rss_now is not None:
+                        rss_max = max(rss_max, rss_now)
+
+                elapsed: float = time.perf_counter() - started
+
+                self.stdout.write(
+                    f"rows={rows:>9} bytes={size:>11} seconds={elapsed:8.2f} "
+                    f"rows/s={rows / elapsed:>10.0f} rss_start_kb={rss_before} "
+                    f"rss_max_kb={rss_max} peak_rss_kb={peak_rss_kb()}"
+                )
+        finally:
+            if not options["keep"]:
+                CustomUser.objects.filter(pk=user.pk).delete()
+
+        self.stdout.write(self.style.SUCCESS("✅ Export benchmark finished."))
+
+    def seed(self, user: CustomUser, existing: int, target: int, batch_size: int) -> None:
+        """Top up the benchmark user's expenses to the target row count."""
+        start: date = date.today()
+        for offset in range(existing, target, batch_size):
+            Expense.objects.bulk_create(
+                Expense(
+                    user=user,
+                    amount=Decimal(random.randint(100, 50_000)) / 100,
+                    description=f"Benchmark expense {i}",
+                    date=start - timedelta(days=i % 3650),
+                )
+                for i in range(offset, min(offset + batch_size, target))
+            )
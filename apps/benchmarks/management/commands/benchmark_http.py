@@ -0,0 +1,387 @@
+import http.client
+import io
+import json
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode, urlsplit
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.core.wsgi import get_wsgi_application
+from django.db.models import QuerySet
+
+from apps.auths.authentication import ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from apps.benchmarks.utils import percentiles_ms, wsgi_request
+from apps.budget.models import Budget
+from apps.category.models import Category
+from apps.expense.models import Expense
+
+
+PASSWORD = "Benchmark123!"
+DEFAULT_MIX = "login=1,list=6,create=1,update=1,delete=1"
+OPERATIONS: tuple[str, ...] = ("login", "list", "create", "update", "delete")
+
+
+class Transport:
+    """Sends requests either in-process (WSGI handler) or to a running server."""
+
+    def __init__(self, url: Optional[str], host: str) -> None:
+        self.host: str = host
+        self.base = urlsplit(url) if url else None
+        self.local: threading.local = threading.local()
+        self.application: Optional[Callable] = None if url else get_wsgi_application()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: str = "",
+        payload: Any = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> tuple[int, bytes]:
+        body: bytes = json.dumps(payload).encode() if payload is not None else b""
+        if self.application is not None:
+            return wsgi_request(self.application, method, path, host=self.host, query=query, body=body, headers=headers)
+
+        connection: Optional[http.client.HTTPConnection] = getattr(self.local, "connection", None)
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if self.base.scheme == "https" else http.client.HTTPConnection
+            connection = self.local.connection = connection_class(self.base.netloc, timeout=30)
+
+        try:
+            connection.request(
+                method,
+                f"{self.base.path.rstrip('/')}{path}{'?' + query if query else ''}",
+                body=body,
+                headers={"Content-Type": "application/json", **(headers or {})},
+            )
+            response: http.client.HTTPResponse = connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            self.local.connection = None
+            raise
+
+
+class VirtualUser:
+    """One benchmark client acting as a seeded user with its own RNG."""
+
+    def __init__(self, user: CustomUser, expense_ids: list[int], category_ids: list[int], rng: random.Random) -> None:
+        self.user: CustomUser = user
+        self.expense_ids: list[int] = expense_ids
+        self.category_ids: list[int] = category_ids
+        self.rng: random.Random = rng
+        self.headers: dict[str, str] = {
+            "Authorization": f"Bearer {ClaimsRefreshToken.for_user(user).access_token}",
+        }
+        self.lock: threading.Lock = threading.Lock()
+
+    def expense_payload(self) -> dict[str, Any]:
+        return {
+            "amount": f"{self.rng.uniform(1, 200):.2f}",
+            "date": date.today().isoformat(),
+            "description": "Load benchmark expense",
+            "category_id": self.rng.choice(self.category_ids),
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive a weighted mix of login/list/create/update/delete traffic at the "
+        "API and write latency percentiles and throughput to a JSON report"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--url",
+            default=None,
+            help="Base URL of a running server sharing this database, e.g. "
+            "http://127.0.0.1:8000. Without it requests go through the WSGI handler in-process.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Measured requests, after warm-up.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=100,
+            help="Requests sent before measuring.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Requests in flight at once.",
+        )
+        parser.add_argument(
+            "--mix",
+            default=DEFAULT_MIX,
+            help=f"Relative weights per operation ({', '.join(OPERATIONS)}). Logins are "
+            "throttled per IP and email; raise LOGIN_THROTTLE_IP_RATE and "
+            "LOGIN_THROTTLE_EMAIL_RATE to measure login throughput itself.",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=20,
+            help="Users seeded with generate_test_data.",
+        )
+        parser.add_argument(
+            "--expenses-per-user",
+            type=int,
+            default=200,
+            help="Average expenses per seeded user.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=1,
+            help="Seed for the data set and the traffic sequence.",
+        )
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header for in-process requests; must pass ALLOWED_HOSTS.",
+        )
+        parser.add_argument(
+            "--output",
+            default="benchmark-http.json",
+            help="Path of the JSON report.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded users and their data afterwards.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        mix: dict[str, float] = self.parse_mix(options["mix"])
+        email_suffix: str = f".{options['seed']:x}@example.com"
+
+        self.cleanup(CustomUser.objects.filter(email__endswith=email_suffix))
+        call_command(
+            "generate_test_data",
+            users=options["users"],
+            expenses_per_user=options["expenses_per_user"],
+            seed=options["seed"],
+            password=PASSWORD,
+            append=True,
+            stdout=io.StringIO(),
+        )
+        users: QuerySet = CustomUser.objects.filter(email__endswith=email_suffix)
+
+        try:
+            clients: list[VirtualUser] = self.virtual_users(users, options["seed"])
+            transport: Transport = Transport(options["url"], options["host"])
+            operations: dict[str, Callable[[Transport, VirtualUser], int]] = {
+                "login": self.login,
+                "list": self.list_expenses,
+                "create": self.create_expense,
+                "update": self.update_expense,
+                "delete": self.delete_expense,
+            }
+
+            # Every request slot gets its operation and client up front so the
+            # traffic sequence only depends on --seed.
+            rng: random.Random = random.Random(f"{options['seed']}-traffic")
+            names: list[str] = list(mix)
+            plan: list[tuple[str, VirtualUser]] = [
+                (name, rng.choice(clients))
+                for name in rng.choices(names, weights=[mix[name] for name in names], k=options["warmup"] + options["requests"])
+            ]
+
+            def send(step: tuple[str, VirtualUser]) -> tuple[str, int, float]:
+                name, client = step
+                started: float = time.perf_counter()
+                try:
+                    status: int = operations[name](transport, client)
+                except (OSError, http.client.HTTPException):
+                    status = 0
+                return name, status, time.perf_counter() - started
+
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+                list(executor.map(send, plan[:options["warmup"]]))
+
+                started: float = time.perf_counter()
+                results: list[tuple[str, int, float]] = list(executor.map(send, plan[options["warmup"]:]))
+                elapsed: float = time.perf_counter() - started
+        finally:
+            if not options["keep"]:
+                self.cleanup(users)
+
+        report: dict[str, Any] = self.build_report(results, elapsed, options, mix)
+        with open(options["output"], "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+            output.write("\n")
+
+        for name, stats in report["operations"].items():
+            self.stdout.write(
+                f"{name:<7} requests={stats['requests']:>6} requests/s={stats['requests_per_second']:8.1f} "
+                f"p50_ms={stats['p50_ms']:7.1f} p95_ms={stats['p95_ms']:7.1f} p99_ms={stats['p99_ms']:7.1f} "
+                f"statuses={stats['statuses']}"
+            )
+        total: dict[str, Any] = report["total"]
+        self.stdout.write(
+            f"{'total':<7} requests={total['requests']:>6} requests/s={total['requests_per_second']:8.1f} "
+            f"p50_ms={total['p50_ms']:7.1f} p95_ms={total['p95_ms']:7.1f} p99_ms={total['p99_ms']:7.1f} "
+            f"errors={total['errors']}"
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ HTTP benchmark report written to {options['output']}."))
+
+    def parse_mix(self, value: str) -> dict[str, float]:
+        mix: dict[str, float] = {}
+        try:
+            for item in value.split(","):
+                name, weight = item.split("=")
+                mix[name.strip()] = float(weight)
+        except ValueError:
+            raise CommandError(f"--mix must look like {DEFAULT_MIX}")
+
+        unknown: set[str] = set(mix) - set(OPERATIONS)
+        if unknown:
+            raise CommandError(f"Unknown operations in --mix: {', '.join(sorted(unknown))}")
+        if not any(weight > 0 for weight in mix.values()):
+            raise CommandError("--mix needs at least one positive weight")
+        return {name: weight for name, weight in mix.items() if weight > 0}
+
+    def virtual_users(self, users: QuerySet, seed: int) -> list[VirtualUser]:
+        expense_ids: dict[int, list[int]] = {}
+        for user_id, expense_id in Expense.objects.filter(user__in=users).values_list("user_id", "id"):
+            expense_ids.setdefault(user_id, []).append(expense_id)
+        category_ids: dict[int, list[int]] = {}
+        for user_id, category_id in Category.objects.filter(user__in=users).values_list("user_id", "id"):
+            category_ids.setdefault(user_id, []).append(category_id)
+
+        return [
+            VirtualUser(user, expense_ids.get(user.pk, []), category_ids[user.pk], random.Random(f"{seed}-{user.pk}"))
+            for user in users.order_by("pk")
+        ]
+
+    def cleanup(self, users: QuerySet) -> None:
+        """Delete seeded users; expenses go first because they protect categories."""
+        Expense.all_with_deleted.filter(user__in=users).hard_delete()
+        Category.all_with_deleted.filter(user__in=users).hard_delete()
+        Budget.all_with_deleted.filter(user__in=users).hard_delete()
+        users.delete()
+
+    def login(self, transport: Transport, client: VirtualUser) -> int:
+        status, _ = transport.request(
+            "POST",
+            "/api/auths/v1/users/login",
+            payload={"email": client.user.email, "password": PASSWORD},
+        )
+        return status
+
+    def list_expenses(self, transport: Transport, client: VirtualUser) -> int:
+        status, _ = transport.request(
+            "GET",
+            "/api/expense-tracker/v1/expenses/list",
+            query=urlencode({"page_size": 50}),
+            headers=client.headers,
+        )
+        return status
+
+    def create_expense(self, transport: Transport, client: VirtualUser) -> int:
+        with client.lock:
+            payload: dict[str, Any] = client.expense_payload()
+        status, body = transport.request(
+            "POST",
+            "/api/expense-tracker/v1/expenses/create",
+            payload=payload,
+            headers=client.headers,
+        )
+        if status == 201:
+            with client.lock:
+                client.expense_ids.append(json.loads(body)["id"])
+        return status
+
+    def update_expense(self, transport: Transport, client: VirtualUser) -> int:
+        with client.lock:
+            expense_id: Optional[int] = client.rng.choice(client.expense_ids) if client.expense_ids else None
+            payload: dict[str, Any] = client.expense_payload()
+        if expense_id is None:
+            return self.create_expense(transport, client)
+        status, _ = transport.request(
+            "PUT",
+            f"/api/expense-tracker/v1/expenses/{expense_id}/update",
+            payload=payload,
+            headers=client.headers,
+        )
+        return status
+
+    def delete_expense(self, transport: Transport, client: VirtualUser) -> int:
+        with client.lock:
+            expense_id: Optional[int] = (
+                client.expense_ids.pop(client.rng.randrange(len(client.expense_ids))) if client.expense_ids else None
+            )
+        if expense_id is None:
+            return self.create_expense(transport, client)
+        status, _ = transport.request(
+            "DELETE",
+            f"/api/expense-tracker/v1/expenses/{expense_id}/delete",
+            headers=client.headers,
+        )
+        return status
+
+    def build_report(
+        self,
+        results: list[tuple[str, int, float]],
+        elapsed: float,
+        options: dict[str, Any],
+        mix: dict[str, float],
+    ) -> dict[str, Any]:
+        """Summarise results; errors are transport failures and 5xx responses."""
+
+        def summarise(rows: list[tuple[str, int, float]]) -> dict[str, Any]:
+            statuses: dict[str, int] = {}
+            for _, status, _ in rows:
+                statuses[str(status)] = statuses.get(str(status), 0) + 1
+            return {
+                "requests": len(rows),
+                "requests_per_second": round(len(rows) / elapsed, 2),
+                "errors": sum(1 for _, status, _ in rows if status == 0 or status >= 500),
+                "statuses": statuses,
+                **percentiles_ms([seconds for _, _, seconds in rows]),
+            }
+
+        return {
+            "commit": self.git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "config": {
+                "target": options["url"] or "in-process-wsgi",
+                "requests": options["requests"],
+                "warmup": options["warmup"],
+                "concurrency": options["concurrency"],
+                "mix": mix,
+                "users": options["users"],
+                "expenses_per_user": options["expenses_per_user"],
+                "seed": options["seed"],
+            },
+            "duration_seconds": round(elapsed, 3),
+            "total": summarise(results),
+            "operations": {
+                name: summarise([row for row in results if row[0] == name])
+                for name in mix
+            },
+        }
+
+    def git_commit(self) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,98 @@
+import io
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from apps.abstracts import renderers
+from apps.abstracts.renderers import ORJSONParser, ORJSONRenderer
+from apps.expense.serializers import expense_list_values
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSON renderer and parser with the orjson-backed ones "
+        "on a list_expenses payload, and check their output is identical"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--expenses",
+            type=int,
+            default=50_000,
+            help="Expenses in the payload.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per measurement; the fastest one is reported.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the payload.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if renderers.orjson is None:
+            self.stdout.write(self.style.WARNING("orjson is not installed; the orjson classes use the stdlib."))
+
+        self.repeat: int = max(options["repeat"], 1)
+        data: list[dict[str, Any]] = self.build_payload(options["expenses"], options["seed"])
+        self.stdout.write(f"Default renderer: {api_settings.DEFAULT_RENDERER_CLASSES[0].__name__}")
+
+        baseline_seconds, expected = self.best(lambda: JSONRenderer().render(data))
+        seconds, rendered = self.best(lambda: ORJSONRenderer().render(data))
+        if rendered != expected:
+            raise CommandError("ORJSONRenderer output differs from JSONRenderer.")
+        self.report(("JSONRenderer", "ORJSONRenderer"), len(expected), baseline_seconds, seconds)
+
+        baseline_seconds, parsed = self.best(lambda: self.parse(JSONParser(), expected))
+        seconds, fast_parsed = self.best(lambda: self.parse(ORJSONParser(), expected))
+        if fast_parsed != parsed:
+            raise CommandError("ORJSONParser result differs from JSONParser.")
+        self.report(("JSONParser", "ORJSONParser"), len(expected), baseline_seconds, seconds)
+
+        self.stdout.write(self.style.SUCCESS("✅ JSON benchmark finished."))
+
+    def build_payload(self, count: int, seed: int) -> list[dict[str, Any]]:
+        """Serialized expenses shaped like the list_expenses response."""
+        rng: random.Random = random.Random(seed)
+        today: date = date.today()
+        return expense_list_values.to_representation(
+            (
+                index,
+                Decimal(rng.randrange(1, 10_000_000)) / 100,
+                f"Expense {index} – café",
+                today - timedelta(days=rng.randrange(365)),
+            )
+            for index in range(1, count + 1)
+        )
+
+    def best(self, run: Callable[[], Any]) -> tuple[float, Any]:
+        """Fastest of --repeat runs, with the result of the last one."""
+        seconds: list[float] = []
+        for _ in range(self.repeat):
+            started: float = time.perf_counter()
+            result: Any = run()
+            seconds.append(time.perf_counter() - started)
+        return min(seconds), result
+
+    @staticmethod
+    def parse(parser: BaseParser, body: bytes) -> Any:
+        return parser.parse(io.BytesIO(body), "application/json", {"encoding": "utf-8"})
+
+    def report(self, names: tuple[str, str], size: int, baseline_seconds: float, seconds: float) -> None:
+        for name, elapsed in zip(names, (baseline_seconds, seconds)):
+            self.stdout.write(
+                f"{name:<15} ms={elapsed * 1000:8.1f} MB/s={size / elapsed / 1e6:7.1f} "
+                f"speedup={baseline_seconds / elapsed:5.1f}x"
+            )
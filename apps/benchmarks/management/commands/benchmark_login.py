@@ -0,0 +1,80 @@
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.contrib.auth.hashers import identify_hasher
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import override_settings
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory
+
+from apps.auths.models import CustomUser
+from settings.conf import password_hashers
+
+
+BENCHMARK_EMAIL = "login-benchmark@example.com"
+BENCHMARK_PASSWORD = "Benchmark123!"
+
+
+class Command(BaseCommand):
+    help = "Measure single-process logins per second under each password hasher profile"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--logins",
+            type=int,
+            default=20,
+            help="Timed logins per profile.",
+        )
+        parser.add_argument(
+            "--profile",
+            action="append",
+            dest="profiles",
+            choices=sorted(settings.PASSWORD_HASHER_PROFILES),
+            help="Profile to measure (can be repeated; default: all).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        CustomUser.objects.filter(email=BENCHMARK_EMAIL).delete()
+        user: CustomUser = CustomUser.objects.create_user(
+            email=BENCHMARK_EMAIL,
+            username="login-benchmark",
+            password=BENCHMARK_PASSWORD,
+        )
+
+        login: Callable = resolve("/api/auths/v1/users/login").func
+        factory = APIRequestFactory()
+        payload: dict[str, str] = {"email": BENCHMARK_EMAIL, "password": BENCHMARK_PASSWORD}
+
+        try:
+            for profile in options["profiles"] or settings.PASSWORD_HASHER_PROFILES:
+                with override_settings(PASSWORD_HASHERS=password_hashers(profile)):
+                    hasher_before: str = identify_hasher(self.stored_hash(user)).algorithm
+
+                    # The first login under a new profile rehashes the stored password.
+                    try:
+                        response = login(factory.post("/", payload, format="json"))
+                    except ValueError as exc:
+                        self.stdout.write(self.style.WARNING(f"{profile:<8} unavailable: {exc}"))
+                        continue
+                    assert response.status_code == 200, response.data
+
+                    hasher_after: str = identify_hasher(self.stored_hash(user)).algorithm
+
+                    started: float = time.perf_counter()
+                    for _ in range(options["logins"]):
+                        login(factory.post("/", payload, format="json"))
+                    elapsed: float = time.perf_counter() - started
+
+                self.stdout.write(
+                    f"{profile:<8} stored={hasher_before}->{hasher_after:<14} "
+                    f"ms/login={elapsed * 1000 / options['logins']:7.1f} "
+                    f"logins/s/core={options['logins'] / elapsed:7.1f}"
+                )
+        finally:
+            CustomUser.objects.filter(pk=user.pk).delete()
+
+        self.stdout.write(self.style.SUCCESS("✅ Login benchmark finished."))
+
+    def stored_hash(self, user: CustomUser) -> str:
+        return CustomUser.objects.values_list("password", flat=True).get(pk=user.pk)
@@ -0,0 +1,155 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models.query import QuerySet
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import Serializer
+
+from apps.abstracts.serializers import ValuesSerializer
+from apps.auths.models import CustomUser
+from apps.category.models import Category
+from apps.category.serializers import CategoryListSerializer, category_list_values
+from apps.expense.models import Expense
+from apps.expense.serializers import ExpenseListSerializer, expense_list_values
+
+
+BENCHMARK_EMAIL = "serializer-benchmark@example.com"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure rows/s of the list serializers against their values()-based "
+        "fast path, and check both render byte-identical JSON"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--sizes",
+            default="1000,10000,100000",
+            help="Comma-separated row counts to serialize.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per measurement; the fastest one is reported.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per bulk_create call while seeding.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            sizes: list[int] = sorted({int(size) for size in options["sizes"].split(",")})
+        except ValueError:
+            raise CommandError("--sizes must be comma-separated integers.")
+        if not sizes or sizes[0] < 1:
+            raise CommandError("--sizes must be positive.")
+
+        self.repeat: int = max(options["repeat"], 1)
+
+        self.cleanup(CustomUser.objects.filter(email=BENCHMARK_EMAIL))
+        user: CustomUser = CustomUser.objects.create_user(
+            email=BENCHMARK_EMAIL,
+            username="serializer-benchmark",
+            password="Benchmark123!",
+        )
+
+        try:
+            self.seed(user, sizes[-1], options["batch_size"])
+
+            for size in sizes:
+                self.compare(
+                    "expenses",
+                    Expense.objects.filter(user=user).order_by("-date", "-id")[:size],
+                    ExpenseListSerializer,
+                    expense_list_values,
+                )
+            for size in sizes:
+                self.compare(
+                    "categories",
+                    Category.objects.filter(user=user).order_by("id")[:size],
+                    CategoryListSerializer,
+                    category_list_values,
+                )
+        finally:
+            self.cleanup(CustomUser.objects.filter(pk=user.pk))
+
+        self.stdout.write(self.style.SUCCESS("✅ Serializer benchmark finished."))
+
+    def cleanup(self, users: Any) -> None:
+        """Delete benchmark users; expenses go first because they protect categories."""
+        Expense.all_with_deleted.filter(user__in=users).hard_delete()
+        users.delete()
+
+    def seed(self, user: CustomUser, count: int, batch_size: int) -> None:
+        """Create count categories and count expenses spread over them."""
+        self.stdout.write(f"Seeding {count} categories and expenses...")
+        categories: list[Category] = Category.objects.bulk_create(
+            (Category(user=user, name=f"Serializer benchmark {index}") for index in range(count)),
+            batch_size=batch_size,
+        )
+        today: date = date.today()
+        Expense.objects.bulk_create(
+            (
+                Expense(
+                    user=user,
+                    category=categories[index % len(categories)],
+                    amount=Decimal(index % 100_000) / 100,
+                    date=today - timedelta(days=index % 365),
+                    description=f"Expense {index}",
+                )
+                for index in range(count)
+            ),
+            batch_size=batch_size,
+        )
+
+    def best(self, run: Callable[[], Any]) -> tuple[float, Any]:
+        """Fastest of --repeat runs, with the result of the last one."""
+        seconds: list[float] = []
+        for _ in range(self.repeat):
+            started: float = time.perf_counter()
+            result: Any = run()
+            seconds.append(time.perf_counter() - started)
+        return min(seconds), result
+
+    def compare(
+        self,
+        label: str,
+        queryset: QuerySet,
+        serializer_class: type[Serializer],
+        values_serializer: ValuesSerializer,
+    ) -> None:
+        """Time both serializers with and without the query, then diff their JSON."""
+        instances: list[Any] = list(queryset)
+        rows: list[tuple[Any, ...]] = list(values_serializer.get_rows(queryset))
+        size: int = len(instances)
+
+        measurements: list[tuple[str, float, Any]] = [
+            ("serializer", *self.best(lambda: serializer_class(instances, many=True).data)),
+            ("values", *self.best(lambda: values_serializer.to_representation(rows))),
+            # The same again including the query and model or tuple construction.
+            ("serializer+query", *self.best(lambda: serializer_class(queryset.all(), many=True).data)),
+            ("values+query", *self.best(lambda: values_serializer.serialize(queryset.all()))),
+        ]
+
+        renderer: JSONRenderer = JSONRenderer()
+        expected: bytes = renderer.render(measurements[0][2])
+        for name, _, data in measurements[1:]:
+            if renderer.render(data) != expected:
+                raise CommandError(f"{label}: {name} JSON differs from {serializer_class.__name__}.")
+
+        # values is compared with serializer, values+query with serializer+query.
+        for position, (name, seconds, _) in enumerate(measurements):
+            baseline: float = measurements[position - position % 2][1]
+            self.stdout.write(
+                f"{label:<11} rows={size:<7} {name:<17} rows/s={size / seconds:11.0f} "
+                f"ms={seconds * 1000:9.1f} speedup={baseline / seconds:5.1f}x"
+            )
+        self.stdout.write(f"{label:<11} rows={size:<7} JSON identical ({len(expected)} bytes)")
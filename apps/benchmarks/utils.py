@@ -0,0 +1,75 @@
+# Python modules
+import io
+import os
+import resource
+import statistics
+import sys
+from typing import Any, Callable, Optional
+
+
+def current_rss_kb() -> Optional[int]:
+    """Resident set size of this process in KiB, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages: int = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KiB."""
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def percentiles_ms(latencies: list[float]) -> dict[str, float]:
+    """p50/p95/p99 of latencies given in seconds, in milliseconds."""
+    if len(latencies) < 2:
+        value: float = round(latencies[0] * 1000, 3) if latencies else 0.0
+        return {"p50_ms": value, "p95_ms": value, "p99_ms": value}
+
+    cuts: list[float] = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def wsgi_request(
+    application: Callable,
+    method: str,
+    path: str,
+    *,
+    host: str,
+    query: str = "",
+    body: bytes = b"",
+    headers: Optional[dict[str, str]] = None,
+) -> tuple[int, bytes]:
+    """Send one request through a WSGI application in-process; returns (status, body)."""
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": host,
+        "SERVER_PORT": "80",
+        "HTTP_HOST": host,
+        "REMOTE_ADDR": "127.0.0.1",
+        "CONTENT_LENGTH": str(len(body)),
+        "CONTENT_TYPE": "application/json",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+    }
+    for name, value in (headers or {}).items():
+        environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+
+    statuses: list[str] = []
+    response = application(environ, lambda status, response_headers: statuses.append(status))
+    try:
+        content: bytes = b"".join(response)
+    finally:
+        response.close()
+    return int(statuses[0].split()[0]), content
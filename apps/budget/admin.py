@@ -4,9 +4,11 @@ from django.contrib.admin import register
 from .models import Budget
 from unfold.admin import ModelAdmin
 
+from apps.abstracts.admin import SoftDeleteAdminMixin
+
 
 @register(Budget)
-class BudgetAdmin(ModelAdmin):
+class BudgetAdmin(SoftDeleteAdminMixin, ModelAdmin):
     """
     Admin interface for the Budget model.
     """
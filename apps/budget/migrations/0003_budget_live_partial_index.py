@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget', '0002_rename_users_budget_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', '-month'], name='budget_live_user_month_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 #Python modules
 
 # Django modules
-from django.db.models import CASCADE, DateField, DecimalField, ForeignKey
+from django.db.models import CASCADE, DateField, DecimalField, ForeignKey, Index, Q
 
 # Project modules
 from apps.abstracts.models import AbstractBaseModel
@@ -24,5 +24,16 @@ class Budget(AbstractBaseModel):
     )
     month = DateField()
 
+    class Meta:
+        """Meta class for Budget."""
+
+        indexes = [
+            Index(
+                fields=["user", "-month"],
+                condition=Q(deleted_at__isnull=True),
+                name="budget_live_user_month_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.users} - {self.monthly_limit} for {self.month.strftime('%B %Y')}"  # type: ignore
@@ -0,0 +1,93 @@
+# Python modules
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Optional
+
+# Django REST Framework modules
+from rest_framework.serializers import (
+    ModelSerializer,
+    Serializer,
+    CharField,
+    DateField,
+    DecimalField,
+    IntegerField,
+    SerializerMethodField,
+)
+
+# Project modules
+from apps.budget.models import Budget
+
+
+class BudgetBaseSerializer(ModelSerializer):
+    """Base Serializer for Budget model"""
+
+    class Meta:
+        """Customization of the Serializer metadata."""
+
+        model = Budget
+        fields = ("id", "monthly_limit", "month", "created_at", "updated_at")
+        read_only_fields = ("created_at", "updated_at")
+
+
+class BudgetListSerializer(BudgetBaseSerializer):
+    """Serializer for listing Budget instances"""
+    pass
+
+
+class BudgetCreateSerializer(BudgetBaseSerializer):
+    """Serializer for creating Budget instances"""
+
+    monthly_limit = DecimalField(max_digits=10, decimal_places=2, min_value=Decimal("0"))
+
+    def validate_month(self, value: date) -> date:
+        """Normalize the month to its first day."""
+        return value.replace(day=1)
+
+    def create(self, validated_data: dict[str, Any]) -> Budget:
+        user = self.context["request"].user
+        return Budget.objects.create(user=user, **validated_data)
+
+
+class BudgetUpdateSerializer(BudgetCreateSerializer):
+    """Serializer for updating Budget instances"""
+    pass
+
+
+class BudgetStatusQuerySerializer(Serializer):
+    """Serializer for validating budget status filters."""
+
+    date_from = DateField(required=False)
+    date_to = DateField(required=False)
+
+
+class BudgetStatusSerializer(Serializer):
+    """Serializer for a budget compared against the month's spending."""
+
+    id = IntegerField()
+    month = DateField()
+    monthly_limit = DecimalField(max_digits=10, decimal_places=2)
+    spent = DecimalField(max_digits=16, decimal_places=2)
+    remaining = DecimalField(max_digits=16, decimal_places=2)
+    percent_used = SerializerMethodField()
+
+    def get_percent_used(self, obj: Budget) -> Optional[str]:
+        """Share of the monthly limit already spent, in percent."""
+        if not obj.monthly_limit:
+            return None
+        percent: Decimal = obj.spent * 100 / obj.monthly_limit  # type: ignore
+        return str(percent.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+class HTTP405MethodNotAllowedSerializer(Serializer):
+    """
+    Serializer for HTTP 405 Method Not Allowed response.
+    """
+
+    detail = CharField()
+
+    class Meta:
+        """Customization of the Serializer metadata."""
+
+        fields = (
+            "detail",
+        )
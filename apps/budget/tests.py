@@ -0,0 +1,184 @@
+# Python modules
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+# Django modules
+from django.test import TestCase
+
+# Django REST Framework
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.budget.models import Budget
+from apps.category.models import Category
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+
+
+class BudgetStatusTestCase(TestCase):
+    """
+    Budget utilization is computed with a constant number of queries
+    regardless of how many budgets and expenses a user has.
+    """
+
+    BUDGET_COUNT = 2000
+    EXPENSE_COUNT = 6000
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user: CustomUser = CustomUser.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="StrongPass123!",
+        )
+        cls.other_user: CustomUser = CustomUser.objects.create_user(
+            email="other@example.com",
+            username="other",
+            password="StrongPass123!",
+        )
+        categories: list[Category] = [
+            Category.objects.create(name=f"Category {i}", user=cls.user)
+            for i in range(4)
+        ]
+
+        months: list[date] = [
+            date(1850 + i // 12, i % 12 + 1, 1)
+            for i in range(cls.BUDGET_COUNT)
+        ]
+        Budget.objects.bulk_create(
+            Budget(user=cls.user, monthly_limit=Decimal("500.00"), month=month)
+            for month in months
+        )
+        Budget.objects.create(user=cls.other_user, monthly_limit=Decimal("10.00"), month=months[0])
+
+        cls.expected_spent: dict[date, Decimal] = defaultdict(Decimal)
+        expenses: list[Expense] = []
+        for i in range(cls.EXPENSE_COUNT):
+            month: date = months[(i * 7) % cls.BUDGET_COUNT]
+            amount: Decimal = Decimal(i % 90) + Decimal("0.25")
+            cls.expected_spent[month] += amount
+            expenses.append(
+                Expense(
+                    user=cls.user,
+                    category=categories[i % len(categories)] if i % 5 else None,
+                    amount=amount,
+                    date=month.replace(day=i % 28 + 1),
+                )
+            )
+        Expense.objects.bulk_create(expenses)
+        Expense.objects.create(user=cls.other_user, amount=Decimal("999.00"), date=months[0])
+        ExpenseMonthlyRollup.objects.rebuild()
+
+    def setUp(self) -> None:
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_status_uses_single_query(self) -> None:
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/expense-tracker/v1/budgets/status")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), self.BUDGET_COUNT)
+
+    def test_status_values(self) -> None:
+        response = self.client.get("/api/expense-tracker/v1/budgets/status")
+
+        for row in response.data:
+            month: date = date.fromisoformat(row["month"])
+            spent: Decimal = self.expected_spent.get(month, Decimal("0"))
+            self.assertEqual(Decimal(row["spent"]), spent)
+            self.assertEqual(Decimal(row["remaining"]), Decimal("500.00") - spent)
+            self.assertEqual(
+                Decimal(row["percent_used"]),
+                (spent * 100 / Decimal("500.00")).quantize(Decimal("0.01")),
+            )
+
+    def test_status_date_filter(self) -> None:
+        response = self.client.get(
+            "/api/expense-tracker/v1/budgets/status",
+            {"date_from": "1850-03-15", "date_to": "1850-05-31"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["month"] for row in response.data],
+            ["1850-05-01", "1850-04-01", "1850-03-01"],
+        )
+
+    def test_status_reflects_soft_deleted_expenses(self) -> None:
+        expense: Expense = Expense.objects.filter(user=self.user, date__year=1850, date__month=1).first()
+        expense.delete()
+
+        response = self.client.get(
+            "/api/expense-tracker/v1/budgets/status",
+            {"date_from": "1850-01-01", "date_to": "1850-01-31"},
+        )
+
+        self.assertEqual(
+            Decimal(response.data[0]["spent"]),
+            self.expected_spent[date(1850, 1, 1)] - expense.amount,
+        )
+
+
+class BudgetCrudTestCase(TestCase):
+    """Budget endpoints are scoped to the authenticated user."""
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="owner@example.com",
+            username="owner",
+            password="StrongPass123!",
+        )
+        self.other_user: CustomUser = CustomUser.objects.create_user(
+            email="other@example.com",
+            username="other",
+            password="StrongPass123!",
+        )
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_normalizes_month(self) -> None:
+        response = self.client.post(
+            "/api/expense-tracker/v1/budgets/create",
+            {"monthly_limit": "250.00", "month": "2025-02-17"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["month"], "2025-02-01")
+
+    def test_other_users_budget_is_not_accessible(self) -> None:
+        budget: Budget = Budget.objects.create(
+            user=self.other_user,
+            monthly_limit=Decimal("100.00"),
+            month=date(2025, 1, 1),
+        )
+
+        response = self.client.get(f"/api/expense-tracker/v1/budgets/{budget.pk}/retrieve")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.delete(f"/api/expense-tracker/v1/budgets/{budget.pk}/delete")
+        self.assertEqual(response.status_code, 400)
+
+        budget.refresh_from_db()
+        self.assertIsNone(budget.deleted_at)
+
+    def test_update_and_delete(self) -> None:
+        budget: Budget = Budget.objects.create(
+            user=self.user,
+            monthly_limit=Decimal("100.00"),
+            month=date(2025, 1, 1),
+        )
+
+        response = self.client.put(
+            f"/api/expense-tracker/v1/budgets/{budget.pk}/update",
+            {"monthly_limit": "150.00", "month": "2025-01-01"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["monthly_limit"], "150.00")
+
+        response = self.client.delete(f"/api/expense-tracker/v1/budgets/{budget.pk}/delete")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Budget.objects.filter(pk=budget.pk).exists())
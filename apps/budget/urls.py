@@ -0,0 +1,23 @@
+# Django modules
+from django.urls import include, path
+
+# Django Rest Framework modules
+from rest_framework.routers import DefaultRouter
+
+# Project modules
+from apps.budget.views import BudgetViewSet
+
+
+router: DefaultRouter = DefaultRouter(
+    trailing_slash=False
+)
+
+router.register(
+    prefix="budgets",
+    viewset=BudgetViewSet,
+    basename="budget",
+)
+
+urlpatterns = [
+    path("v1/", include(router.urls)),
+]
\ No newline at end of file
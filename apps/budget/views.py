@@ -1,3 +1,356 @@
-from django.shortcuts import render
+# Python modules
+from decimal import Decimal
+from typing import Any
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 
-# Create your views here.
+# Django modules
+from django.db.models import DecimalField, ExpressionWrapper, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+from django.db.models.query import QuerySet
+
+# Django REST Framework
+from rest_framework.viewsets import ViewSet
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_405_METHOD_NOT_ALLOWED,
+    HTTP_201_CREATED,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.decorators import action
+
+# Project modules
+from apps.abstracts.permissions import IsOwner
+from apps.abstracts.routers import read_from_replica
+from apps.budget.models import Budget
+from apps.budget.serializers import (
+    BudgetListSerializer,
+    BudgetCreateSerializer,
+    BudgetUpdateSerializer,
+    BudgetBaseSerializer,
+    BudgetStatusQuerySerializer,
+    BudgetStatusSerializer,
+    HTTP405MethodNotAllowedSerializer,
+)
+from apps.expense.models import ExpenseMonthlyRollup
+
+
+class BudgetViewSet(ViewSet):
+    """
+    A ViewSet for managing Budget instances.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get_status_queryset(self, request: DRFRequest) -> QuerySet[Budget]:
+        """
+        Annotate the user's budgets with the month's spending in one query,
+        summing the per-category monthly expense rollups for each budget month.
+        """
+
+        money_field: DecimalField = DecimalField(max_digits=16, decimal_places=2)
+
+        spent_per_month: QuerySet = (
+            ExpenseMonthlyRollup.objects
+            .filter(
+                user_id=OuterRef("user_id"),
+                month=OuterRef("budget_month"),
+            )
+            .values("user_id")
+            .annotate(spent=Sum("total"))
+            .values("spent")
+        )
+
+        return (
+            Budget.objects
+            .filter(user=request.user)
+            .annotate(budget_month=TruncMonth("month"))
+            .annotate(
+                spent=Coalesce(
+                    Subquery(spent_per_month, output_field=money_field),
+                    Value(Decimal("0")),
+                    output_field=money_field,
+                ),
+            )
+            .annotate(
+                remaining=ExpressionWrapper(
+                    F("monthly_limit") - F("spent"),
+                    output_field=money_field,
+                ),
+            )
+            .order_by("-month", "-id")
+        )
+
+    @extend_schema(
+        responses={
+            HTTP_200_OK: BudgetListSerializer(many=True),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="List all budgets",
+        description="Retrieve a list of the authenticated user's budgets."
+    )
+    @action(
+        methods=["GET"],
+        detail=False,
+        permission_classes=[IsAuthenticated],
+        url_path="list",
+    )
+    def list_budgets(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """List all Budget instances of the authenticated user."""
+
+        all_budgets: QuerySet[Budget] = Budget.objects.filter(user=request.user).order_by("-month", "-id")
+
+        serializer: BudgetListSerializer = BudgetListSerializer(
+            all_budgets,
+            many=True,
+        )
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK,
+        )
+
+    @extend_schema(
+        responses={
+            HTTP_200_OK: BudgetStatusSerializer(many=True),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=BudgetStatusQuerySerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="Budget utilization",
+        description="Limit, spent, remaining and percent used for each budget month. Filters: date_from, date_to.",
+        parameters=[
+            OpenApiParameter(
+                name="date_from",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="date_to",
+                required=False,
+            ),
+        ]
+    )
+    @action(
+        methods=["GET"],
+        detail=False,
+        permission_classes=[IsAuthenticated],
+        url_path="status",
+    )
+    @read_from_replica
+    def budget_status(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Compare each budget with the spending of its month."""
+
+        query_serializer: BudgetStatusQuerySerializer = BudgetStatusQuerySerializer(
+            data=request.query_params,
+        )
+
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        filters: dict[str, Any] = query_serializer.validated_data
+        budgets: QuerySet[Budget] = self.get_status_queryset(request)
+
+        if "date_from" in filters:
+            budgets = budgets.filter(month__gte=filters["date_from"].replace(day=1))
+
+        if "date_to" in filters:
+            budgets = budgets.filter(month__lte=filters["date_to"])
+
+        serializer: BudgetStatusSerializer = BudgetStatusSerializer(budgets, many=True)
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=BudgetCreateSerializer,
+        responses={
+            HTTP_201_CREATED: BudgetBaseSerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=BudgetCreateSerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="Create a new budget",
+        description="Create a new monthly budget for the authenticated user."
+    )
+    @action(
+        methods=["POST"],
+        detail=False,
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path="create",
+    )
+    def create_budget(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Create a new Budget instance."""
+
+        serializer: BudgetCreateSerializer = BudgetCreateSerializer(
+            data=request.data,
+            context={"request": request},
+        )
+
+        if not serializer.is_valid():
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        budget: Budget = serializer.save()
+
+        response_serializer: BudgetBaseSerializer = BudgetBaseSerializer(budget)
+
+        return DRFResponse(
+            data=response_serializer.data,
+            status=HTTP_201_CREATED,
+        )
+
+    @extend_schema(
+        request=BudgetUpdateSerializer,
+        responses={
+            HTTP_200_OK: BudgetBaseSerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=BudgetUpdateSerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="Update an existing budget",
+        description="Update an existing budget instance."
+    )
+    @action(
+        methods=["PUT"],
+        detail=True,
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path="update",
+    )
+    def update_budget(self, request: DRFRequest, pk: int, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Update an existing Budget instance."""
+
+        try:
+            budget: Budget = Budget.objects.get(pk=pk, user=request.user)
+        except Budget.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Budget not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        serializer: BudgetUpdateSerializer = BudgetUpdateSerializer(
+            budget,
+            data=request.data,
+            context={"request": request},
+        )
+
+        if not serializer.is_valid():
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        updated_budget: Budget = serializer.save()
+
+        response_serializer: BudgetBaseSerializer = BudgetBaseSerializer(updated_budget)
+
+        return DRFResponse(
+            data=response_serializer.data,
+            status=HTTP_200_OK,
+        )
+
+    @extend_schema(
+        responses={
+            HTTP_200_OK: BudgetBaseSerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=BudgetBaseSerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="Retrieve a budget",
+        description="Retrieve a specific budget instance by its ID."
+    )
+    @action(
+        methods=["GET"],
+        detail=True,
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path="retrieve",
+    )
+    def retrieve_budget(self, request: DRFRequest, pk: int, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Retrieve a specific Budget instance by its ID."""
+
+        try:
+            budget: Budget = Budget.objects.get(pk=pk, user=request.user)
+        except Budget.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Budget not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        serializer: BudgetBaseSerializer = BudgetBaseSerializer(budget)
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK,
+        )
+
+    @extend_schema(
+        responses={
+            HTTP_200_OK: OpenApiResponse(
+                description="Budget deleted successfully."
+            ),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=BudgetBaseSerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        summary="Delete a budget",
+        description="Delete a specific budget instance by its ID."
+    )
+    @action(
+        methods=["DELETE"],
+        detail=True,
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path="delete",
+    )
+    def delete_budget(self, request: DRFRequest, pk: int, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Delete a specific Budget instance by its ID."""
+
+        try:
+            budget: Budget = Budget.objects.get(pk=pk, user=request.user)
+        except Budget.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Budget not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        budget.delete()
+
+        return DRFResponse(
+            data={"detail": "Budget deleted successfully."},
+            status=HTTP_200_OK,
+        )
@@ -4,9 +4,11 @@ from django.contrib.admin import register
 from .models import Category
 from unfold.admin import ModelAdmin
 
+from apps.abstracts.admin import SoftDeleteAdminMixin
+
 
 @register(Category)
-class CategoryAdmin(ModelAdmin):
+class CategoryAdmin(SoftDeleteAdminMixin, ModelAdmin):
     """
     Admin interface for the Category model.
     """
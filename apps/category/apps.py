@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CategoryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'  #type: ignore
     name = 'apps.category'
+
+    def ready(self) -> None:
+        from apps.category import signals  # noqa: F401
@@ -0,0 +1,119 @@
+"""
+Per-user cache of live categories.
+
+Entries are keyed on the user id plus a version counter. Writes to a
+user's categories bump the counter (see apps.category.signals and
+CategoryQuerySet.delete), so stale
+entries are never read again and simply expire. Works with any Django
+cache backend; with a shared backend (file, database, memcached, redis)
+every worker sees the same versions.
+"""
+
+# Python modules
+import time
+from typing import Any, Iterable
+
+# Django modules
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Project modules
+from apps.category.models import Category
+from apps.category.serializers import category_list_values
+
+
+VERSION_KEY = "categories:version:{user_id}"
+DATA_KEY = "categories:{user_id}:{version}"
+
+
+def get_version(user_id: int) -> int:
+    """Current cache version for the user, initialised on first use."""
+    key: str = VERSION_KEY.format(user_id=user_id)
+    version: int | None = cache.get(key)
+    if version is None:
+        # Start from a timestamp rather than 1 so an evicted counter cannot
+        # resurrect entries written under an earlier version.
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(key, 0)
+    return version
+
+
+async def aget_version(user_id: int) -> int:
+    """Async get_version()."""
+    key: str = VERSION_KEY.format(user_id=user_id)
+    version: int | None = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns() // 1000, timeout=None)
+        version = await cache.aget(key, 0)
+    return version
+
+
+def invalidate_user_categories(user_id: int) -> None:
+    """Bump the user's version so the next read goes to the database."""
+    key: str = VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+
+
+def invalidate_on_commit(user_ids: Iterable[int]) -> None:
+    """
+    Invalidate the users' caches now and again on commit, so a concurrent
+    request cannot re-cache rows read before the write became visible.
+    """
+    user_ids = set(user_ids)
+    for user_id in user_ids:
+        invalidate_user_categories(user_id)
+    transaction.on_commit(lambda: [invalidate_user_categories(user_id) for user_id in user_ids])
+
+
+def get_user_categories(user_id: int) -> list[dict[str, Any]]:
+    """Serialized live categories of the user, ordered by id."""
+    key: str = DATA_KEY.format(user_id=user_id, version=get_version(user_id))
+    categories: list[dict[str, Any]] | None = cache.get(key)
+    if categories is None:
+        categories = category_list_values.serialize(
+            Category.objects.filter(user_id=user_id).order_by("id")
+        )
+        cache.set(key, categories, timeout=settings.CATEGORY_CACHE_TIMEOUT)
+    return categories
+
+
+async def aget_user_categories(user_id: int) -> list[dict[str, Any]]:
+    """Async get_user_categories() for async views."""
+    key: str = DATA_KEY.format(user_id=user_id, version=await aget_version(user_id))
+    categories: list[dict[str, Any]] | None = await cache.aget(key)
+    if categories is None:
+        categories = await category_list_values.aserialize(
+            Category.objects.filter(user_id=user_id).order_by("id")
+        )
+        await cache.aset(key, categories, timeout=settings.CATEGORY_CACHE_TIMEOUT)
+    return categories
+
+
+def get_user_category_ids(user_id: int) -> set[int]:
+    """Ids of the user's live categories."""
+    return {category["id"] for category in get_user_categories(user_id)}
+
+
+def get_owned_category_ids(user_id: int, category_ids: Iterable[int]) -> set[int]:
+    """
+    The given category ids that are live categories of the user.
+
+    Ids missing from the cached set are checked against the database, so a
+    category created by another worker whose version bump has not reached
+    this cache yet is not rejected. Finding one refreshes the cache.
+    """
+    requested: set[int] = set(category_ids)
+    owned: set[int] = requested & get_user_category_ids(user_id)
+    missing: set[int] = requested - owned
+    if missing:
+        found: set[int] = set(
+            Category.objects.filter(user_id=user_id, pk__in=missing).values_list("pk", flat=True)
+        )
+        if found:
+            invalidate_user_categories(user_id)
+            owned |= found
+    return owned
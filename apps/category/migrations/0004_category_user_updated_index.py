@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0003_category_live_partial_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'updated_at', 'deleted_at'], name='category_user_updated_idx'),
+        ),
+    ]
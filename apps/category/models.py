@@ -1,10 +1,29 @@
+# Python modules
+from typing import Any
+
 # Django modules
-from django.db.models import CASCADE, CharField, ForeignKey
+from django.db.models import CASCADE, CharField, ForeignKey, Index, Q
 
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import AbstractBaseModel, AllObjectsManager, SoftDeleteManager, SoftDeleteQuerySet
 from apps.auths.models import CustomUser
 
 
+class CategoryQuerySet(SoftDeleteQuerySet):
+    """
+    SoftDeleteQuerySet whose bulk delete also invalidates the owners'
+    category caches; the single UPDATE sends no post_save or post_delete.
+    """
+
+    def delete(self) -> tuple[int, dict[str, int]]:  # type: ignore
+        # apps.category.cache imports this module.
+        from apps.category.cache import invalidate_on_commit
+
+        user_ids: set[int] = set(self.alive().values_list("user_id", flat=True).distinct())
+        deleted: tuple[int, dict[str, Any]] = super().delete()
+        invalidate_on_commit(user_ids)
+        return deleted
+
+
 class Category(AbstractBaseModel):
     """
     Model representing an expense category.
@@ -22,5 +41,24 @@ class Category(AbstractBaseModel):
         related_name="categories",
     )
 
+    objects = SoftDeleteManager.from_queryset(CategoryQuerySet)()
+    all_with_deleted = AllObjectsManager.from_queryset(CategoryQuerySet)()
+
+    class Meta:
+        """Meta class for Category."""
+
+        indexes = [
+            Index(
+                fields=["user", "name"],
+                condition=Q(deleted_at__isnull=True),
+                name="category_live_user_name_idx",
+            ),
+            # conditional GET validators: max(updated_at) and live count per user
+            Index(
+                fields=["user", "updated_at", "deleted_at"],
+                name="category_user_updated_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return self.name  # type: ignore
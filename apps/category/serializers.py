@@ -1,8 +1,9 @@
 # Django REST Framework modules
-from rest_framework.serializers import ModelSerializer, CharField, Serializer
+from rest_framework.serializers import ModelSerializer, CharField, DateTimeField, Serializer
 from rest_framework.exceptions import ValidationError
 
 # Project modules
+from apps.abstracts.serializers import TombstoneSerializer, ValuesSerializer
 from apps.category.models import Category
 
 class CategoryBaseSerializer(ModelSerializer):
@@ -21,6 +22,19 @@ class CategoryListSerializer(CategoryBaseSerializer):
     pass
 
 
+# Same output as CategoryListSerializer, read straight from values_list() rows.
+category_list_values: ValuesSerializer = ValuesSerializer(CategoryListSerializer)
+
+
+class CategorySyncSerializer(Serializer):
+    """Serializer for the category delta sync response."""
+
+    watermark = DateTimeField(allow_null=True)
+    next = CharField(allow_null=True)
+    changed = CategoryListSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+
+
 class CategoryCreateSerializer(CategoryBaseSerializer):
     """Serializer for creating Category instances"""
     name = CharField(max_length=Category.NAME_MAX_LENGTH)
@@ -0,0 +1,21 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Project modules
+from apps.category.cache import invalidate_on_commit
+from apps.category.models import Category
+
+
+@receiver(post_save, sender=Category, dispatch_uid="category_cache_post_save")
+@receiver(post_delete, sender=Category, dispatch_uid="category_cache_post_delete")
+def invalidate_category_cache(sender: type[Category], instance: Category, **kwargs: Any) -> None:
+    """
+    Invalidate the owner's category cache on create, update and soft or hard
+    delete. Queryset soft deletes send no signal; CategoryQuerySet.delete
+    invalidates those.
+    """
+    invalidate_on_commit([instance.user_id])
@@ -1,3 +1,145 @@
+# Django modules
+from django.core.cache import cache
 from django.test import TestCase
 
-# Create your tests here.
+# Django REST Framework
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.testing import QueryBudgetMixin
+from apps.auths.authentication import ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from apps.category.cache import get_owned_category_ids, get_user_categories, get_user_category_ids
+from apps.category.models import Category
+
+
+class CategoryQueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """Upper bounds on SQL queries per CategoryViewSet action, independent of data size."""
+
+    url: str = "/api/expense-tracker/v1/categories"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="category-budget@example.com",
+            username="category-budget",
+            password="StrongPass123!",
+        )
+        self.categories: list[Category] = []
+        self.grow(10)
+
+        token: str = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.client: APIClient = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def grow(self, count: int) -> None:
+        self.categories += Category.objects.bulk_create(
+            Category(user=self.user, name=f"Category {len(self.categories) + index}")
+            for index in range(count)
+        )
+
+    def test_list_categories(self) -> None:
+        self.assertQueryBudget(2, lambda: self.client.get(f"{self.url}/list"))
+
+    def test_sync_categories(self) -> None:
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/sync"))
+
+    def test_create_category(self) -> None:
+        names = iter(range(1000))
+        self.assertQueryBudget(
+            2, lambda: self.client.post(f"{self.url}/create", {"name": f"New {next(names)}"}, format="json")
+        )
+
+    def test_update_category(self) -> None:
+        category: Category = self.categories[0]
+        names = iter(range(1000))
+        self.assertQueryBudget(
+            3,
+            lambda: self.client.put(
+                f"{self.url}/{category.pk}/update", {"name": f"Renamed {next(names)}"}, format="json"
+            ),
+        )
+
+    def test_retrieve_category(self) -> None:
+        category: Category = self.categories[0]
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/{category.pk}/retrieve"))
+
+    def test_delete_category(self) -> None:
+        targets = iter(self.categories)
+        self.assertQueryBudget(2, lambda: self.client.delete(f"{self.url}/{next(targets).pk}/delete"))
+
+
+class CategoryCacheTestCase(TestCase):
+    """Checks the per-user category cache: hits, invalidation and ownership."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="category-cache@example.com",
+            username="category-cache",
+            password="StrongPass123!",
+        )
+        self.other: CustomUser = CustomUser.objects.create_user(
+            email="category-cache-other@example.com",
+            username="category-cache-other",
+            password="StrongPass123!",
+        )
+        self.category: Category = Category.objects.create(user=self.user, name="Food")
+        self.foreign: Category = Category.objects.create(user=self.other, name="Other")
+
+    def names(self) -> list[str]:
+        return [category["name"] for category in get_user_categories(self.user.pk)]
+
+    def test_second_read_is_a_hit(self) -> None:
+        with self.assertNumQueries(1):
+            first: list[dict] = get_user_categories(self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_categories(self.user.pk), first)
+
+    def test_save_and_delete_invalidate(self) -> None:
+        self.assertEqual(self.names(), ["Food"])
+
+        created: Category = Category.objects.create(user=self.user, name="Travel")
+        self.assertEqual(self.names(), ["Food", "Travel"])
+
+        created.name = "Trips"
+        created.save()
+        self.assertEqual(self.names(), ["Food", "Trips"])
+
+        self.category.delete()
+        self.assertEqual(self.names(), ["Trips"])
+
+    def test_queryset_delete_invalidates(self) -> None:
+        self.assertEqual(self.names(), ["Food"])
+        self.assertEqual(get_owned_category_ids(self.user.pk, [self.category.pk]), {self.category.pk})
+
+        # A single UPDATE, as in the admin's "delete selected" action.
+        Category.objects.filter(pk=self.category.pk).delete()
+
+        self.assertEqual(self.names(), [])
+        self.assertEqual(get_owned_category_ids(self.user.pk, [self.category.pk]), set())
+
+    def test_other_users_writes_keep_entry(self) -> None:
+        self.names()
+        Category.objects.create(user=self.other, name="Elsewhere")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names(), ["Food"])
+
+    def test_ownership(self) -> None:
+        self.assertEqual(get_user_category_ids(self.user.pk), {self.category.pk})
+        self.assertEqual(
+            get_owned_category_ids(self.user.pk, [self.category.pk, self.foreign.pk, 0]),
+            {self.category.pk},
+        )
+
+    def test_missing_ids_fall_back_to_database(self) -> None:
+        self.names()
+        # bulk_create sends no signal, like a write whose version bump this cache missed.
+        [unseen] = Category.objects.bulk_create([Category(user=self.user, name="Unseen")])
+        self.assertNotIn(unseen.pk, get_user_category_ids(self.user.pk))
+
+        self.assertEqual(get_owned_category_ids(self.user.pk, [unseen.pk]), {unseen.pk})
+        self.assertIn(unseen.pk, get_user_category_ids(self.user.pk))
+
+        with self.assertNumQueries(0):
+            get_owned_category_ids(self.user.pk, [self.category.pk])
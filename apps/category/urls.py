@@ -5,7 +5,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 # Project modules
-from apps.category.views import CategoryViewSet
+from apps.category.views import CategoryAsyncViewSet, CategoryViewSet
 
 
 router: DefaultRouter = DefaultRouter(
@@ -18,6 +18,31 @@ router.register(
     basename="category",
 )
 
+# Async variants for ASGI deployments, mirroring the ViewSet routes.
+async_urlpatterns = [
+    path(
+        "categories/list",
+        CategoryAsyncViewSet.as_view(actions={"get": "list_categories"}),
+        name="category-async-list",
+    ),
+    path(
+        "categories/create",
+        CategoryAsyncViewSet.as_view(actions={"post": "create_category"}),
+        name="category-async-create",
+    ),
+    path(
+        "categories/<int:pk>/update",
+        CategoryAsyncViewSet.as_view(actions={"put": "update_category"}),
+        name="category-async-update",
+    ),
+    path(
+        "categories/<int:pk>/delete",
+        CategoryAsyncViewSet.as_view(actions={"delete": "delete_category"}),
+        name="category-async-delete",
+    ),
+]
+
 urlpatterns = [
     path("v1/", include(router.urls)),
+    path("v1/async/", include(async_urlpatterns)),
 ]
\ No newline at end of file
@@ -1,9 +1,11 @@
 # Python modules
-from typing import Any
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from typing import Any, Optional
+from asgiref.sync import sync_to_async
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
-#Django modules
-from django.db.models.query import QuerySet
+# Django modules
+from django.http import HttpResponseBase
 
 # Django REST Framework
 from rest_framework.viewsets import ViewSet
@@ -11,6 +13,7 @@ from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
 from rest_framework.status import (
     HTTP_200_OK, 
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST, 
     HTTP_405_METHOD_NOT_ALLOWED, 
     HTTP_201_CREATED
@@ -19,13 +22,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 
 # Project modules
+from apps.abstracts.conditional import CollectionValidators
 from apps.abstracts.permissions import IsOwner
+from apps.abstracts.routers import areplica_reads, read_from_replica
+from apps.abstracts.serializers import SyncQuerySerializer
+from apps.abstracts.sync import collect_changes
+from apps.abstracts.views import AsyncViewSet
+from apps.category.cache import aget_user_categories, get_user_categories
 from apps.category.models import Category
 from apps.category.serializers import (
     CategoryListSerializer, 
     CategoryCreateSerializer, 
     CategoryUpdateSerializer, 
     CategoryBaseSerializer, 
+    CategorySyncSerializer,
     HTTP405MethodNotAllowedSerializer
 )
 
@@ -40,13 +50,17 @@ class CategoryViewSet(ViewSet):
     @extend_schema(
         responses={
             HTTP_200_OK: CategoryListSerializer(many=True),
+            HTTP_304_NOT_MODIFIED: OpenApiResponse(description="Not Modified"),
             HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
                 response=HTTP405MethodNotAllowedSerializer,
                 description="Method Not Allowed"
             ),
         },
-        summary="List all categories",
-        description="Retrieve a list of all category instances."
+        summary="List categories",
+        description=(
+            "Retrieve the authenticated user's categories. Responses carry ETag "
+            "and Last-Modified for conditional requests (304 Not Modified)."
+        )
     )
     @action(
         methods=["GET"],
@@ -54,21 +68,85 @@ class CategoryViewSet(ViewSet):
         permission_classes=[IsAuthenticated],
         url_path="list",
     )
+    @read_from_replica
     def list_categories(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
-        """List all Category instances."""
+        """List the user's Category instances from the per-user cache."""
+
+        validators: CollectionValidators = CollectionValidators.for_queryset(
+            Category.all_with_deleted.filter(user=request.user)
+        )
+        not_modified = validators.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        return validators.apply(
+            DRFResponse(
+                data=get_user_categories(request.user.id),
+                status=HTTP_200_OK,
+            )
+        )
+    
+    @extend_schema(
+        responses={
+            HTTP_200_OK: CategorySyncSerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=SyncQuerySerializer,
+                description="Bad Request"
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP405MethodNotAllowedSerializer,
+                description="Method Not Allowed"
+            ),
+        },
+        parameters=[
+            OpenApiParameter(
+                name="since",
+                required=False,
+                type=OpenApiTypes.DATETIME,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                required=False,
+                type=str,
+            ),
+        ],
+        summary="Sync category changes",
+        description=(
+            "Categories created or updated after `since`, plus tombstones for "
+            "categories deleted after `since`, and a `watermark` to pass as "
+            "`since` next time. Without `since` all live categories are returned. "
+            "While `next` is set, pass it as `cursor` to fetch the remaining rows. "
+            "Recent changes may be sent again and should be applied by id."
+        )
+    )
+    @action(
+        methods=["GET"],
+        detail=False,
+        permission_classes=[IsAuthenticated],
+        url_path="sync",
+    )
+    def sync_categories(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Return the user's Category changes since a watermark."""
 
-        all_categories: QuerySet[Category] = Category.objects.all()
+        query_serializer: SyncQuerySerializer = SyncQuerySerializer(data=request.query_params)
 
-        serializers: CategoryListSerializer = CategoryListSerializer(
-            all_categories,
-            many=True,
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        changes: dict[str, Any] = collect_changes(
+            Category.all_with_deleted.filter(user=request.user),
+            since=query_serializer.validated_data.get("since"),
+            cursor=query_serializer.validated_data.get("cursor"),
         )
 
         return DRFResponse(
-            data=serializers.data,
+            data=CategorySyncSerializer(changes).data,
             status=HTTP_200_OK,
         )
-    
+
     @extend_schema(
         request=CategoryCreateSerializer,
         responses={
@@ -245,4 +323,98 @@ class CategoryViewSet(ViewSet):
         return DRFResponse(
             data={"detail": "Category deleted successfully."},
             status=HTTP_200_OK,
-        )
\ No newline at end of file
+        )
+
+class CategoryAsyncViewSet(AsyncViewSet):
+    """
+    Async variants of the category list/create/update/delete actions for
+    ASGI deployments. Responses match the CategoryViewSet actions.
+    """
+
+    async def list_categories(self, request: DRFRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """List the user's Category instances from the per-user cache."""
+
+        async with areplica_reads(request.user.pk):
+            validators: CollectionValidators = await CollectionValidators.afor_queryset(
+                Category.all_with_deleted.filter(user=request.user)
+            )
+            not_modified = validators.not_modified(request)
+            if not_modified is not None:
+                return not_modified
+
+            categories: list[dict[str, Any]] = await aget_user_categories(request.user.id)
+
+        return validators.apply(
+            DRFResponse(
+                data=categories,
+                status=HTTP_200_OK,
+            )
+        )
+
+    async def create_category(self, request: DRFRequest, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Create a new Category instance."""
+
+        serializer: CategoryCreateSerializer = CategoryCreateSerializer(
+            data=request.data,
+            context={"request": request},
+        )
+
+        category: Optional[Category] = await sync_to_async(self.save_if_valid)(serializer)
+        if category is None:
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        return DRFResponse(
+            data=CategoryBaseSerializer(category).data,
+            status=HTTP_201_CREATED,
+        )
+
+    async def update_category(self, request: DRFRequest, pk: int, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Update an existing Category instance."""
+
+        try:
+            category: Category = await Category.objects.aget(pk=pk, user=request.user)
+        except Category.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Category not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        serializer: CategoryUpdateSerializer = CategoryUpdateSerializer(
+            category,
+            data=request.data,
+            context={"request": request},
+            partial=False,
+        )
+
+        updated_category: Optional[Category] = await sync_to_async(self.save_if_valid)(serializer)
+        if updated_category is None:
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        return DRFResponse(
+            data=CategoryBaseSerializer(updated_category).data,
+            status=HTTP_200_OK,
+        )
+
+    async def delete_category(self, request: DRFRequest, pk: int, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Delete a specific Category instance by its ID."""
+
+        try:
+            category: Category = await Category.objects.aget(pk=pk, user=request.user)
+        except Category.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Category not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        await category.adelete()
+
+        return DRFResponse(
+            data={"detail": "Category deleted successfully."},
+            status=HTTP_200_OK,
+        )
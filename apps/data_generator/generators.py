@@ -0,0 +1,100 @@
+"""
+Pure-Python row generators for the test data command.
+
+Nothing here imports Django so the functions can run in worker processes
+regardless of the multiprocessing start method.
+"""
+
+# Python modules
+import random
+from datetime import date, timedelta
+from typing import Sequence
+
+
+CATEGORY_NAMES: tuple[str, ...] = ("Food", "Transport", "Entertainment", "Bills", "Shopping")
+
+# Relative frequency of each category: a few categories get most expenses.
+CATEGORY_WEIGHTS: tuple[float, ...] = (0.38, 0.24, 0.16, 0.12, 0.10)
+
+# (mu, sigma) of the log-normal amount distribution per category.
+CATEGORY_AMOUNTS: tuple[tuple[float, float], ...] = (
+    (2.6, 0.7),   # Food: mostly small tickets
+    (2.3, 0.6),   # Transport
+    (3.2, 0.8),   # Entertainment
+    (4.6, 0.5),   # Bills: fewer, larger payments
+    (3.6, 1.0),   # Shopping: wide spread
+)
+
+MIN_AMOUNT: float = 0.5
+MAX_AMOUNT: float = 99_999_999.99
+
+# Pareto shape giving roughly an 80/20 split of expenses between users.
+USER_ACTIVITY_ALPHA: float = 1.16
+
+
+def expense_counts_per_user(user_count: int, mean_per_user: int, seed: int) -> list[int]:
+    """
+    Split user_count * mean_per_user expenses between users with a heavy
+    tailed (Pareto) activity distribution, keeping the total exact.
+    """
+    total: int = user_count * mean_per_user
+    if not total:
+        return [0] * user_count
+
+    rng: random.Random = random.Random(f"{seed}-activity")
+    weights: list[float] = [rng.paretovariate(USER_ACTIVITY_ALPHA) for _ in range(user_count)]
+    weight_sum: float = sum(weights)
+
+    counts: list[int] = [int(total * weight / weight_sum) for weight in weights]
+    for index in rng.sample(range(user_count), total - sum(counts)):
+        counts[index] += 1
+    return counts
+
+
+def generate_expense_rows(
+    task: tuple[int, int, Sequence[tuple[int, Sequence[int], int]], int, int],
+) -> list[tuple[int, int, str, int, str]]:
+    """
+    Generate expense rows for a chunk of users.
+
+    task is (seed, chunk_index, [(user_id, category_ids, expense_count), ...],
+    start_ordinal, day_span). Every chunk has its own RNG so the output does
+    not depend on how chunks are spread over workers. Rows are
+    (user_id, category_id, amount, date_ordinal, description).
+    """
+    seed, chunk_index, users, start_ordinal, day_span = task
+    rng: random.Random = random.Random(f"{seed}-expenses-{chunk_index}")
+
+    cum_weights: list[float] = []
+    running: float = 0.0
+    for weight in CATEGORY_WEIGHTS:
+        running += weight
+        cum_weights.append(running)
+    positions: range = range(len(CATEGORY_NAMES))
+
+    rows: list[tuple[int, int, str, int, str]] = []
+    for user_id, category_ids, expense_count in users:
+        picks: list[int] = rng.choices(positions, cum_weights=cum_weights, k=expense_count)
+        for position in picks:
+            mu, sigma = CATEGORY_AMOUNTS[position]
+            amount: float = min(max(rng.lognormvariate(mu, sigma), MIN_AMOUNT), MAX_AMOUNT)
+            rows.append(
+                (
+                    user_id,
+                    category_ids[position],
+                    f"{amount:.2f}",
+                    start_ordinal + int(rng.triangular(0, day_span, day_span)),
+                    f"{CATEGORY_NAMES[position]} expense",
+                )
+            )
+    return rows
+
+
+def month_starts(months: int, today: date) -> list[date]:
+    """First day of the current month and of the months before it."""
+    starts: list[date] = []
+    current: date = today.replace(day=1)
+    for _ in range(months):
+        starts.append(current)
+        current = (current - timedelta(days=1)).replace(day=1)
+    return starts
@@ -1,86 +1,255 @@
 import random
+import time
 from datetime import date, timedelta
 from decimal import Decimal
+from multiprocessing import Pool
+from typing import Any, Iterator
 
-from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandParser
 
 from apps.budget.models import Budget
+from apps.category.cache import invalidate_user_categories
 from apps.category.models import Category
-from apps.expense.models import Expense
+from apps.data_generator.generators import (
+    CATEGORY_NAMES,
+    expense_counts_per_user,
+    generate_expense_rows,
+    month_starts,
+)
+from apps.expense.models import Expense, ExpenseMonthlyRollup
 from apps.auths.models import CustomUser as User
 
 
+USERNAMES = [
+    "alice", "bob", "charlie", "dave", "eve", "frank", "grace", "heidi",
+    "ivan", "judy", "mallory", "niaj", "oscar", "peggy", "trent",
+    "victor", "walter", "xavier", "yvonne", "zara",
+]
+
+# Users per generation task handed to a worker.
+USERS_PER_TASK = 50
+
+
 class Command(BaseCommand):
     help = "Generate test data for Expense Tracker"
 
-    def handle(self, *args, **options):
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=len(USERNAMES),
+            help="Number of users to create.",
+        )
+        parser.add_argument(
+            "--expenses-per-user",
+            type=int,
+            default=15,
+            help="Average number of expenses per user; activity is skewed between users.",
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=3,
+            help="Months of history to spread expenses and budgets over.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for reproducible datasets.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per bulk_create call.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes used to generate expense rows (inserts stay in this process).",
+        )
+        parser.add_argument(
+            "--password",
+            default="1234",
+            help="Password shared by all generated users.",
+        )
+        parser.add_argument(
+            "--append",
+            action="store_true",
+            help="Keep existing data instead of wiping it first.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
         self.stdout.write(self.style.NOTICE("🧩 Generating test data..."))
+        started: float = time.perf_counter()
 
-        # Очистим старые данные (по желанию)
-        Expense.objects.all().delete()
-        Category.objects.all().delete()
-        Budget.objects.all().delete()
-        User.objects.exclude(is_superuser=True).delete()
+        seed: int = options["seed"] if options["seed"] is not None else random.randrange(2**32)
+        batch_size: int = options["batch_size"]
+        months: int = max(options["months"], 1)
+        self.stdout.write(f"Seed: {seed}")
 
-        # Создаём тестовых пользователей
-        users = []
-        usernames = [
-            "alice", "bob", "charlie", "dave", "eve", "frank", "grace", "heidi",
-            "ivan", "judy", "mallory", "niaj", "oscar", "peggy", "trent",
-            "victor", "walter", "xavier", "yvonne", "zara",
-        ]
-        for name in usernames:
-            user = User.objects.create_user(
-                username=name, password="1234", email=f"{name}@example.com"
-            )
-            users.append(user)
+        if not options["append"]:
+            self.wipe()
+
+        users: list[User] = self.create_users(
+            options["users"],
+            options["password"],
+            suffix=f".{seed:x}" if options["append"] else "",
+            batch_size=batch_size,
+        )
         self.stdout.write(self.style.SUCCESS(f"✅ Created {len(users)} users."))
 
-        # Создаём категории
-        category_names = ["Food", "Transport", "Entertainment", "Bills", "Shopping"]
-        categories = []
-        for user in users:
-            for cat_name in category_names:
-                cat = Category.objects.create(
-                    name=f"{cat_name} ({user.username})", user=user
-                )
-                categories.append(cat)
+        category_ids: dict[int, list[int]] = self.create_categories(users, batch_size)
         self.stdout.write(
-            self.style.SUCCESS(f"✅ Created {len(categories)} categories.")
+            self.style.SUCCESS(f"✅ Created {len(users) * len(CATEGORY_NAMES)} categories.")
         )
 
-        # Создаём расходы
-        expenses = []
-        for user in users:
-            user_cats = Category.objects.filter(user=user)
-            for _ in range(15):
-                cat = random.choice(user_cats)
-                amount = Decimal(random.uniform(5, 150)).quantize(Decimal("0.01"))
-                days_ago = random.randint(1, 60)
-                exp_date = date.today() - timedelta(days=days_ago)
-
-                expense = Expense.objects.create(
-                    description=f"Expense for {cat.name}",
-                    user=user,
-                    category=cat,
-                    amount=amount,
-                    date=exp_date,
-                )
-                expenses.append(expense)
-        self.stdout.write(self.style.SUCCESS(f"✅ Created {len(expenses)} expenses."))
-
-        # Создаём бюджеты
-        budgets = []
-        for user in users:
-            for month_offset in range(3):  # последние 3 месяца
-                month_date = date.today().replace(day=1) - timedelta(
-                    days=30 * month_offset
-                )
-                limit = Decimal(random.uniform(500, 2000)).quantize(Decimal("0.01"))
-                budget = Budget.objects.create(
-                    user=user, monthly_limit=limit, month=month_date
+        expense_count: int = self.create_expenses(
+            users,
+            category_ids,
+            expenses_per_user=options["expenses_per_user"],
+            months=months,
+            seed=seed,
+            batch_size=batch_size,
+            workers=options["workers"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ Created {expense_count} expenses."))
+
+        rollups = ExpenseMonthlyRollup.objects.rebuild(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt {rollups} monthly rollups."))
+
+        budget_count: int = self.create_budgets(users, months, seed, batch_size)
+        self.stdout.write(self.style.SUCCESS(f"✅ Created {budget_count} budgets."))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Test data generated successfully in {time.perf_counter() - started:.1f}s!"
+            )
+        )
+
+    def wipe(self) -> None:
+        """Remove previously generated data, including soft deleted rows."""
+        Expense.all_with_deleted.all().hard_delete()
+        Category.all_with_deleted.all().hard_delete()
+        Budget.all_with_deleted.all().hard_delete()
+        User.objects.exclude(is_superuser=True).delete()
+
+    def create_users(self, count: int, password: str, suffix: str, batch_size: int) -> list[User]:
+        """Create users sharing one pre-hashed password."""
+        password_hash: str = make_password(password)
+
+        users: list[User] = []
+        for index in range(count):
+            name: str = USERNAMES[index % len(USERNAMES)]
+            if count > len(USERNAMES):
+                name = f"{name}{index // len(USERNAMES)}"
+            name += suffix
+            users.append(User(username=name, email=f"{name}@example.com", password=password_hash))
+
+        return User.objects.bulk_create(users, batch_size=batch_size)
+
+    def create_categories(self, users: list[User], batch_size: int) -> dict[int, list[int]]:
+        """Create the standard categories for every user, keyed by user id."""
+        categories: list[Category] = Category.objects.bulk_create(
+            (
+                Category(name=f"{cat_name} ({user.username})", user_id=user.pk)
+                for user in users
+                for cat_name in CATEGORY_NAMES
+            ),
+            batch_size=batch_size,
+        )
+
+        category_ids: dict[int, list[int]] = {}
+        for category in categories:
+            category_ids.setdefault(category.user_id, []).append(category.pk)
+
+        # bulk_create sends no post_save, and wiped user ids may be reused.
+        for user_id in category_ids:
+            invalidate_user_categories(user_id)
+        return category_ids
+
+    def create_expenses(
+        self,
+        users: list[User],
+        category_ids: dict[int, list[int]],
+        expenses_per_user: int,
+        months: int,
+        seed: int,
+        batch_size: int,
+        workers: int,
+    ) -> int:
+        """Generate expense rows, in parallel if requested, and insert them in batches."""
+        counts: list[int] = expense_counts_per_user(len(users), expenses_per_user, seed)
+        day_span: int = months * 30
+        start_ordinal: int = (date.today() - timedelta(days=day_span)).toordinal()
+
+        tasks: list[tuple] = [
+            (
+                seed,
+                chunk_index,
+                [
+                    (user.pk, category_ids[user.pk], counts[offset + position])
+                    for position, user in enumerate(users[offset:offset + USERS_PER_TASK])
+                ],
+                start_ordinal,
+                day_span,
+            )
+            for chunk_index, offset in enumerate(range(0, len(users), USERS_PER_TASK))
+        ]
+
+        created: int = 0
+        pending: list[Expense] = []
+        for rows in self.generate(tasks, workers):
+            for user_id, category_id, amount, date_ordinal, description in rows:
+                pending.append(
+                    Expense(
+                        user_id=user_id,
+                        category_id=category_id,
+                        amount=Decimal(amount),
+                        date=date.fromordinal(date_ordinal),
+                        description=description,
+                    )
                 )
-                budgets.append(budget)
-        self.stdout.write(self.style.SUCCESS(f"✅ Created {len(budgets)} budgets."))
+                if len(pending) >= batch_size:
+                    Expense.objects.bulk_create(pending, batch_size=batch_size)
+                    created += len(pending)
+                    pending = []
+                    self.stdout.write(f"  … {created} expenses", ending="\r")
+                    self.stdout.flush()
+
+        if pending:
+            Expense.objects.bulk_create(pending, batch_size=batch_size)
+            created += len(pending)
 
-        self.stdout.write(self.style.SUCCESS("🎉 Test data generated successfully!"))
+        return created
+
+    def generate(self, tasks: list[tuple], workers: int) -> Iterator[list[tuple]]:
+        """Yield generated rows per task, in task order."""
+        if workers <= 1:
+            yield from map(generate_expense_rows, tasks)
+            return
+
+        with Pool(processes=workers) as pool:
+            yield from pool.imap(generate_expense_rows, tasks)
+
+    def create_budgets(self, users: list[User], months: int, seed: int, batch_size: int) -> int:
+        """Create one monthly budget per user for each generated month."""
+        rng: random.Random = random.Random(f"{seed}-budgets")
+        starts: list[date] = month_starts(months, date.today())
+
+        budgets: list[Budget] = Budget.objects.bulk_create(
+            (
+                Budget(
+                    user_id=user.pk,
+                    monthly_limit=Decimal(rng.uniform(500, 2000)).quantize(Decimal("0.01")),
+                    month=month,
+                )
+                for user in users
+                for month in starts
+            ),
+            batch_size=batch_size,
+        )
+        return len(budgets)
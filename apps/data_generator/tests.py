@@ -1,3 +1,57 @@
+# Python modules
+from io import StringIO
+
+# Django modules
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+# Project modules
+from apps.auths.models import CustomUser
+from apps.budget.models import Budget
+from apps.expense.models import Expense
+
+
+class GenerateTestDataTestCase(TestCase):
+    """Checks that generate_test_data is reproducible and --append keeps data."""
+
+    OPTIONS: tuple[str, ...] = ("--users", "2", "--workers", "1", "--expenses-per-user", "10", "--months", "2")
+
+    def generate(self, *args: str) -> None:
+        call_command("generate_test_data", *self.OPTIONS, *args, stdout=StringIO())
+
+    @staticmethod
+    def snapshot() -> tuple[list[tuple], list[tuple]]:
+        """Generated expenses and budgets without their ids."""
+        expenses: list[tuple] = list(
+            Expense.objects.order_by("user__username", "date", "amount", "description", "category__name")
+            .values_list("user__username", "category__name", "amount", "date", "description")
+        )
+        budgets: list[tuple] = list(
+            Budget.objects.order_by("user__username", "month")
+            .values_list("user__username", "month", "monthly_limit")
+        )
+        return expenses, budgets
+
+    def test_seed_is_reproducible(self) -> None:
+        self.generate("--seed", "7")
+        first: tuple[list[tuple], list[tuple]] = self.snapshot()
+
+        self.generate("--seed", "7")
+
+        self.assertEqual((len(first[0]), len(first[1])), (20, 4))
+        self.assertEqual(self.snapshot(), first)
+
+        self.generate("--seed", "8")
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_append_keeps_existing_rows(self) -> None:
+        self.generate("--seed", "7")
+        existing: set[int] = set(Expense.objects.values_list("id", flat=True))
+
+        self.generate("--seed", "8", "--append")
+
+        self.assertEqual(CustomUser.objects.count(), 4)
+        self.assertTrue(CustomUser.objects.filter(username="alice.8").exists())
+        self.assertTrue(existing < set(Expense.objects.values_list("id", flat=True)))
+        self.assertEqual(Expense.objects.count(), 40)
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
@@ -1,15 +1,18 @@
 # Python modules
-from typing import Sequence
+from typing import Any, Optional, Sequence
 # Django modules
 from django.contrib.admin import register
+from django.db import transaction
+from django.http import HttpRequest
 from django.utils.html import format_html
 # Project modules
 from unfold.admin import ModelAdmin
-from .models import Expense
+from apps.abstracts.admin import SoftDeleteAdminMixin
+from .models import Expense, ExpenseMonthlyRollup
 
 
 @register(Expense)
-class ExpenseAdmin(ModelAdmin):
+class ExpenseAdmin(SoftDeleteAdminMixin, ModelAdmin):
     """
     Modern and clean admin panel for Expense using Unfold.
     """
@@ -53,3 +56,44 @@ class ExpenseAdmin(ModelAdmin):
 
     colored_amount.short_description = "Amount"
 
+    def save_model(self, request: HttpRequest, obj: Expense, form: Any, change: bool) -> None:
+        """
+        Save the expense and move it between rollup buckets, as
+        ExpenseUpdateSerializer does. Bulk deletes from the changelist go
+        through ExpenseQuerySet.delete, which maintains the rollup itself.
+        """
+        with transaction.atomic():
+            stored: Optional[Expense] = Expense.lock_live(obj.pk) if change else None
+            if stored is not None:
+                ExpenseMonthlyRollup.objects.remove_expense(stored)
+            super().save_model(request, obj, form, change)
+            if obj.deleted_at is None:
+                ExpenseMonthlyRollup.objects.add_expense(obj)
+
+
+@register(ExpenseMonthlyRollup)
+class ExpenseMonthlyRollupAdmin(ModelAdmin):
+    """
+    Read-only view of the maintained monthly expense rollup.
+    """
+
+    list_display: Sequence[str] = (
+        "user",
+        "category",
+        "month",
+        "total",
+        "count",
+    )
+    list_filter: Sequence[str] = ("month",)
+    list_select_related: Sequence[str] = ("user", "category")
+    ordering: Sequence[str] = ("-month",)
+    readonly_fields: Sequence[str] = ("user", "category", "month", "total", "count")
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: Optional[ExpenseMonthlyRollup] = None) -> bool:
+        return False
+
+    def has_delete_permission(self, request: HttpRequest, obj: Optional[ExpenseMonthlyRollup] = None) -> bool:
+        return False
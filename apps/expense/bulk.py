@@ -0,0 +1,54 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db import transaction
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+# Project modules
+from apps.expense.models import ExpenseMonthlyRollup
+
+
+def bulk_update_expenses(expenses: QuerySet, changes: dict[str, Any]) -> int:
+    """
+    Patch all selected expenses with one UPDATE and move their totals between
+    rollup buckets using a single grouped query taken before the update.
+    """
+    with transaction.atomic():
+        affects_rollup: bool = "category_id" in changes or "amount" in changes
+        if affects_rollup:
+            expenses.lock()
+        groups: list[dict[str, Any]] = (
+            list(ExpenseMonthlyRollup.objects.aggregate_expenses(expenses))
+            if affects_rollup else []
+        )
+
+        updated: int = expenses.update(updated_at=timezone.now(), **changes)
+
+        for group in groups:
+            ExpenseMonthlyRollup.objects.apply_delta(
+                group["user_id"],
+                group["category_id"],
+                group["month"],
+                -group["total"],
+                -group["count"],
+            )
+            ExpenseMonthlyRollup.objects.apply_delta(
+                group["user_id"],
+                changes.get("category_id", group["category_id"]),
+                group["month"],
+                changes["amount"] * group["count"] if "amount" in changes else group["total"],
+                group["count"],
+            )
+
+    return updated
+
+
+def bulk_delete_expenses(expenses: QuerySet) -> int:
+    """
+    Soft delete all selected expenses with one UPDATE; ExpenseQuerySet.delete
+    drops them from the rollup.
+    """
+    deleted, _ = expenses.delete()
+    return deleted
@@ -0,0 +1,68 @@
+# Python modules
+import csv
+import json
+from typing import Any, Iterable, Iterator
+
+# Django modules
+from django.db.models.query import QuerySet
+
+
+EXPORT_FIELDS: tuple[str, ...] = ("id", "date", "amount", "category_id", "description")
+EXPORT_CHUNK_SIZE: int = 2000
+EXPORT_BUFFER_SIZE: int = 64 * 1024
+
+
+class _EchoBuffer:
+    """File-like object whose write() hands the encoded line straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_export_rows(expenses: QuerySet, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[tuple[Any, ...]]:
+    """Fetch export rows in chunks without caching the queryset."""
+    return expenses.values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+
+def stream_csv(rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+    """Yield a CSV header followed by one line per row."""
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_ndjson(rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+    """Yield one JSON object per line, with amounts as strings like the API."""
+    for expense_id, expense_date, amount, category_id, description in rows:
+        yield json.dumps(
+            {
+                "id": expense_id,
+                "date": expense_date.isoformat(),
+                "amount": str(amount),
+                "category_id": category_id,
+                "description": description,
+            },
+            ensure_ascii=False,
+        ) + "\n"
+
+
+def join_chunks(lines: Iterable[str], buffer_size: int = EXPORT_BUFFER_SIZE) -> Iterator[bytes]:
+    """Group encoded lines into roughly buffer_size byte chunks to limit writes."""
+    buffer: list[bytes] = []
+    buffered: int = 0
+    for line in lines:
+        encoded: bytes = line.encode()
+        buffer.append(encoded)
+        buffered += len(encoded)
+        if buffered >= buffer_size:
+            yield b"".join(buffer)
+            buffer, buffered = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+EXPORT_FORMATS: dict[str, tuple[str, Any]] = {
+    "csv": ("text/csv", stream_csv),
+    "ndjson": ("application/x-ndjson", stream_ndjson),
+}
@@ -0,0 +1,113 @@
+# Python modules
+import csv
+import io
+from collections.abc import Mapping
+from typing import Any, Optional
+
+# Django modules
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+
+# Django REST Framework
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import Field, SkipField, empty
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.category.cache import get_owned_category_ids
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+from apps.expense.serializers import ExpenseImportRowSerializer
+
+
+IMPORT_FIELDS: tuple[str, ...] = ("date", "amount", "category_id", "description")
+
+
+def read_csv_rows(upload: UploadedFile) -> list[dict[str, Any]]:
+    """
+    Read an uploaded CSV with a header row into import rows.
+    Columns other than IMPORT_FIELDS (e.g. ``id`` from an export) are ignored
+    and empty cells are treated as missing values.
+    """
+    text: io.TextIOWrapper = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        return [
+            {
+                field: value
+                for field, value in record.items()
+                if field in IMPORT_FIELDS and value != ""
+            }
+            for record in csv.DictReader(text)
+        ]
+    except (UnicodeDecodeError, csv.Error):
+        raise ValidationError(detail={"file": ["Upload a valid UTF-8 CSV file."]})
+    finally:
+        text.detach()
+
+
+def validate_import_rows(
+    rows: list[Any],
+    user: CustomUser,
+) -> tuple[list[Expense], list[dict[str, Any]]]:
+    """
+    Validate rows field by field, then check category ownership against the
+    user's cached category ids. Returns unsaved expenses and per-row errors.
+
+    The fields of ExpenseImportRowSerializer are bound once and run directly,
+    skipping the per-row serializer machinery that dominates large imports.
+    """
+    fields: list[tuple[str, Field]] = list(ExpenseImportRowSerializer().fields.items())
+    validated_rows: list[tuple[int, dict[str, Any]]] = []
+    errors: list[dict[str, Any]] = []
+
+    for index, row in enumerate(rows):
+        if not isinstance(row, Mapping):
+            errors.append({"index": index, "errors": {"non_field_errors": ["Expected an object."]}})
+            continue
+
+        data: dict[str, Any] = {}
+        row_errors: dict[str, Any] = {}
+        for name, field in fields:
+            try:
+                data[name] = field.run_validation(row.get(name, empty))
+            except SkipField:
+                pass
+            except ValidationError as exc:
+                row_errors[name] = exc.detail
+
+        if row_errors:
+            errors.append({"index": index, "errors": row_errors})
+        else:
+            validated_rows.append((index, data))
+
+    category_ids: set[int] = {
+        data["category_id"] for _, data in validated_rows if data.get("category_id") is not None
+    }
+    owned_category_ids: set[int] = get_owned_category_ids(user.id, category_ids) if category_ids else set()
+
+    expenses: list[Expense] = []
+    for index, data in validated_rows:
+        category_id: Optional[int] = data.get("category_id")
+        if category_id is not None and category_id not in owned_category_ids:
+            errors.append({"index": index, "errors": {"category_id": ["Category does not exist."]}})
+            continue
+
+        expenses.append(
+            Expense(
+                user=user,
+                category_id=category_id,
+                amount=data["amount"],
+                date=data["date"],
+                description=data.get("description") or "",
+            )
+        )
+
+    errors.sort(key=lambda error: error["index"])
+    return expenses, errors
+
+
+def import_expenses(expenses: list[Expense], batch_size: int) -> list[Expense]:
+    """Insert validated expenses in batches and update the monthly rollup atomically."""
+    with transaction.atomic():
+        created: list[Expense] = Expense.objects.bulk_create(expenses, batch_size=batch_size)
+        ExpenseMonthlyRollup.objects.add_expenses(created)
+    return created
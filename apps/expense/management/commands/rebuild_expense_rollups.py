@@ -0,0 +1,81 @@
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+
+
+CENT = Decimal("0.01")
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify monthly expense rollups from the expense table"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare stored rollups with freshly aggregated expenses.",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Restrict to the given user id (can be repeated).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rollup rows inserted per query when rebuilding.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user_ids: Optional[list[int]] = options["user_ids"]
+
+        if options["verify"]:
+            self.verify(user_ids)
+            return
+
+        created: int = ExpenseMonthlyRollup.objects.rebuild(
+            user_ids=user_ids,
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt {created} rollup rows."))
+
+    def verify(self, user_ids: Optional[list[int]]) -> None:
+        """Report rollup rows that disagree with the expense table."""
+        expenses = Expense.objects.all()
+        rollups = ExpenseMonthlyRollup.objects.all()
+
+        if user_ids is not None:
+            expenses = expenses.filter(user_id__in=user_ids)
+            rollups = rollups.filter(user_id__in=user_ids)
+
+        expected: dict[tuple, tuple[Decimal, int]] = {
+            (group["user_id"], group["category_id"], group["month"]): (group["total"].quantize(CENT), group["count"])
+            for group in ExpenseMonthlyRollup.objects.aggregate_expenses(expenses)
+        }
+        stored: dict[tuple, tuple[Decimal, int]] = {
+            (row["user_id"], row["category_id"], row["month"]): (row["total"], row["count"])
+            for row in rollups.values("user_id", "category_id", "month", "total", "count")
+            if row["count"] or row["total"]
+        }
+
+        mismatches: int = 0
+        for key in sorted(expected.keys() | stored.keys(), key=str):
+            if expected.get(key) != stored.get(key):
+                mismatches += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"user={key[0]} category={key[1]} month={key[2]}: "
+                        f"expected {expected.get(key)}, stored {stored.get(key)}"
+                    )
+                )
+
+        if mismatches:
+            raise CommandError(f"{mismatches} rollup rows are out of date. Run without --verify to rebuild.")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(expected)} rollup rows verified."))
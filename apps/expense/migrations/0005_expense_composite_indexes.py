@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0002_rename_users_category_user'),
+        ('expense', '0004_alter_expense_category'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', '-date', '-id'], name='expense_user_date_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'category', 'date'], name='expense_user_cat_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', '-date', '-id'], name='expense_live_user_date_idx'),
+        ),
+    ]
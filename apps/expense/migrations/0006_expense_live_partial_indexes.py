@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0003_category_live_partial_index'),
+        ('expense', '0005_expense_composite_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expense_user_date_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='expense',
+            name='expense_user_cat_date_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='expense',
+            new_name='expense_user_date_id_idx',
+            old_name='expense_live_user_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', 'category', 'date'], name='expense_user_cat_date_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:53
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+
+
+def populate_rollups(apps, schema_editor):
+    Expense = apps.get_model('expense', 'Expense')
+    ExpenseMonthlyRollup = apps.get_model('expense', 'ExpenseMonthlyRollup')
+
+    groups = (
+        Expense.objects
+        .filter(deleted_at__isnull=True)
+        .annotate(month=TruncMonth('date'))
+        .values('user_id', 'category_id', 'month')
+        .annotate(total=models.Sum('amount'), count=models.Count('id'))
+        .order_by()
+    )
+    ExpenseMonthlyRollup.objects.bulk_create(
+        (ExpenseMonthlyRollup(**group) for group in groups),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0003_category_live_partial_index'),
+        ('expense', '0006_expense_live_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExpenseMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=16)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='expense_rollups', to='category.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='expense_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'month'], name='expense_rollup_user_month_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('category__isnull', False)), fields=('user', 'category', 'month'), name='expense_rollup_user_cat_month_uniq'), models.UniqueConstraint(condition=models.Q(('category__isnull', True)), fields=('user', 'month'), name='expense_rollup_user_month_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
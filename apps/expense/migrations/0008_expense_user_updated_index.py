@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category', '0004_category_user_updated_index'),
+        ('expense', '0007_expense_monthly_rollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'updated_at', 'deleted_at'], name='expense_user_updated_idx'),
+        ),
+    ]
@@ -1,19 +1,85 @@
+# Python modules
+from datetime import date
+from decimal import Decimal
+from functools import partial
+from typing import Any, Iterable, Optional
+
 # Django modules
+from django.db import IntegrityError, transaction
 from django.db.models import (
     CASCADE,
     PROTECT,
+    Count,
     DateField,
     DecimalField,
+    F,
     ForeignKey,
+    Index,
+    Manager,
+    Model,
+    PositiveIntegerField,
+    Q,
+    Sum,
     TextField,
+    UniqueConstraint,
 )
+from django.db.models.functions import TruncMonth
+from django.db.models.query import QuerySet
 
 # Project modules
 from apps.auths.models import CustomUser
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import (
+    AbstractBaseModel,
+    AllObjectsManager,
+    SoftDeleteManager,
+    SoftDeleteQuerySet,
+)
 from apps.category.models import Category
 
 
+class ExpenseQuerySet(SoftDeleteQuerySet):
+    """
+    SoftDeleteQuerySet whose bulk deletes also take the deleted rows out of
+    the monthly rollup, so admin actions and ad hoc queryset deletes keep
+    it in step.
+    """
+
+    def lock(self) -> int:
+        """
+        Lock the selected rows for the rest of the transaction with a no-op
+        UPDATE, like Expense.lock_live, so totals read next cannot be changed
+        or deleted by a concurrent write before they are applied.
+        """
+        return self.update(updated_at=F("updated_at"))
+
+    def delete(self) -> tuple[int, dict[str, int]]:  # type: ignore
+        """
+        Soft delete the matched live rows in one UPDATE and subtract them
+        from the rollup with one grouped query taken before the update.
+        """
+        with transaction.atomic():
+            groups: list[dict[str, Any]] = self._lock_live_groups()
+            deleted: tuple[int, dict[str, int]] = super().delete()
+            ExpenseMonthlyRollup.objects.apply_groups(groups, sign=-1)
+        return deleted
+
+    def hard_delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Permanently delete all matched rows, subtracting the live ones from
+        the rollup.
+        """
+        with transaction.atomic():
+            groups: list[dict[str, Any]] = self._lock_live_groups()
+            deleted: tuple[int, dict[str, int]] = super().hard_delete()
+            ExpenseMonthlyRollup.objects.apply_groups(groups, sign=-1)
+        return deleted
+
+    def _lock_live_groups(self) -> list[dict[str, Any]]:
+        live: ExpenseQuerySet = self.filter(deleted_at__isnull=True)
+        live.lock()
+        return list(ExpenseMonthlyRollup.objects.aggregate_expenses(live))
+
+
 class Expense(AbstractBaseModel):
     """
     Model representing an expense entry.
@@ -41,5 +107,238 @@ class Expense(AbstractBaseModel):
     )
     date = DateField()
 
+    objects = SoftDeleteManager.from_queryset(ExpenseQuerySet)()
+    all_with_deleted = AllObjectsManager.from_queryset(ExpenseQuerySet)()
+
+    class Meta:
+        """Meta class for Expense."""
+
+        indexes = [
+            # list_expenses: user filter + (date, id) ordering and keyset cursor
+            Index(
+                fields=["user", "-date", "-id"],
+                condition=Q(deleted_at__isnull=True),
+                name="expense_user_date_id_idx",
+            ),
+            # list_expenses: user + category filter with date range
+            Index(
+                fields=["user", "category", "date"],
+                condition=Q(deleted_at__isnull=True),
+                name="expense_user_cat_date_idx",
+            ),
+            # conditional GET validators: max(updated_at) and live count per user
+            Index(
+                fields=["user", "updated_at", "deleted_at"],
+                name="expense_user_updated_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.users} - {self.amount} on {self.date}"
+
+    @classmethod
+    def lock_live(cls, pk: int) -> Optional["Expense"]:
+        """
+        Lock a live expense for the rest of the current transaction and
+        return it as stored, or None when it is gone or soft deleted.
+
+        The lock is a no-op UPDATE rather than SELECT ... FOR UPDATE so
+        SQLite, which has no row locks, also serializes concurrent writers
+        here instead of letting both act on the same stale row.
+        """
+        if not cls.objects.filter(pk=pk).update(updated_at=F("updated_at")):
+            return None
+        return cls.objects.get(pk=pk)
+
+    def delete(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:  # type: ignore
+        """
+        Soft delete the expense and take its stored values out of the
+        monthly rollup. Deleting an expense that is already deleted, even
+        by a concurrent request, changes nothing.
+        """
+        with transaction.atomic():
+            stored: Optional[Expense] = Expense.lock_live(self.pk)
+            if stored is None:
+                return
+
+            super().delete(*args, **kwargs)
+            ExpenseMonthlyRollup.objects.remove_expense(stored)
+
+
+class ExpenseMonthlyRollupManager(Manager):
+    """Manager maintaining per-user, per-category monthly expense totals."""
+
+    def apply_delta(
+        self,
+        user_id: int,
+        category_id: Optional[int],
+        month: date,
+        total: Decimal,
+        count: int,
+    ) -> None:
+        """
+        Add the given total and count to a single rollup row, creating it if
+        needed.
+
+        A negative delta the row cannot absorb (no row, or a count lower
+        than the one removed) means the bucket drifted, e.g. through rows
+        written with a plain save(). Instead of failing the request, the
+        user's rollups are rebuilt from the expense table once the
+        transaction commits.
+        """
+        lookup: dict[str, Any] = {
+            "user_id": user_id,
+            "category_id": category_id,
+            "month": month.replace(day=1),
+        }
+
+        rows: QuerySet = self.filter(**lookup)
+        if count < 0:
+            rows = rows.filter(count__gte=-count)
+        updated: int = rows.update(
+            total=F("total") + total,
+            count=F("count") + count,
+        )
+        if updated:
+            return
+
+        if count < 0:
+            transaction.on_commit(partial(self.rebuild, user_ids=[user_id]))
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(total=total, count=count, **lookup)
+        except IntegrityError:
+            # Another writer created the row first; fold into it instead.
+            if not self.filter(**lookup).update(
+                total=F("total") + total,
+                count=F("count") + count,
+            ):
+                raise
+
+    def add_expense(self, expense: Expense) -> None:
+        """Account for a newly stored expense."""
+        self.apply_delta(expense.user_id, expense.category_id, expense.date, expense.amount, 1)
+
+    def remove_expense(self, expense: Expense) -> None:
+        """Take an expense with its current field values out of the rollup."""
+        self.apply_delta(expense.user_id, expense.category_id, expense.date, -expense.amount, -1)
+
+    def add_expenses(self, expenses: Iterable[Expense]) -> None:
+        """Account for many in-memory expenses, one delta per (user, category, month)."""
+        groups: dict[tuple[int, Optional[int], date], list[Any]] = {}
+        for expense in expenses:
+            key = (expense.user_id, expense.category_id, expense.date.replace(day=1))
+            group: list[Any] = groups.setdefault(key, [Decimal("0"), 0])
+            group[0] += expense.amount
+            group[1] += 1
+
+        for (user_id, category_id, month), (total, count) in groups.items():
+            self.apply_delta(user_id, category_id, month, total, count)
+
+    def aggregate_expenses(self, expenses: QuerySet) -> QuerySet:
+        """Group expenses into (user, category, month) totals with one query."""
+        return (
+            expenses
+            .annotate(month=TruncMonth("date"))
+            .values("user_id", "category_id", "month")
+            .annotate(total=Sum("amount"), count=Count("id"))
+            .order_by()
+        )
+
+    def apply_expenses(self, expenses: QuerySet, sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) a whole queryset of expenses."""
+        self.apply_groups(self.aggregate_expenses(expenses), sign)
+
+    def apply_groups(self, groups: Iterable[dict[str, Any]], sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) totals from aggregate_expenses."""
+        for group in groups:
+            self.apply_delta(
+                group["user_id"],
+                group["category_id"],
+                group["month"],
+                group["total"] * sign,
+                group["count"] * sign,
+            )
+
+    def rebuild(self, user_ids: Optional[Iterable[int]] = None, batch_size: int = 1000) -> int:
+        """Recompute rollups from live expenses, replacing the stored rows."""
+        expenses: QuerySet = Expense.objects.all()
+        rollups: QuerySet = self.all()
+
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            expenses = expenses.filter(user_id__in=user_ids)
+            rollups = rollups.filter(user_id__in=user_ids)
+
+        with transaction.atomic():
+            rollups.delete()
+            created: list[ExpenseMonthlyRollup] = self.bulk_create(
+                (
+                    self.model(
+                        user_id=group["user_id"],
+                        category_id=group["category_id"],
+                        month=group["month"],
+                        total=group["total"],
+                        count=group["count"],
+                    )
+                    for group in self.aggregate_expenses(expenses)
+                ),
+                batch_size=batch_size,
+            )
+
+        return len(created)
+
+
+class ExpenseMonthlyRollup(Model):
+    """
+    Running total and count of live expenses per user, category and month.
+    """
+
+    user = ForeignKey(
+        to=CustomUser,
+        on_delete=CASCADE,
+        related_name="expense_rollups",
+    )
+    category = ForeignKey(
+        to=Category,
+        on_delete=CASCADE,
+        related_name="expense_rollups",
+        null=True,
+        blank=True,
+    )
+    month = DateField()
+    total = DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        default=Decimal("0"),
+    )
+    count = PositiveIntegerField(default=0)
+
+    objects = ExpenseMonthlyRollupManager()
+
+    class Meta:
+        """Meta class for ExpenseMonthlyRollup."""
+
+        constraints = [
+            UniqueConstraint(
+                fields=["user", "category", "month"],
+                condition=Q(category__isnull=False),
+                name="expense_rollup_user_cat_month_uniq",
+            ),
+            UniqueConstraint(
+                fields=["user", "month"],
+                condition=Q(category__isnull=True),
+                name="expense_rollup_user_month_uniq",
+            ),
+        ]
+        indexes = [
+            Index(
+                fields=["user", "month"],
+                name="expense_rollup_user_month_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.total} in {self.month.strftime('%B %Y')}"
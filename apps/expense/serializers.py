@@ -1,6 +1,22 @@
-from rest_framework.serializers import ModelSerializer, IntegerField, ValidationError
-from apps.expense.models import Expense
-from apps.category.models import Category
+from typing import Optional
+
+from rest_framework.serializers import (
+    ModelSerializer,
+    Serializer,
+    CharField,
+    ChoiceField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    IntegerField,
+    ListField,
+    ValidationError,
+)
+from django.db import transaction
+
+from apps.abstracts.serializers import TombstoneSerializer, ValuesSerializer
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+from apps.category.cache import get_owned_category_ids
 
 class ExpenseBaseSerializer(ModelSerializer):
     """
@@ -18,6 +34,9 @@ class ExpenseListSerializer(ExpenseBaseSerializer):
     """
     pass
 
+# Same output as ExpenseListSerializer, read straight from values_list() rows.
+expense_list_values: ValuesSerializer = ValuesSerializer(ExpenseListSerializer)
+
 class ExpenseCreateSerializer(ExpenseBaseSerializer):
     category_id = IntegerField(write_only=True, required=False, allow_null=True)
 
@@ -28,22 +47,205 @@ class ExpenseCreateSerializer(ExpenseBaseSerializer):
             return None
 
         request = self.context.get('request')
-        if not Category.objects.filter(id=value, user=request.user).exists():
+        if value not in get_owned_category_ids(request.user.id, [value]):
             raise ValidationError("Category does not exist.")
         return value
 
     def create(self, validated_data: dict) -> Expense:
         user = self.context['request'].user
-        
-        return Expense.objects.create(
-            user=user, 
-            **validated_data
-        )
+
+        with transaction.atomic():
+            expense: Expense = Expense.objects.create(
+                user=user, 
+                **validated_data
+            )
+            ExpenseMonthlyRollup.objects.add_expense(expense)
+
+        return expense
 
 class ExpenseUpdateSerializer(ExpenseBaseSerializer):
     """Serializer for updating Expense instances"""
     def validate_category_id(self, value: int) -> int:
         request = self.context.get('request')
-        if not Category.objects.filter(id=value, user=request.user).exists():
+        if value not in get_owned_category_ids(request.user.id, [value]):
             raise ValidationError("Category does not exist.")
-        return value
\ No newline at end of file
+        return value
+
+    def update(self, instance: Expense, validated_data: dict) -> Expense:
+        """
+        Update the expense and move its amount between rollup buckets.
+        The row is locked and re-read first, so the rollup moves the stored
+        values and a concurrently deleted expense is not brought back;
+        raises Expense.DoesNotExist in that case.
+        """
+        with transaction.atomic():
+            stored: Optional[Expense] = Expense.lock_live(instance.pk)
+            if stored is None:
+                raise Expense.DoesNotExist("Expense not found.")
+
+            ExpenseMonthlyRollup.objects.remove_expense(stored)
+            expense: Expense = super().update(stored, validated_data)
+            ExpenseMonthlyRollup.objects.add_expense(expense)
+
+        return expense
+
+
+class ExpenseImportRowSerializer(Serializer):
+    """Serializer for validating a single imported expense row."""
+
+    amount = DecimalField(max_digits=10, decimal_places=2)
+    date = DateField()
+    description = CharField(required=False, allow_blank=True, allow_null=True)
+    category_id = IntegerField(required=False, allow_null=True)
+
+
+class ExpenseImportQuerySerializer(Serializer):
+    """Serializer for validating bulk import options."""
+
+    batch_size = IntegerField(required=False, min_value=1, max_value=10_000)
+
+
+class ExpenseFilterSerializer(Serializer):
+    """Serializer for the list_expenses filters passed in a request body or query string."""
+
+    date_from = DateField(required=False)
+    date_to = DateField(required=False)
+    category_id = IntegerField(required=False)
+    min_amount = DecimalField(max_digits=10, decimal_places=2, required=False)
+    max_amount = DecimalField(max_digits=10, decimal_places=2, required=False)
+
+
+class ExpenseBulkSelectionSerializer(Serializer):
+    """Serializer selecting expenses either by ids or by list filters."""
+
+    MAX_IDS = 1000
+
+    ids = ListField(
+        child=IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_IDS,
+    )
+    filters = ExpenseFilterSerializer(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if ("ids" in attrs) == ("filters" in attrs):
+            raise ValidationError("Provide either 'ids' or 'filters'.")
+        if "filters" in attrs and not attrs["filters"]:
+            raise ValidationError({"filters": ["Provide at least one filter."]})
+        return attrs
+
+
+class ExpenseBulkChangesSerializer(Serializer):
+    """Serializer for the fields a bulk update may patch."""
+
+    category_id = IntegerField(required=False, allow_null=True)
+    amount = DecimalField(max_digits=10, decimal_places=2, required=False)
+    description = CharField(required=False, allow_blank=True)
+
+    def validate_category_id(self, value: int | None) -> int | None:
+        """Validate that the category exists."""
+
+        if value is None:
+            return None
+
+        request = self.context.get('request')
+        if value not in get_owned_category_ids(request.user.id, [value]):
+            raise ValidationError("Category does not exist.")
+        return value
+
+    def validate(self, attrs: dict) -> dict:
+        if not attrs:
+            raise ValidationError("Provide at least one field to change.")
+        return attrs
+
+
+class ExpenseBulkUpdateSerializer(ExpenseBulkSelectionSerializer):
+    """Serializer for bulk updating expenses."""
+
+    changes = ExpenseBulkChangesSerializer()
+
+
+class ExpenseSyncRowSerializer(ModelSerializer):
+    """Serializer for expenses returned by the delta sync."""
+
+    category_id = IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Expense
+        fields = ('id', 'amount', 'description', 'date', 'category_id', 'created_at', 'updated_at')
+
+
+class ExpenseSyncSerializer(Serializer):
+    """Serializer for the expense delta sync response."""
+
+    watermark = DateTimeField(allow_null=True)
+    next = CharField(allow_null=True)
+    changed = ExpenseSyncRowSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+
+
+class ExpenseSummaryQuerySerializer(ExpenseFilterSerializer):
+    """Serializer for validating the summary filters and grouping parameter."""
+
+    PERIOD_CHOICES = ("day", "week", "month")
+
+    period = ChoiceField(choices=PERIOD_CHOICES, default="month")
+
+
+class ExpenseExportQuerySerializer(ExpenseFilterSerializer):
+    """Serializer for validating the export filters and format parameter."""
+
+    EXPORT_FORMAT_CHOICES = ("csv", "ndjson")
+
+    export_format = ChoiceField(choices=EXPORT_FORMAT_CHOICES, default="csv")
+
+
+class ExpenseSummaryStatsSerializer(Serializer):
+    """Aggregated statistics over a group of expenses."""
+
+    total = DecimalField(max_digits=16, decimal_places=2)
+    count = IntegerField()
+    average = DecimalField(max_digits=16, decimal_places=2, allow_null=True)
+    min = DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    max = DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+
+
+class ExpenseCategorySummarySerializer(ExpenseSummaryStatsSerializer):
+    """Aggregated statistics for a single category."""
+
+    category_id = IntegerField(allow_null=True)
+    category_name = CharField(allow_null=True)
+
+
+class ExpensePeriodSummarySerializer(ExpenseSummaryStatsSerializer):
+    """Aggregated statistics for a single day, week or month."""
+
+    period_start = DateField()
+
+
+class ExpenseSummarySerializer(Serializer):
+    """Serializer for the expense summary response."""
+
+    period = CharField()
+    overall = ExpenseSummaryStatsSerializer()
+    by_category = ExpenseCategorySummarySerializer(many=True)
+    by_period = ExpensePeriodSummarySerializer(many=True)
+
+
+class ExpenseMonthlyQuerySerializer(Serializer):
+    """Serializer for validating monthly rollup filters."""
+
+    date_from = DateField(required=False)
+    date_to = DateField(required=False)
+    category_id = IntegerField(required=False)
+
+
+class ExpenseMonthlyRollupSerializer(ModelSerializer):
+    """Serializer for monthly per-category expense totals."""
+
+    category_id = IntegerField(allow_null=True)
+
+    class Meta:
+        model = ExpenseMonthlyRollup
+        fields = ('month', 'category_id', 'total', 'count')
@@ -0,0 +1,104 @@
+# Python modules
+from decimal import Decimal
+from typing import Any, Optional
+
+# Django modules
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.db.models.query import QuerySet
+
+
+PERIOD_TRUNCATORS: dict[str, type] = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+
+def _empty_stats() -> dict[str, Any]:
+    """Return a fresh accumulator for aggregated statistics."""
+    return {
+        "total": Decimal("0"),
+        "count": 0,
+        "min": None,
+        "max": None,
+    }
+
+
+def _accumulate(stats: dict[str, Any], row: dict[str, Any]) -> None:
+    """Merge one grouped row into an accumulator."""
+    stats["total"] += row["total"]
+    stats["count"] += row["count"]
+    stats["min"] = row["min"] if stats["min"] is None else min(stats["min"], row["min"])
+    stats["max"] = row["max"] if stats["max"] is None else max(stats["max"], row["max"])
+
+
+def _finalize(stats: dict[str, Any]) -> dict[str, Any]:
+    """Derive the average once all rows have been merged."""
+    count: int = stats["count"]
+    stats["average"] = stats["total"] / count if count else None
+    return stats
+
+
+def summarize_expenses(expenses: QuerySet, period: str) -> dict[str, Any]:
+    """
+    Summarize expenses by category and by day/week/month.
+
+    Runs a single query grouped by (category, period) and folds the result
+    into overall, per-category and per-period totals, counts, averages and
+    min/max in Python; the grid is at most categories x periods rows.
+    """
+    truncator: type = PERIOD_TRUNCATORS[period]
+
+    rows: QuerySet = (
+        expenses
+        .annotate(period_start=truncator("date"))
+        .values("category_id", "category__name", "period_start")
+        .annotate(
+            total=Sum("amount"),
+            count=Count("id"),
+            min=Min("amount"),
+            max=Max("amount"),
+        )
+        .order_by()
+    )
+
+    overall: dict[str, Any] = _empty_stats()
+    by_category: dict[Optional[int], dict[str, Any]] = {}
+    by_period: dict[Any, dict[str, Any]] = {}
+
+    for row in rows:
+        _accumulate(overall, row)
+
+        category_stats: dict[str, Any] = by_category.setdefault(
+            row["category_id"],
+            {
+                "category_id": row["category_id"],
+                "category_name": row["category__name"],
+                **_empty_stats(),
+            },
+        )
+        _accumulate(category_stats, row)
+
+        period_stats: dict[str, Any] = by_period.setdefault(
+            row["period_start"],
+            {
+                "period_start": row["period_start"],
+                **_empty_stats(),
+            },
+        )
+        _accumulate(period_stats, row)
+
+    return {
+        "period": period,
+        "overall": _finalize(overall),
+        "by_category": sorted(
+            (_finalize(stats) for stats in by_category.values()),
+            key=lambda stats: stats["total"],
+            reverse=True,
+        ),
+        "by_period": sorted(
+            (_finalize(stats) for stats in by_period.values()),
+            key=lambda stats: stats["period_start"],
+        ),
+    }
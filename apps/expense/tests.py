@@ -0,0 +1,1025 @@
+# Python modules
+import csv
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+from typing import Optional
+from unittest import skipUnless
+
+# Django modules
+from asgiref.sync import sync_to_async
+from django.contrib.admin import site
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
+from django.test import AsyncClient, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.conditional import CollectionValidators
+from apps.abstracts.routers import ais_pinned_to_primary
+from apps.abstracts.sync import SyncCursor
+from apps.abstracts.testing import QueryBudgetMixin
+from apps.auths.authentication import ClaimsRefreshToken
+from apps.auths.models import CustomUser
+from apps.category.models import Category
+from apps.expense.admin import ExpenseAdmin, ExpenseMonthlyRollupAdmin
+from apps.expense.exports import join_chunks
+from apps.expense.imports import read_csv_rows
+from apps.expense.models import Expense, ExpenseMonthlyRollup
+from apps.expense.serializers import ExpenseUpdateSerializer
+from apps.expense.summaries import summarize_expenses
+from apps.expense.views import filter_expenses
+
+
+@skipUnless(connection.vendor == "sqlite", "Query plan assertions are SQLite-specific.")
+class ExpenseIndexUsageTestCase(TestCase):
+    """
+    Checks that the list_expenses filter combinations are served by the
+    composite indexes instead of sorting the user's full history.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users: list[CustomUser] = [
+            CustomUser.objects.create_user(
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                password="StrongPass123!",
+            )
+            for i in range(3)
+        ]
+        cls.categories: list[Category] = [
+            Category.objects.create(name=f"Category {user.pk}-{i}", user=user)
+            for user in cls.users
+            for i in range(3)
+        ]
+        start: date = date(2024, 1, 1)
+        Expense.objects.bulk_create(
+            Expense(
+                user=category.user,
+                category=category,
+                amount=Decimal(i % 200) + Decimal("0.99"),
+                date=start + timedelta(days=i % 365),
+            )
+            for category in cls.categories
+            for i in range(200)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def assert_uses_index(self, queryset: QuerySet, index_name: str) -> None:
+        """Assert that the query plan reads through the given index without a sort step."""
+        plan: str = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_user_list_ordered_by_date(self) -> None:
+        queryset: QuerySet = Expense.objects.filter(user=self.users[0]).order_by("-date", "-id")
+        self.assert_uses_index(queryset, "expense_user_date_id_idx")
+
+    def test_user_date_range(self) -> None:
+        queryset: QuerySet = Expense.objects.filter(
+            user=self.users[0],
+            date__gte=date(2024, 3, 1),
+            date__lte=date(2024, 6, 1),
+        ).order_by("-date", "-id")
+        self.assert_uses_index(queryset, "expense_user_date_id_idx")
+
+    def test_user_date_range_with_amount_bounds(self) -> None:
+        queryset: QuerySet = Expense.objects.filter(
+            user=self.users[0],
+            date__gte=date(2024, 3, 1),
+            amount__gte=Decimal("10"),
+            amount__lte=Decimal("100"),
+        ).order_by("-date", "-id")
+        self.assert_uses_index(queryset, "expense_user_date_id_idx")
+
+    def test_user_category_date_range(self) -> None:
+        # The list_expenses query itself: the rowid tie-breaker keeps the
+        # (user, category, date) index in (-date, -id) order, so no sort.
+        queryset: QuerySet = filter_expenses(
+            Expense.objects.filter(user=self.users[0]),
+            {"category_id": str(self.categories[0].pk), "date_from": "2024-03-01"},
+        ).order_by("-date", "-id")
+        self.assert_uses_index(queryset, "expense_user_cat_date_idx")
+
+    def test_collection_validators(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            CollectionValidators.for_queryset(Expense.all_with_deleted.filter(user=self.users[0]))
+        self.assertEqual(len(queries), 1)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {queries[0]['sql']}")
+            plan: str = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("COVERING INDEX expense_user_updated_idx", plan)
+
+
+class ExpenseSummaryTestCase(TestCase):
+    """Checks the folded summary totals against plain aggregates."""
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="summary@example.com",
+            username="summary",
+            password="StrongPass123!",
+        )
+        categories: list[Optional[Category]] = [
+            Category.objects.create(user=self.user, name="Food"),
+            Category.objects.create(user=self.user, name="Travel"),
+            None,
+        ]
+        for index in range(18):
+            Expense.objects.create(
+                user=self.user,
+                category=categories[index % 3],
+                amount=Decimal(index * 7 % 50) + Decimal("0.25"),
+                date=date(2024, 1 + index % 3, 1 + index),
+            )
+        deleted: Expense = Expense.objects.create(
+            user=self.user, category=categories[0], amount=Decimal("999.00"), date=date(2024, 1, 5)
+        )
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        deleted.delete()
+
+    @staticmethod
+    def stats(row: dict) -> tuple:
+        return row["total"], row["count"], row["min"], row["max"]
+
+    def test_totals_match_plain_aggregates(self) -> None:
+        expenses: QuerySet = Expense.objects.filter(user=self.user)
+        summary: dict = summarize_expenses(expenses, "month")
+        aggregates: dict = {"total": Sum("amount"), "count": Count("id"), "min": Min("amount"), "max": Max("amount")}
+
+        self.assertEqual(self.stats(summary["overall"]), self.stats(expenses.aggregate(**aggregates)))
+
+        by_category: dict = {
+            row["category_id"]: self.stats(row)
+            for row in expenses.values("category_id").annotate(**aggregates).order_by()
+        }
+        self.assertEqual({row["category_id"]: self.stats(row) for row in summary["by_category"]}, by_category)
+        self.assertEqual(len(by_category), 3)
+
+        by_period: dict = {
+            row["month"]: self.stats(row)
+            for row in expenses.annotate(month=TruncMonth("date")).values("month").annotate(**aggregates).order_by()
+        }
+        self.assertEqual({row["period_start"]: self.stats(row) for row in summary["by_period"]}, by_period)
+        self.assertEqual(len(by_period), 3)
+
+    def test_endpoint_excludes_deleted_rows(self) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get("/api/expense-tracker/v1/expenses/summary", {"period": "month"})
+
+        self.assertEqual(response.status_code, 200)
+        total: Decimal = Expense.objects.filter(user=self.user).aggregate(total=Sum("amount"))["total"]
+        self.assertEqual(Decimal(response.json()["overall"]["total"]), total)
+        self.assertEqual(response.json()["overall"]["count"], 18)
+
+    def test_endpoint_validates_filters(self) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(self.user)
+        url: str = "/api/expense-tracker/v1/expenses/summary"
+
+        response = client.get(url, {"date_from": "2024-02-01", "min_amount": "10"})
+        self.assertEqual(response.status_code, 200)
+        expected: QuerySet = Expense.objects.filter(user=self.user, date__gte=date(2024, 2, 1), amount__gte=10)
+        self.assertEqual(response.json()["overall"]["count"], expected.count())
+
+        for params in ({"date_from": "bad"}, {"date_to": "2024-13-01"}, {"min_amount": "abc"}, {"category_id": "x"}):
+            response = client.get(url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertEqual(list(response.json()), list(params))
+
+
+class ExpenseRollupTestCase(TestCase):
+    """Checks that writes keep the monthly rollups equal to the expense table."""
+
+    url: str = "/api/expense-tracker/v1/expenses"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="rollup@example.com",
+            username="rollup",
+            password="StrongPass123!",
+        )
+        self.food: Category = Category.objects.create(user=self.user, name="Food")
+        self.travel: Category = Category.objects.create(user=self.user, name="Travel")
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def rollups(self) -> dict:
+        return {
+            (row.category_id, row.month): (row.total, row.count)
+            for row in ExpenseMonthlyRollup.objects.filter(user=self.user)
+            if row.count
+        }
+
+    def create(self, amount: str, day: date, category: Optional[Category] = None) -> int:
+        response = self.client.post(
+            f"{self.url}/create",
+            {"amount": amount, "date": day.isoformat(), "category_id": category.pk if category else None},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()["id"]
+
+    def test_create_update_delete(self) -> None:
+        january, february = date(2024, 1, 1), date(2024, 2, 1)
+        first: int = self.create("10.00", date(2024, 1, 10), self.food)
+        second: int = self.create("5.50", date(2024, 1, 20), self.food)
+        self.create("2.00", date(2024, 1, 21))
+        self.assertEqual(
+            self.rollups(),
+            {(self.food.pk, january): (Decimal("15.50"), 2), (None, january): (Decimal("2.00"), 1)},
+        )
+
+        response = self.client.put(
+            f"{self.url}/{first}/update",
+            {"amount": "12.00", "date": "2024-02-03", "category_id": self.travel.pk},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            self.rollups(),
+            {
+                (self.food.pk, january): (Decimal("5.50"), 1),
+                (self.travel.pk, february): (Decimal("12.00"), 1),
+                (None, january): (Decimal("2.00"), 1),
+            },
+        )
+
+        self.assertEqual(self.client.delete(f"{self.url}/{second}/delete").status_code, 200)
+        self.assertEqual(
+            self.rollups(),
+            {(self.travel.pk, february): (Decimal("12.00"), 1), (None, january): (Decimal("2.00"), 1)},
+        )
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_stale_instances_do_not_double_count(self) -> None:
+        expense: Expense = Expense.objects.get(pk=self.create("10.00", date(2024, 1, 10), self.food))
+        stale_copy: Expense = Expense.objects.get(pk=expense.pk)
+
+        # An update races a delete: the update lands first, then the delete
+        # must remove the stored amount, not its stale copy.
+        response = self.client.put(
+            f"{self.url}/{expense.pk}/update",
+            {"amount": "4.00", "date": "2024-03-01", "category_id": self.travel.pk},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        stale_copy.delete()
+        self.assertEqual(self.rollups(), {})
+
+        # A second delete of the same row changes nothing.
+        expense.delete()
+        self.assertEqual(self.rollups(), {})
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_update_does_not_resurrect_deleted_expense(self) -> None:
+        expense_id: int = self.create("10.00", date(2024, 1, 10), self.food)
+        stale_copy: Expense = Expense.objects.get(pk=expense_id)
+        Expense.objects.get(pk=expense_id).delete()
+
+        serializer: ExpenseUpdateSerializer = ExpenseUpdateSerializer(
+            stale_copy,
+            data={"amount": "1.00", "date": "2024-01-11", "category_id": self.food.pk},
+            context={"request": type("Request", (), {"user": self.user})()},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(Expense.DoesNotExist):
+            serializer.save()
+
+        self.assertIsNotNone(Expense.all_with_deleted.get(pk=expense_id).deleted_at)
+        self.assertEqual(self.rollups(), {})
+
+    def test_drifted_bucket_is_rebuilt(self) -> None:
+        kept: int = self.create("10.00", date(2024, 1, 10), self.food)
+        # Written without the rollup, so its bucket cannot absorb the delete.
+        stray: Expense = Expense.objects.create(
+            user=self.user, category=self.travel, amount=Decimal("4.00"), date=date(2024, 1, 12)
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"{self.url}/{stray.pk}/delete")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.rollups(), {(self.food.pk, date(2024, 1, 1)): (Decimal("10.00"), 1)})
+        self.assertTrue(Expense.objects.filter(pk=kept).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExpenseMonthlyRollup.objects.apply_delta(self.user.pk, self.food.pk, date(2024, 1, 1), Decimal("-1"), -2)
+        self.assertEqual(self.rollups(), {(self.food.pk, date(2024, 1, 1)): (Decimal("10.00"), 1)})
+
+    def test_queryset_delete_updates_rollup(self) -> None:
+        self.create("10.00", date(2024, 1, 10), self.food)
+        self.create("5.00", date(2024, 1, 11), self.food)
+        self.create("2.00", date(2024, 2, 1))
+        Expense.objects.filter(user=self.user, amount=Decimal("5.00")).delete()
+        self.assertEqual(
+            self.rollups(),
+            {(self.food.pk, date(2024, 1, 1)): (Decimal("10.00"), 1), (None, date(2024, 2, 1)): (Decimal("2.00"), 1)},
+        )
+
+        Expense.all_with_deleted.filter(user=self.user).hard_delete()
+        self.assertEqual(self.rollups(), {})
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_admin_keeps_rollup(self) -> None:
+        expense_admin: ExpenseAdmin = site._registry[Expense]
+        request: HttpRequest = RequestFactory().post("/")
+        request.user = self.user
+
+        # Added into an empty bucket, then deleted through the API.
+        added: Expense = Expense(user=self.user, category=self.food, amount=Decimal("8.00"), date=date(2024, 3, 3))
+        expense_admin.save_model(request, added, None, False)
+        self.assertEqual(self.rollups(), {(self.food.pk, date(2024, 3, 1)): (Decimal("8.00"), 1)})
+
+        changed: Expense = Expense.objects.get(pk=added.pk)
+        changed.amount, changed.category = Decimal("6.00"), self.travel
+        expense_admin.save_model(request, changed, None, True)
+        self.assertEqual(self.rollups(), {(self.travel.pk, date(2024, 3, 1)): (Decimal("6.00"), 1)})
+        self.assertEqual(self.client.delete(f"{self.url}/{added.pk}/delete").status_code, 200)
+        self.assertEqual(self.rollups(), {})
+
+        self.create("1.00", date(2024, 4, 1), self.food)
+        self.create("2.00", date(2024, 4, 2))
+        expense_admin.delete_queryset(request, expense_admin.get_queryset(request).filter(user=self.user))
+        self.assertEqual(self.rollups(), {})
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_rollup_admin_is_read_only(self) -> None:
+        rollup_admin: ExpenseMonthlyRollupAdmin = site._registry[ExpenseMonthlyRollup]
+        request: HttpRequest = RequestFactory().get("/")
+        request.user = CustomUser.objects.create_superuser(
+            email="rollup-admin@example.com",
+            username="rollup-admin",
+            password="StrongPass123!",
+        )
+
+        self.assertFalse(rollup_admin.has_add_permission(request))
+        self.assertFalse(rollup_admin.has_change_permission(request))
+        self.assertFalse(rollup_admin.has_delete_permission(request))
+        self.assertTrue(rollup_admin.has_view_permission(request))
+
+    def test_rebuild_and_verify_command(self) -> None:
+        self.create("10.00", date(2024, 1, 10), self.food)
+        self.create("3.00", date(2024, 2, 10))
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+        ExpenseMonthlyRollup.objects.filter(user=self.user, category=self.food).update(total=Decimal("1.00"))
+        with self.assertRaisesMessage(CommandError, "1 rollup rows are out of date"):
+            call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+        output: StringIO = StringIO()
+        call_command("rebuild_expense_rollups", "--user", str(self.user.pk), stdout=output)
+        self.assertIn("Rebuilt 2 rollup rows", output.getvalue())
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+
+class ExpenseConditionalGetTestCase(TestCase):
+    """Checks ETag / Last-Modified revalidation of list_expenses."""
+
+    url: str = "/api/expense-tracker/v1/expenses/list"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="conditional@example.com",
+            username="conditional",
+            password="StrongPass123!",
+        )
+        self.expenses: list[Expense] = [
+            Expense.objects.create(user=self.user, amount=Decimal("10.00"), date=date(2024, 1, day))
+            for day in range(1, 4)
+        ]
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_collection_returns_304_with_one_query(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_soft_delete_changes_etag(self) -> None:
+        etag: str = self.client.get(self.url)["ETag"]
+
+        self.expenses[0].delete()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.json()), 2)
+
+
+@override_settings(SYNC_WATERMARK_LAG_SECONDS=0)
+class ExpenseSyncTestCase(TestCase):
+    """Checks the delta sync feed, its tombstones, watermark lag and paging."""
+
+    url: str = "/api/expense-tracker/v1/expenses/sync"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="sync@example.com",
+            username="sync",
+            password="StrongPass123!",
+        )
+        self.expenses: list[Expense] = [
+            Expense.objects.create(user=self.user, amount=Decimal("5.00"), date=date(2024, 2, day))
+            for day in range(1, 4)
+        ]
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_changes_since_watermark(self) -> None:
+        snapshot: dict = self.client.get(self.url).json()
+        self.assertEqual(len(snapshot["changed"]), 3)
+        self.assertEqual(snapshot["deleted"], [])
+
+        self.expenses[0].delete()
+        self.expenses[1].amount = Decimal("7.50")
+        self.expenses[1].save()
+
+        with self.assertNumQueries(1):
+            delta: dict = self.client.get(self.url, {"since": snapshot["watermark"]}).json()
+        self.assertEqual([row["id"] for row in delta["changed"]], [self.expenses[1].pk])
+        self.assertEqual(delta["changed"][0]["amount"], "7.50")
+        self.assertEqual([row["id"] for row in delta["deleted"]], [self.expenses[0].pk])
+
+        empty: dict = self.client.get(self.url, {"since": delta["watermark"]}).json()
+        self.assertEqual((empty["changed"], empty["deleted"]), ([], []))
+        self.assertEqual(empty["watermark"], delta["watermark"])
+
+    @override_settings(SYNC_WATERMARK_LAG_SECONDS=60)
+    def test_watermark_lags_behind_late_commits(self) -> None:
+        snapshot: dict = self.client.get(self.url).json()
+        watermark: datetime = datetime.fromisoformat(snapshot["watermark"])
+        self.assertLessEqual(watermark, timezone.now() - timedelta(seconds=60))
+
+        # Stamped before the snapshot was served, committed after it.
+        late: Expense = Expense.objects.create(user=self.user, amount=Decimal("1.00"), date=date(2024, 2, 9))
+        Expense.objects.filter(pk=late.pk).update(updated_at=timezone.now() - timedelta(seconds=30))
+
+        delta: dict = self.client.get(self.url, {"since": snapshot["watermark"]}).json()
+        self.assertIn(late.pk, [row["id"] for row in delta["changed"]])
+
+    @override_settings(SYNC_PAGE_SIZE=2)
+    def test_pages_follow_cursor(self) -> None:
+        # A bulk update gives every row the same updated_at.
+        Expense.objects.filter(user=self.user).update(updated_at=timezone.now())
+
+        first: dict = self.client.get(self.url).json()
+        self.assertEqual(len(first["changed"]), 2)
+        self.assertIsNotNone(first["next"])
+        self.assertIsNone(first["watermark"])
+
+        with self.assertNumQueries(1):
+            last: dict = self.client.get(self.url, {"cursor": first["next"]}).json()
+        self.assertEqual(len(last["changed"]), 1)
+        self.assertIsNone(last["next"])
+        self.assertEqual(
+            sorted(row["id"] for row in first["changed"] + last["changed"]),
+            [expense.pk for expense in self.expenses],
+        )
+
+        self.expenses[2].delete()
+        delta: dict = self.client.get(self.url, {"since": last["watermark"]}).json()
+        self.assertEqual(([row["id"] for row in delta["deleted"]], delta["next"]), ([self.expenses[2].pk], None))
+
+    def test_invalid_since(self) -> None:
+        response = self.client.get(self.url, {"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_cursor(self) -> None:
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+        token: str = SyncCursor(timezone.now(), 1, None).encode()
+        response = self.client.get(self.url, {"cursor": token, "since": "2024-01-01T00:00:00Z"})
+        self.assertEqual(response.status_code, 400)
+
+
+class ExpenseExportTestCase(TestCase):
+    """Checks that streamed CSV and NDJSON exports match the stored rows."""
+
+    url: str = "/api/expense-tracker/v1/expenses/export"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="export@example.com",
+            username="export",
+            password="StrongPass123!",
+        )
+        category: Category = Category.objects.create(user=self.user, name="Food")
+        self.expenses: list[Expense] = [
+            Expense.objects.create(
+                user=self.user,
+                category=category if day % 2 else None,
+                amount=Decimal(day) + Decimal("0.50"),
+                date=date(2024, 4, day),
+                description=f'Lunch, "café" {day}\nsecond line',
+            )
+            for day in range(1, 6)
+        ]
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        self.expenses[2].delete()
+
+        other: CustomUser = CustomUser.objects.create_user(
+            email="export-other@example.com",
+            username="export-other",
+            password="StrongPass123!",
+        )
+        Expense.objects.create(user=other, amount=Decimal("1.00"), date=date(2024, 4, 1))
+
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def expected_rows(self) -> list[dict]:
+        return [
+            {
+                "id": expense.pk,
+                "date": expense.date.isoformat(),
+                "amount": f"{expense.amount:.2f}",
+                "category_id": expense.category_id,
+                "description": expense.description,
+            }
+            for expense in sorted(self.expenses, key=lambda item: (item.date, item.pk), reverse=True)
+            if expense is not self.expenses[2]
+        ]
+
+    def export(self, export_format: str) -> str:
+        response = self.client.get(self.url, {"export_format": export_format})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], f'attachment; filename="expenses.{export_format}"')
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_matches_rows(self) -> None:
+        reader: csv.DictReader = csv.DictReader(StringIO(self.export("csv"), newline=""))
+        rows: list[dict] = list(reader)
+
+        self.assertEqual(reader.fieldnames, ["id", "date", "amount", "category_id", "description"])
+        expected: list[dict] = [
+            {key: "" if value is None else str(value) for key, value in row.items()}
+            for row in self.expected_rows()
+        ]
+        self.assertEqual(rows, expected)
+
+    def test_ndjson_matches_rows(self) -> None:
+        body: str = self.export("ndjson")
+
+        self.assertTrue(body.endswith("\n"))
+        self.assertEqual([json.loads(line) for line in body.splitlines()], self.expected_rows())
+
+    def test_invalid_format(self) -> None:
+        response = self.client.get(self.url, {"export_format": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_filters(self) -> None:
+        response = self.client.get(self.url, {"export_format": "ndjson", "min_amount": "4", "date_to": "2024-04-04"})
+        self.assertEqual(response.status_code, 200)
+        body: str = b"".join(response.streaming_content).decode()
+        self.assertEqual([json.loads(line)["id"] for line in body.splitlines()], [self.expenses[3].pk])
+
+        for params in ({"min_amount": "abc"}, {"date_from": "bad"}, {"category_id": "x"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertEqual(list(response.json()), list(params))
+
+    def test_join_chunks_groups_lines(self) -> None:
+        chunks: list[bytes] = list(join_chunks(["ab\n", "cd\n", "é\n"], buffer_size=6))
+        self.assertEqual(chunks, [b"ab\ncd\n", "é\n".encode()])
+
+
+class ExpenseImportTestCase(TestCase):
+    """Checks bulk import parsing, validation and rollup bookkeeping."""
+
+    url: str = "/api/expense-tracker/v1/expenses/import"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="import@example.com",
+            username="import",
+            password="StrongPass123!",
+        )
+        self.category: Category = Category.objects.create(user=self.user, name="Food")
+        other: CustomUser = CustomUser.objects.create_user(
+            email="import-other@example.com",
+            username="import-other",
+            password="StrongPass123!",
+        )
+        self.foreign_category: Category = Category.objects.create(user=other, name="Other")
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def rollup(self) -> dict:
+        return {
+            (row.category_id, row.month): (row.total, row.count)
+            for row in ExpenseMonthlyRollup.objects.filter(user=self.user)
+        }
+
+    def test_json_import_updates_rollup(self) -> None:
+        rows: list[dict] = [
+            {"amount": "10.00", "date": "2024-05-01", "category_id": self.category.pk, "description": "a"},
+            {"amount": "2.50", "date": "2024-05-20", "category_id": self.category.pk},
+            {"amount": "4.00", "date": "2024-06-02", "category_id": None},
+        ]
+
+        response = self.client.post(f"{self.url}?batch_size=2", rows, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": 3})
+        self.assertEqual(Expense.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(
+            self.rollup(),
+            {
+                (self.category.pk, date(2024, 5, 1)): (Decimal("12.50"), 2),
+                (None, date(2024, 6, 1)): (Decimal("4.00"), 1),
+            },
+        )
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_csv_import(self) -> None:
+        upload: SimpleUploadedFile = SimpleUploadedFile(
+            "expenses.csv",
+            (
+                "\ufeffid,date,amount,category_id,description\r\n"
+                f"99,2024-05-03,7.25,{self.category.pk},\"Lunch, café\"\r\n"
+                "100,2024-05-04,1.00,,\r\n"
+            ).encode(),
+            content_type="text/csv",
+        )
+
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertQuerySetEqual(
+            Expense.objects.filter(user=self.user).order_by("date"),
+            [
+                (date(2024, 5, 3), Decimal("7.25"), self.category.pk, "Lunch, café"),
+                (date(2024, 5, 4), Decimal("1.00"), None, ""),
+            ],
+            transform=lambda expense: (expense.date, expense.amount, expense.category_id, expense.description),
+        )
+        self.assertNotIn(99, Expense.all_with_deleted.values_list("id", flat=True))
+
+    def test_read_csv_rows_rejects_invalid_encoding(self) -> None:
+        upload: SimpleUploadedFile = SimpleUploadedFile("expenses.csv", b"date,amount\r\n\xff,1\r\n")
+        with self.assertRaises(ValidationError):
+            read_csv_rows(upload)
+
+    def test_row_errors_import_nothing(self) -> None:
+        rows: list = [
+            {"amount": "1.00", "date": "2024-05-01"},
+            {"amount": "abc", "date": "2024-05-01"},
+            "not an object",
+            {"amount": "1.00", "date": "2024-05-01", "category_id": self.foreign_category.pk},
+        ]
+
+        response = self.client.post(self.url, rows, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        errors: list[dict] = response.json()["errors"]
+        self.assertEqual([error["index"] for error in errors], [1, 2, 3])
+        self.assertIn("amount", errors[0]["errors"])
+        self.assertEqual(errors[1]["errors"], {"non_field_errors": ["Expected an object."]})
+        self.assertEqual(errors[2]["errors"], {"category_id": ["Category does not exist."]})
+        self.assertFalse(Expense.all_with_deleted.filter(user=self.user).exists())
+        self.assertEqual(self.rollup(), {})
+
+    @override_settings(EXPENSE_IMPORT_MAX_ROWS=2)
+    def test_max_rows(self) -> None:
+        rows: list[dict] = [{"amount": "1.00", "date": "2024-05-01"}] * 3
+
+        response = self.client.post(self.url, rows, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "At most 2 expenses can be imported at once."})
+        self.assertFalse(Expense.objects.filter(user=self.user).exists())
+
+    def test_empty_payload(self) -> None:
+        for payload in ([], {"amount": "1.00"}):
+            response = self.client.post(self.url, payload, format="json")
+            self.assertEqual(response.status_code, 400)
+        response = self.client.post(self.url, {}, format="multipart")
+        self.assertEqual(response.json(), {"file": ["No file was submitted."]})
+
+
+class ExpenseBulkTestCase(TestCase):
+    """Checks bulk update/delete selection by ids and by filters."""
+
+    url: str = "/api/expense-tracker/v1/expenses"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="bulk@example.com",
+            username="bulk",
+            password="StrongPass123!",
+        )
+        self.food: Category = Category.objects.create(user=self.user, name="Food")
+        self.travel: Category = Category.objects.create(user=self.user, name="Travel")
+        self.expenses: list[Expense] = [
+            Expense.objects.create(
+                user=self.user,
+                category=self.food if index % 2 else self.travel,
+                amount=Decimal("5.00") + index,
+                date=date(2024, 1 + index % 2, 10 + index),
+            )
+            for index in range(6)
+        ]
+        other: CustomUser = CustomUser.objects.create_user(
+            email="bulk-other@example.com",
+            username="bulk-other",
+            password="StrongPass123!",
+        )
+        self.foreign: Expense = Expense.objects.create(user=other, amount=Decimal("1.00"), date=date(2024, 1, 1))
+        ExpenseMonthlyRollup.objects.rebuild()
+
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def post(self, action: str, data: dict):
+        return self.client.post(f"{self.url}/{action}", data, format="json")
+
+    def test_delete_by_ids(self) -> None:
+        ids: list[int] = [self.expenses[0].pk, self.expenses[1].pk, self.foreign.pk]
+
+        response = self.post("bulk-delete", {"ids": ids})
+
+        self.assertEqual(response.json(), {"deleted": 2})
+        self.assertEqual(Expense.objects.filter(user=self.user).count(), 4)
+        self.assertTrue(Expense.objects.filter(pk=self.foreign.pk).exists())
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_update_by_filters(self) -> None:
+        response = self.post(
+            "bulk-update",
+            {
+                "filters": {"category_id": self.food.pk, "date_from": "2024-02-01"},
+                "changes": {"category_id": self.travel.pk, "amount": "1.00"},
+            },
+        )
+
+        self.assertEqual(response.json(), {"updated": 3})
+        moved: QuerySet = Expense.objects.filter(user=self.user, amount=Decimal("1.00"))
+        self.assertEqual(set(moved.values_list("category_id", flat=True)), {self.travel.pk})
+        self.assertFalse(Expense.objects.filter(category=self.food).exists())
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_delete_by_filters(self) -> None:
+        response = self.post("bulk-delete", {"filters": {"category_id": self.travel.pk}})
+
+        self.assertEqual(response.json(), {"deleted": 3})
+        self.assertFalse(Expense.objects.filter(category=self.travel).exists())
+        call_command("rebuild_expense_rollups", "--verify", stdout=StringIO())
+
+    def test_selection_must_be_ids_xor_non_empty_filters(self) -> None:
+        for selection in ({}, {"filters": {}}, {"ids": []}, {"ids": [1], "filters": {"category_id": 1}}):
+            with self.subTest(selection=selection):
+                response = self.post("bulk-delete", selection)
+                self.assertEqual(response.status_code, 400)
+
+        response = self.post("bulk-update", {"filters": {}, "changes": {"amount": "1.00"}})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"filters": ["Provide at least one filter."]})
+        self.assertEqual(Expense.objects.filter(user=self.user).count(), 6)
+
+
+class ExpenseAsyncViewSetTestCase(TestCase):
+    """Checks that the async endpoints mirror the sync ones."""
+
+    url: str = "/api/expense-tracker/v1/async/expenses"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="async@example.com",
+            username="async",
+            password="StrongPass123!",
+        )
+        self.category: Category = Category.objects.create(user=self.user, name="Food")
+        self.expense: Expense = Expense.objects.create(
+            user=self.user, category=self.category, amount=Decimal("12.50"), date=date(2024, 3, 1)
+        )
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+        token: str = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.auth: dict[str, str] = {"Authorization": f"Bearer {token}"}
+        self.async_client: AsyncClient = AsyncClient()
+        self.client: APIClient = APIClient()
+        self.client.force_authenticate(self.user)
+
+    async def test_list_matches_sync_endpoint(self) -> None:
+        response = await self.async_client.get(f"{self.url}/list", {"page_size": 10}, headers=self.auth)
+        self.assertEqual(response.status_code, 200)
+
+        sync_response = await sync_to_async(self.client.get)(
+            "/api/expense-tracker/v1/expenses/list", {"page_size": 10}
+        )
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response["ETag"], sync_response["ETag"])
+
+        response = await self.async_client.get(
+            f"{self.url}/list", headers={**self.auth, "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_create_update_delete(self) -> None:
+        response = await self.async_client.post(
+            f"{self.url}/create",
+            {"amount": "3.00", "date": "2024-03-02", "category_id": self.category.pk},
+            content_type="application/json",
+            headers=self.auth,
+        )
+        self.assertEqual(response.status_code, 201)
+        expense_id: int = response.json()["id"]
+
+        response = await self.async_client.put(
+            f"{self.url}/{expense_id}/update",
+            {"amount": "4.00", "date": "2024-03-02", "category_id": self.category.pk},
+            content_type="application/json",
+            headers=self.auth,
+        )
+        self.assertEqual(response.json()["amount"], "4.00")
+
+        response = await self.async_client.delete(f"{self.url}/{expense_id}/delete", headers=self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(await Expense.objects.filter(pk=expense_id).aexists())
+
+    async def test_writes_are_csrf_exempt(self) -> None:
+        csrf_client: AsyncClient = AsyncClient(enforce_csrf_checks=True)
+
+        response = await csrf_client.post(
+            f"{self.url}/create",
+            {"amount": "3.00", "date": "2024-03-02"},
+            content_type="application/json",
+            headers=self.auth,
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response = await csrf_client.delete(f"{self.url}/{self.expense.pk}/delete", headers=self.auth)
+        self.assertEqual(response.status_code, 200)
+
+    async def test_uses_configured_parsers(self) -> None:
+        response = await self.async_client.post(
+            f"{self.url}/create",
+            {"amount": "3.00", "date": "2024-03-02"},
+            headers=self.auth,
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response = await self.async_client.post(
+            f"{self.url}/create",
+            "amount=3.00",
+            content_type="text/plain",
+            headers=self.auth,
+        )
+        self.assertEqual(response.status_code, 415)
+
+    async def test_replica_reads_under_database_cache(self) -> None:
+        database_cache: dict = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "expense_tracker_cache",
+            }
+        }
+        with override_settings(CACHES=database_cache):
+            await sync_to_async(call_command)("createcachetable", stdout=StringIO())
+
+        # "default" as the replica routes list reads through the replica path.
+        with override_settings(CACHES=database_cache, DATABASE_REPLICAS=["default"]):
+            for url in (f"{self.url}/list", "/api/expense-tracker/v1/async/categories/list"):
+                response = await self.async_client.get(url, headers=self.auth)
+                self.assertEqual(response.status_code, 200, url)
+
+            response = await self.async_client.post(
+                f"{self.url}/create",
+                {"amount": "3.00", "date": "2024-03-02"},
+                content_type="application/json",
+                headers=self.auth,
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertTrue(await ais_pinned_to_primary(self.user.pk))
+
+    async def test_requires_authentication(self) -> None:
+        response = await self.async_client.get(f"{self.url}/list")
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(f"{self.url}/{self.expense.pk}/delete", headers=self.auth)
+        self.assertEqual(response.status_code, 405)
+
+
+class ExpenseQueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    """Upper bounds on SQL queries per ExpenseViewSet action, independent of data size."""
+
+    url: str = "/api/expense-tracker/v1/expenses"
+
+    def setUp(self) -> None:
+        self.user: CustomUser = CustomUser.objects.create_user(
+            email="budget@example.com",
+            username="budget",
+            password="StrongPass123!",
+        )
+        self.categories: list[Category] = []
+        self.expenses: list[Expense] = []
+        self.grow(10)
+
+        token: str = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.client: APIClient = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def grow(self, count: int) -> None:
+        # Expenses share one month, so writes touch existing rollup rows and
+        # bulk actions scoped to one category touch a single rollup group.
+        self.categories += Category.objects.bulk_create(
+            Category(user=self.user, name=f"Category {len(self.categories) + index}")
+            for index in range(max(count // 10, 1))
+        )
+        self.expenses += Expense.objects.bulk_create(
+            Expense(
+                user=self.user,
+                category=self.categories[index % len(self.categories)],
+                amount=Decimal("10.00") + index,
+                date=date(2024, 1, 1 + index % 28),
+                description=f"Expense {index}",
+            )
+            for index in range(count)
+        )
+        ExpenseMonthlyRollup.objects.rebuild(user_ids=[self.user.pk])
+
+    def expense_data(self) -> dict:
+        return {"amount": "12.34", "date": "2024-01-15", "category_id": self.categories[0].pk}
+
+    def first_category_ids(self) -> list[int]:
+        return [expense.pk for expense in self.expenses if expense.category_id == self.categories[0].pk]
+
+    def test_list_expenses(self) -> None:
+        self.assertQueryBudget(2, lambda: self.client.get(f"{self.url}/list"))
+
+    def test_list_expenses_page(self) -> None:
+        self.assertQueryBudget(2, lambda: self.client.get(f"{self.url}/list", {"page_size": 20}))
+
+    def test_summarize(self) -> None:
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/summary"))
+
+    def test_sync_expenses(self) -> None:
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/sync"))
+
+    def test_monthly_totals(self) -> None:
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/monthly"))
+
+    def test_export_expenses(self) -> None:
+        self.assertQueryBudget(1, lambda: self.client.get(f"{self.url}/export", {"export_format": "ndjson"}))
+
+    def test_create_expense(self) -> None:
+        self.assertQueryBudget(5, lambda: self.client.post(f"{self.url}/create", self.expense_data(), format="json"))
+
+    def test_bulk_import(self) -> None:
+        rows: list[dict] = [self.expense_data() for _ in range(20)]
+        self.assertQueryBudget(5, lambda: self.client.post(f"{self.url}/import", rows, format="json"))
+
+    # Single-row writes lock and re-read the row before moving its rollup.
+    def test_update_expense(self) -> None:
+        expense: Expense = self.expenses[0]
+        self.assertQueryBudget(
+            9, lambda: self.client.put(f"{self.url}/{expense.pk}/update", self.expense_data(), format="json")
+        )
+
+    def test_delete_expense(self) -> None:
+        targets = iter(self.expenses)
+        self.assertQueryBudget(7, lambda: self.client.delete(f"{self.url}/{next(targets).pk}/delete"))
+
+    # Bulk writes lock the selected rows before reading their rollup groups.
+    def test_bulk_update(self) -> None:
+        self.assertQueryBudget(
+            7,
+            lambda: self.client.post(
+                f"{self.url}/bulk-update",
+                {"filters": {"category_id": self.categories[0].pk}, "changes": {"amount": "1.00"}},
+                format="json",
+            ),
+        )
+
+    def test_bulk_delete(self) -> None:
+        self.assertQueryBudget(
+            6,
+            lambda: self.client.post(
+                f"{self.url}/bulk-delete",
+                {"ids": self.first_category_ids()[-5:]},
+                format="json",
+            ),
+        )
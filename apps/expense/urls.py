@@ -5,7 +5,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 # Project modules
-from apps.expense.views import ExpenseViewSet
+from apps.expense.views import ExpenseAsyncViewSet, ExpenseViewSet
 
 
 router: DefaultRouter = DefaultRouter(
@@ -18,6 +18,31 @@ router.register(
     basename="expense",
 )
 
+# Async variants for ASGI deployments, mirroring the ViewSet routes.
+async_urlpatterns = [
+    path(
+        "expenses/list",
+        ExpenseAsyncViewSet.as_view(actions={"get": "list_expenses"}),
+        name="expense-async-list",
+    ),
+    path(
+        "expenses/create",
+        ExpenseAsyncViewSet.as_view(actions={"post": "create_expense"}),
+        name="expense-async-create",
+    ),
+    path(
+        "expenses/<int:pk>/update",
+        ExpenseAsyncViewSet.as_view(actions={"put": "update_expense"}),
+        name="expense-async-update",
+    ),
+    path(
+        "expenses/<int:pk>/delete",
+        ExpenseAsyncViewSet.as_view(actions={"delete": "delete_expense"}),
+        name="expense-async-delete",
+    ),
+]
+
 urlpatterns = [
     path("v1/", include(router.urls)),
+    path("v1/async/", include(async_urlpatterns)),
 ]
\ No newline at end of file
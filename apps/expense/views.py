@@ -1,9 +1,14 @@
 # Python modules
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Optional
+from asgiref.sync import sync_to_async
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 
 #Django modules
+from django.conf import settings
 from django.db.models.query import QuerySet
+from django.http import HttpResponseBase, StreamingHttpResponse
 
 # Django REST Framework
 from rest_framework.viewsets import ViewSet
@@ -11,100 +16,451 @@ from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
 from rest_framework.status import (
     HTTP_200_OK, 
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST, 
     HTTP_405_METHOD_NOT_ALLOWED, 
     HTTP_201_CREATED,
 )
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser, MultiPartParser
 
 # Project modules
+from apps.abstracts.conditional import CollectionValidators
+from apps.abstracts.pagination import KeysetPagination
 from apps.abstracts.permissions import IsOwner
-from apps.expense.models import Expense
+from apps.abstracts.routers import areplica_reads, read_from_replica
+from apps.abstracts.serializers import SyncQuerySerializer
+from apps.abstracts.sync import collect_changes
+from apps.abstracts.views import AsyncViewSet
+from apps.expense.models import Expense, ExpenseMonthlyRollup
 from apps.expense.serializers import (
     ExpenseListSerializer, 
     ExpenseCreateSerializer, 
     ExpenseUpdateSerializer,
     ExpenseBaseSerializer,
+    ExpenseBulkSelectionSerializer,
+    ExpenseBulkUpdateSerializer,
+    ExpenseExportQuerySerializer,
+    ExpenseImportQuerySerializer,
+    ExpenseImportRowSerializer,
+    ExpenseSummaryQuerySerializer,
+    ExpenseSummarySerializer,
+    ExpenseMonthlyQuerySerializer,
+    ExpenseMonthlyRollupSerializer,
+    ExpenseSyncSerializer,
+    expense_list_values,
 )
+from apps.expense.bulk import bulk_delete_expenses, bulk_update_expenses
+from apps.expense.imports import import_expenses, read_csv_rows, validate_import_rows
+from apps.expense.exports import EXPORT_FORMATS, iter_export_rows, join_chunks
+from apps.expense.summaries import summarize_expenses
+
+EXPENSE_FILTER_PARAMETERS: list[OpenApiParameter] = [
+    OpenApiParameter(
+        name='date_from',
+        required=False,
+    ),
+    OpenApiParameter(
+        name='date_to',
+        required=False,
+    ),
+    OpenApiParameter(
+        name='category_id',
+        required=False,
+    ),
+    OpenApiParameter(
+        name='min_amount',
+        required=False,
+    ),
+    OpenApiParameter(
+        name='max_amount',
+        required=False,
+    ),
+]
+
+
+def filter_expenses(expenses: QuerySet, params: Mapping[str, Any]) -> QuerySet:
+    """Narrow expenses by the list_expenses filters found in params."""
+
+    date_from: str = params.get("date_from", None)
+    date_to: str = params.get("date_to", None)
+    category_id: str = params.get("category_id", None)
+    min_amount: str = params.get("min_amount", None)
+    max_amount: str = params.get("max_amount", None)
+
+    if date_from:
+        expenses = expenses.filter(date__gte=date_from)
+
+    if date_to:
+        expenses = expenses.filter(date__lte=date_to)
+
+    if category_id:
+        expenses = expenses.filter(category_id=category_id)
+
+    if min_amount:
+        expenses = expenses.filter(amount__gte=min_amount)
+
+    if max_amount:
+        expenses = expenses.filter(amount__lte=max_amount)
+
+    return expenses
+
 
 class ExpenseViewSet(ViewSet):
     """ViewSet for managing Expense instances."""
     permission_classes = (IsAuthenticated,)
 
+    def get_filtered_expenses(
+        self,
+        request: DRFRequest,
+        params: Optional[Mapping[str, Any]] = None,
+        ) -> QuerySet:
+        """
+        Return the user's expenses narrowed by the list_expenses filters,
+        read from the query string unless explicit params are given.
+        """
+
+        if params is None:
+            params = request.query_params
+
+        return filter_expenses(Expense.objects.filter(user=request.user), params)
+
+    def get_selected_expenses(self, request: DRFRequest, selection: dict[str, Any]) -> QuerySet:
+        """Resolve a validated bulk selection (ids or filters) to the user's expenses."""
+
+        if "ids" in selection:
+            return Expense.objects.filter(user=request.user, id__in=selection["ids"])
+
+        return self.get_filtered_expenses(request, params=selection["filters"])
+
     @extend_schema(
         responses={
             HTTP_200_OK: ExpenseListSerializer(many=True),
+            HTTP_304_NOT_MODIFIED: OpenApiResponse(description="Not modified."),
             HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
                 response=HTTP_405_METHOD_NOT_ALLOWED,
                 description="Method not allowed."
             ),
         },
         summary = "List expenses with filters",
-        description="Filters: date_from, date_to, category, min_amount, max_amount",
+        description=(
+            "Filters: date_from, date_to, category, min_amount, max_amount. "
+            "Pass page_size and/or cursor to receive a keyset-paginated page "
+            "ordered by (date, id) descending together with a `next` cursor. "
+            "Without them every matching expense is returned as a plain list; "
+            "that mode is deprecated, so new clients should always paginate. "
+            "Responses carry ETag and Last-Modified; send If-None-Match or "
+            "If-Modified-Since to get 304 Not Modified when nothing changed."
+        ),
         parameters=[
+            *EXPENSE_FILTER_PARAMETERS,
             OpenApiParameter(
-                name='date_from',
+                name='cursor',
                 required=False,
             ),
             OpenApiParameter(
-                name='date_to',
+                name='page_size',
                 required=False,
+                type=int,
+            ),
+        ]
+    )
+    @action(
+        detail=False, 
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='list',
+    )
+    @read_from_replica
+    def list_expenses(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """List all expenses for the authenticated user."""
+
+        validators: CollectionValidators = CollectionValidators.for_queryset(
+            Expense.all_with_deleted.filter(user=request.user)
+        )
+        not_modified = validators.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        all_expenses: QuerySet = self.get_filtered_expenses(request).order_by("-date", "-id")
+
+        paginator: KeysetPagination = KeysetPagination()
+        if paginator.is_requested(request):
+            page: list[dict[str, Any]] = paginator.paginate_values(all_expenses, request, expense_list_values)
+            return validators.apply(paginator.get_paginated_response(page))
+
+        return validators.apply(
+            DRFResponse(
+                data=expense_list_values.serialize(all_expenses),
+                status=HTTP_200_OK,
+            )
+        )
+    
+    
+    @extend_schema(
+        responses={
+            HTTP_200_OK: ExpenseSummarySerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=ExpenseSummaryQuerySerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
             ),
+        },
+        summary="Summarize expenses",
+        description=(
+            "Totals, counts, averages and min/max grouped by category and by "
+            "day, week or month. Accepts the same filters as the list endpoint."
+        ),
+        parameters=[
+            *EXPENSE_FILTER_PARAMETERS,
             OpenApiParameter(
-                name='category_id',
+                name='period',
                 required=False,
+                enum=ExpenseSummaryQuerySerializer.PERIOD_CHOICES,
             ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='summary',
+    )
+    @read_from_replica
+    def summarize(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Summarize the authenticated user's expenses with one grouped query."""
+
+        query_serializer: ExpenseSummaryQuerySerializer = ExpenseSummaryQuerySerializer(
+            data=request.query_params,
+        )
+
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        summary: dict[str, Any] = summarize_expenses(
+            self.get_filtered_expenses(request, params=query_serializer.validated_data),
+            period=query_serializer.validated_data["period"],
+        )
+
+        serializer: ExpenseSummarySerializer = ExpenseSummarySerializer(summary)
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK,
+        )
+
+
+    @extend_schema(
+        responses={
+            HTTP_200_OK: ExpenseSyncSerializer,
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=SyncQuerySerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Sync expense changes",
+        description=(
+            "Expenses created or updated after `since` in `changed`, and "
+            "tombstones for expenses deleted after `since` in `deleted`. "
+            "Without `since` all live expenses are returned. While `next` is "
+            "set, pass it as `cursor` to fetch the remaining rows; then pass "
+            "the returned `watermark` as `since` on the next call. Recent "
+            "changes may be sent again and should be applied by id."
+        ),
+        parameters=[
             OpenApiParameter(
-                name='min_amount',
+                name='since',
                 required=False,
+                type=OpenApiTypes.DATETIME,
             ),
             OpenApiParameter(
-                name='max_amount',
+                name='cursor',
                 required=False,
-            )
+                type=str,
+            ),
         ]
     )
     @action(
-        detail=False, 
+        detail=False,
         methods=["GET"],
         permission_classes=[IsAuthenticated, IsOwner],
-        url_path='list',
+        url_path='sync',
     )
-    def list_expenses(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
-        """List all expenses for the authenticated user."""
+    def sync_expenses(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """Return the authenticated user's expense changes since a watermark."""
 
-        all_expenses: QuerySet = Expense.objects.filter(user=request.user).order_by("-date")
+        query_serializer: SyncQuerySerializer = SyncQuerySerializer(data=request.query_params)
 
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
 
-        date_from: str = request.query_params.get("date_from", None)
-        date_to: str = request.query_params.get("date_to", None)
-        category_id: str = request.query_params.get("category_id", None)
-        min_amount: str = request.query_params.get("min_amount", None)
-        max_amount: str = request.query_params.get("max_amount", None)
+        changes: dict[str, Any] = collect_changes(
+            Expense.all_with_deleted.filter(user=request.user),
+            since=query_serializer.validated_data.get("since"),
+            cursor=query_serializer.validated_data.get("cursor"),
+        )
 
-        if date_from:
-            all_expenses = all_expenses.filter(date__gte=date_from)
+        return DRFResponse(
+            data=ExpenseSyncSerializer(changes).data,
+            status=HTTP_200_OK,
+        )
 
-        if date_to:
-            all_expenses = all_expenses.filter(date__lte=date_to)
 
-        if category_id:
-            all_expenses = all_expenses.filter(category_id=category_id)
+    @extend_schema(
+        responses={
+            HTTP_200_OK: ExpenseMonthlyRollupSerializer(many=True),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=ExpenseMonthlyQuerySerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Monthly totals per category",
+        description=(
+            "Per-category totals and counts for each month, read from the "
+            "maintained monthly rollup. Filters: date_from, date_to, category_id."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='date_from',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='date_to',
+                required=False,
+            ),
+            OpenApiParameter(
+                name='category_id',
+                required=False,
+            ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='monthly',
+    )
+    @read_from_replica
+    def monthly_totals(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """List monthly per-category totals for the authenticated user."""
+
+        query_serializer: ExpenseMonthlyQuerySerializer = ExpenseMonthlyQuerySerializer(
+            data=request.query_params,
+        )
 
-        if min_amount:
-            all_expenses = all_expenses.filter(amount__gte=min_amount)
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
 
-        if max_amount:
-            all_expenses = all_expenses.filter(amount__lte=max_amount)
+        filters: dict[str, Any] = query_serializer.validated_data
+        rollups: QuerySet = ExpenseMonthlyRollup.objects.filter(
+            user=request.user,
+            count__gt=0,
+        ).order_by("month", "category_id")
 
-        serializer: ExpenseListSerializer = ExpenseListSerializer(all_expenses, many=True)
+        if "date_from" in filters:
+            rollups = rollups.filter(month__gte=filters["date_from"].replace(day=1))
+
+        if "date_to" in filters:
+            rollups = rollups.filter(month__lte=filters["date_to"])
+
+        if "category_id" in filters:
+            rollups = rollups.filter(category_id=filters["category_id"])
+
+        serializer: ExpenseMonthlyRollupSerializer = ExpenseMonthlyRollupSerializer(rollups, many=True)
         return DRFResponse(
             data=serializer.data,
             status=HTTP_200_OK,
         )
-    
-    
+
+
+    @extend_schema(
+        responses={
+            (HTTP_200_OK, "text/csv"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="CSV file with one expense per line."
+            ),
+            (HTTP_200_OK, "application/x-ndjson"): OpenApiResponse(
+                response=OpenApiTypes.STR,
+                description="Newline-delimited JSON with one expense per line."
+            ),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=ExpenseExportQuerySerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Export expenses",
+        description=(
+            "Stream the filtered expenses as CSV or NDJSON. Rows are read in "
+            "chunks, so memory use does not grow with the number of expenses."
+        ),
+        parameters=[
+            *EXPENSE_FILTER_PARAMETERS,
+            OpenApiParameter(
+                name='export_format',
+                required=False,
+                enum=ExpenseExportQuerySerializer.EXPORT_FORMAT_CHOICES,
+            ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='export',
+    )
+    def export_expenses(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> StreamingHttpResponse | DRFResponse:
+        """Stream the authenticated user's expenses as CSV or NDJSON."""
+
+        query_serializer: ExpenseExportQuerySerializer = ExpenseExportQuerySerializer(
+            data=request.query_params,
+        )
+
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        export_format: str = query_serializer.validated_data["export_format"]
+        content_type, stream = EXPORT_FORMATS[export_format]
+
+        all_expenses: QuerySet = self.get_filtered_expenses(
+            request,
+            params=query_serializer.validated_data,
+        ).order_by("-date", "-id")
+
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            join_chunks(stream(iter_export_rows(all_expenses))),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="expenses.{export_format}"'
+        return response
+
+
     @extend_schema(
         request=ExpenseCreateSerializer,
         responses={
@@ -153,6 +509,107 @@ class ExpenseViewSet(ViewSet):
         )
     
 
+    @extend_schema(
+        request={
+            "application/json": ExpenseImportRowSerializer(many=True),
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+            },
+        },
+        responses={
+            HTTP_201_CREATED: OpenApiResponse(
+                description="Number of created expenses."
+            ),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Per-row validation errors; nothing was imported."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Bulk import expenses",
+        description=(
+            "Import a JSON array of expenses or a CSV upload (`file` field with "
+            "date, amount, category_id, description columns). All rows are "
+            "validated first; if any row is invalid nothing is imported."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='batch_size',
+                required=False,
+                type=int,
+            ),
+        ]
+    )
+    @action(
+        detail=False,
+        methods=["POST"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        parser_classes=[JSONParser, MultiPartParser],
+        url_path='import',
+    )
+    def bulk_import(
+        self,
+        request: DRFRequest,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+        ) -> DRFResponse:
+        """Import many expenses for the authenticated user in one request."""
+
+        query_serializer: ExpenseImportQuerySerializer = ExpenseImportQuerySerializer(
+            data=request.query_params,
+        )
+
+        if not query_serializer.is_valid():
+            return DRFResponse(
+                data=query_serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        if request.content_type.startswith("multipart/"):
+            upload = request.FILES.get("file")
+            if upload is None:
+                return DRFResponse(
+                    data={"file": ["No file was submitted."]},
+                    status=HTTP_400_BAD_REQUEST,
+                )
+            rows: list[Any] = read_csv_rows(upload)
+        else:
+            rows = request.data
+
+        if not isinstance(rows, list) or not rows:
+            return DRFResponse(
+                data={"detail": "Expected a non-empty list of expenses."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        if len(rows) > settings.EXPENSE_IMPORT_MAX_ROWS:
+            return DRFResponse(
+                data={"detail": f"At most {settings.EXPENSE_IMPORT_MAX_ROWS} expenses can be imported at once."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        expenses, errors = validate_import_rows(rows, request.user)
+
+        if errors:
+            return DRFResponse(
+                data={"errors": errors},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        created = import_expenses(
+            expenses,
+            batch_size=query_serializer.validated_data.get("batch_size", settings.EXPENSE_IMPORT_BATCH_SIZE),
+        )
+
+        return DRFResponse(
+            data={"created": len(created)},
+            status=HTTP_201_CREATED,
+        )
+
+
     @extend_schema(
         request=ExpenseUpdateSerializer,
         responses={
@@ -198,7 +655,13 @@ class ExpenseViewSet(ViewSet):
         )
 
         if serializer.is_valid():
-            updated_expense: Expense = serializer.save()
+            try:
+                updated_expense: Expense = serializer.save()
+            except Expense.DoesNotExist:
+                return DRFResponse(
+                    data={"detail": "Expense not found."},
+                    status=HTTP_400_BAD_REQUEST,
+                )
             response_serializer: ExpenseListSerializer = ExpenseListSerializer(updated_expense)
             return DRFResponse(
                 data=response_serializer.data,
@@ -254,11 +717,222 @@ class ExpenseViewSet(ViewSet):
             data={"detail": "Expense deleted successfully."},
             status=HTTP_200_OK,
         )
-    
-        
 
+    @extend_schema(
+        request=ExpenseBulkUpdateSerializer,
+        responses={
+            HTTP_200_OK: OpenApiResponse(
+                description="Number of updated expenses."
+            ),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=ExpenseBulkUpdateSerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Bulk update expenses",
+        description=(
+            "Apply category, amount and/or description changes to expenses "
+            "selected by `ids` or by list `filters` with a single UPDATE."
+        ),
+    )
+    @action(
+        detail=False,
+        methods=["POST"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='bulk-update',
+    )
+    def bulk_update(
+        self,
+        request: DRFRequest,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+        ) -> DRFResponse:
+        """Update many expenses of the authenticated user at once."""
 
+        serializer: ExpenseBulkUpdateSerializer = ExpenseBulkUpdateSerializer(
+            data=request.data,
+            context={"request": request},
+        )
 
-        
+        if not serializer.is_valid():
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        updated: int = bulk_update_expenses(
+            self.get_selected_expenses(request, serializer.validated_data),
+            changes=serializer.validated_data["changes"],
+        )
+
+        return DRFResponse(
+            data={"updated": updated},
+            status=HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=ExpenseBulkSelectionSerializer,
+        responses={
+            HTTP_200_OK: OpenApiResponse(
+                description="Number of deleted expenses."
+            ),
+            HTTP_400_BAD_REQUEST: OpenApiResponse(
+                response=ExpenseBulkSelectionSerializer,
+                description="Bad request."
+            ),
+            HTTP_405_METHOD_NOT_ALLOWED: OpenApiResponse(
+                response=HTTP_405_METHOD_NOT_ALLOWED,
+                description="Method not allowed."
+            ),
+        },
+        summary="Bulk delete expenses",
+        description="Soft delete expenses selected by `ids` or by list `filters` with a single UPDATE.",
+    )
+    @action(
+        detail=False,
+        methods=["POST"],
+        permission_classes=[IsAuthenticated, IsOwner],
+        url_path='bulk-delete',
+    )
+    def bulk_delete(
+        self,
+        request: DRFRequest,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+        ) -> DRFResponse:
+        """Delete many expenses of the authenticated user at once."""
 
+        serializer: ExpenseBulkSelectionSerializer = ExpenseBulkSelectionSerializer(
+            data=request.data,
+            context={"request": request},
+        )
 
+        if not serializer.is_valid():
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        deleted: int = bulk_delete_expenses(
+            self.get_selected_expenses(request, serializer.validated_data),
+        )
+
+        return DRFResponse(
+            data={"deleted": deleted},
+            status=HTTP_200_OK,
+        )
+
+
+class ExpenseAsyncViewSet(AsyncViewSet):
+    """
+    Async variants of the expense list/create/update/delete actions for
+    ASGI deployments. Responses match the ExpenseViewSet actions.
+    """
+
+    async def list_expenses(self, request: DRFRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """List all expenses for the authenticated user."""
+
+        async with areplica_reads(request.user.pk):
+            validators: CollectionValidators = await CollectionValidators.afor_queryset(
+                Expense.all_with_deleted.filter(user=request.user)
+            )
+            not_modified = validators.not_modified(request)
+            if not_modified is not None:
+                return not_modified
+
+            all_expenses: QuerySet = filter_expenses(
+                Expense.objects.filter(user=request.user),
+                request.query_params,
+            ).order_by("-date", "-id")
+
+            paginator: KeysetPagination = KeysetPagination()
+            if paginator.is_requested(request):
+                page: list[dict[str, Any]] = await paginator.apaginate_values(
+                    all_expenses, request, expense_list_values
+                )
+                return validators.apply(paginator.get_paginated_response(page))
+
+            expenses: list[dict[str, Any]] = await expense_list_values.aserialize(all_expenses)
+
+        return validators.apply(
+            DRFResponse(
+                data=expenses,
+                status=HTTP_200_OK,
+            )
+        )
+
+    async def create_expense(self, request: DRFRequest, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Create a new expense for the authenticated user."""
+
+        serializer: ExpenseCreateSerializer = ExpenseCreateSerializer(
+            data=request.data,
+            context={"request": request},
+        )
+
+        expense: Optional[Expense] = await sync_to_async(self.save_if_valid)(serializer)
+        if expense is None:
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        return DRFResponse(
+            data=ExpenseListSerializer(expense).data,
+            status=HTTP_201_CREATED,
+        )
+
+    async def update_expense(self, request: DRFRequest, pk: int, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Update an existing expense for the authenticated user."""
+
+        try:
+            expense: Expense = await Expense.objects.aget(id=pk, user=request.user)
+        except Expense.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Expense not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        serializer: ExpenseUpdateSerializer = ExpenseUpdateSerializer(
+            expense,
+            data=request.data,
+            context={"request": request},
+        )
+
+        try:
+            updated_expense: Optional[Expense] = await sync_to_async(self.save_if_valid)(serializer)
+        except Expense.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Expense not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+        if updated_expense is None:
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        return DRFResponse(
+            data=ExpenseListSerializer(updated_expense).data,
+            status=HTTP_200_OK,
+        )
+
+    async def delete_expense(self, request: DRFRequest, pk: int, *args: Any, **kwargs: Any) -> DRFResponse:
+        """Delete an existing expense for the authenticated user."""
+
+        try:
+            expense: Expense = await Expense.objects.aget(id=pk, user=request.user)
+        except Expense.DoesNotExist:
+            return DRFResponse(
+                data={"detail": "Expense not found."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        await expense.adelete()
+        return DRFResponse(
+            data={"detail": "Expense deleted successfully."},
+            status=HTTP_200_OK,
+        )
@@ -2,6 +2,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "expense_tracker.settings")
+from settings.conf import ENV_ID
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", f"settings.env.{ENV_ID}")
+# Web-only settings, such as the database statement timeout, key on this.
+os.environ["DJANGO_WEB_WORKER"] = "1"
 
 application = get_asgi_application()
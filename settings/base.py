@@ -34,7 +34,6 @@ DJANGO_AND_THIRD_PARTY_APPS = [
     'rest_framework',
     'rest_framework_simplejwt',
     'drf_spectacular',
-    'debug_toolbar',
     'django_extensions',
 ]
 
@@ -45,6 +44,7 @@ PROJECT_APPS = [
     "apps.expense.apps.ExpenseConfig",
     "apps.data_generator.apps.DataGeneratorConfig",
     "apps.auths.apps.AuthsConfig",
+    "apps.benchmarks.apps.BenchmarksConfig",
 ]
 INSTALLED_APPS = PROJECT_APPS + DJANGO_AND_THIRD_PARTY_APPS
 
@@ -53,14 +53,15 @@ INSTALLED_APPS = PROJECT_APPS + DJANGO_AND_THIRD_PARTY_APPS
 # Middleware | Templates | Validators
 #
 MIDDLEWARE = [
+    "apps.abstracts.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.abstracts.routers.ReplicaPinningMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 TEMPLATES = [
     {
@@ -107,6 +108,7 @@ USE_TZ = True
 #
 STATIC_URL = "static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "static")
+SERVE_STATIC = False
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
@@ -1,4 +1,4 @@
-from decouple import config
+from decouple import Choices, config
 from datetime import timedelta
 # --------------------------------------------
 # Env
@@ -17,16 +17,129 @@ SECRET_KEY = 'MY_SUPER_SECRET_KEY'
 # ----------------------------------------------
 # Django REST Framework
 #
+# JSON_BACKEND "orjson" renders and parses JSON bodies with orjson
+# (apps.abstracts.renderers), byte-for-byte like DRF's stdlib classes;
+# without orjson installed those classes fall back to the stdlib.
+JSON_BACKEND = config("JSON_BACKEND", default="orjson", cast=Choices(["json", "orjson"]))
+JSON_RENDERER_CLASS, JSON_PARSER_CLASS = {
+    "json": ("rest_framework.renderers.JSONRenderer", "rest_framework.parsers.JSONParser"),
+    "orjson": ("apps.abstracts.renderers.ORJSONRenderer", "apps.abstracts.renderers.ORJSONParser"),
+}[JSON_BACKEND]
+
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        JSON_RENDERER_CLASS,
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        JSON_PARSER_CLASS,
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny'
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.auths.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': config("LOGIN_THROTTLE_IP_RATE", default="30/min"),
+        'login_email': config("LOGIN_THROTTLE_EMAIL_RATE", default="10/min"),
+    },
+    # Trusted reverse proxies in front of the app. Throttles key on the
+    # X-Forwarded-For entry added by the outermost one, or on REMOTE_ADDR
+    # when 0, so clients cannot pick their own throttle bucket.
+    'NUM_PROXIES': config("NUM_PROXIES", default=0, cast=int),
+}
+
+# ----------------------------------------------
+# SQLite tuning
+#
+# PRAGMAs applied to every new SQLite connection (apps.abstracts.sqlite):
+# WAL lets readers run alongside the writer, NORMAL sync is safe with WAL,
+# and the busy timeout waits for locks instead of failing immediately.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": config("SQLITE_BUSY_TIMEOUT_MS", default=5_000, cast=int),
 }
 
+# ----------------------------------------------
+# Database routing
+#
+# Aliases in DATABASES that serve replica reads (apps.abstracts.routers);
+# environments fill it in. Reads stick to the primary this many seconds
+# after a user's write.
+DATABASE_ROUTERS = ["apps.abstracts.routers.PrimaryReplicaRouter"]
+DATABASE_REPLICAS: list[str] = []
+REPLICA_READ_YOUR_WRITES_SECONDS = config("REPLICA_READ_YOUR_WRITES_SECONDS", default=5, cast=int)
+
+# ----------------------------------------------
+# Cache
+#
+# Local memory by default, which is only correct with a single process;
+# production (settings/env/prod.py) requires a backend shared between
+# workers, e.g. django.core.cache.backends.db.DatabaseCache (LOCATION is a
+# table created with `manage.py createcachetable`) or
+# django.core.cache.backends.redis.RedisCache (LOCATION is a redis:// URL).
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="expense-tracker"),
+    },
+}
+CATEGORY_CACHE_TIMEOUT = config("CATEGORY_CACHE_TIMEOUT", default=300, cast=int)
+# Full CustomUser rows loaded for claims-only JWT users (apps.auths.authentication).
+AUTH_USER_CACHE_TIMEOUT = config("AUTH_USER_CACHE_TIMEOUT", default=60, cast=int)
+# Emails a login found no user for (apps.auths.throttling).
+LOGIN_UNKNOWN_EMAIL_CACHE_TIMEOUT = config("LOGIN_UNKNOWN_EMAIL_CACHE_TIMEOUT", default=300, cast=int)
+
+# ----------------------------------------------
+# Delta sync
+#
+# Rows per sync response (apps.abstracts.sync). Watermarks stay this many
+# seconds behind now, which must exceed the longest write transaction, so
+# rows committed late are not skipped.
+SYNC_PAGE_SIZE = config("SYNC_PAGE_SIZE", default=1_000, cast=int)
+SYNC_WATERMARK_LAG_SECONDS = config("SYNC_WATERMARK_LAG_SECONDS", default=60, cast=int)
+
+# ----------------------------------------------
+# Expense import
+#
+EXPENSE_IMPORT_MAX_ROWS = config("EXPENSE_IMPORT_MAX_ROWS", default=10_000, cast=int)
+EXPENSE_IMPORT_BATCH_SIZE = config("EXPENSE_IMPORT_BATCH_SIZE", default=1_000, cast=int)
+
+# ----------------------------------------------
+# Password hashing
+#
+# A profile picks the preferred hasher; the others stay listed so hashes made
+# under another profile still verify and are rehashed on the next login.
+# Environments choose a profile and tune the costs in settings/env/.
+PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": "apps.auths.hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "apps.auths.hashers.TunedScryptPasswordHasher",
+    "argon2": "apps.auths.hashers.TunedArgon2PasswordHasher",  # needs argon2-cffi
+}
+
+
+def password_hashers(profile: str) -> list[str]:
+    """PASSWORD_HASHERS with the profile's hasher first."""
+    preferred: str = PASSWORD_HASHER_PROFILES[profile]
+    return [preferred, *(path for path in PASSWORD_HASHER_PROFILES.values() if path != preferred)]
+
+
+PASSWORD_HASHERS = password_hashers("pbkdf2")
+
+# Django's defaults for 5.2
+PASSWORD_PBKDF2_ITERATIONS = 1_000_000
+PASSWORD_SCRYPT_WORK_FACTOR = 2**14
+PASSWORD_SCRYPT_BLOCK_SIZE = 8
+PASSWORD_SCRYPT_PARALLELISM = 1
+PASSWORD_ARGON2_TIME_COST = 2
+PASSWORD_ARGON2_MEMORY_COST = 102_400
+PASSWORD_ARGON2_PARALLELISM = 8
+
 # ----------------------------------------------
 # Simple JWT
 #
@@ -83,22 +196,11 @@ SPECTACULAR_SETTINGS = {
 }
 
 # ----------------------------------------------
-# Debug Toolbar
+# Metrics
 #
-DEBUG_TOOLBAR_PANELS = [
-    'debug_toolbar.panels.history.HistoryPanel',
-    'debug_toolbar.panels.versions.VersionsPanel',
-    'debug_toolbar.panels.timer.TimerPanel',
-    'debug_toolbar.panels.settings.SettingsPanel',
-    'debug_toolbar.panels.headers.HeadersPanel',
-    'debug_toolbar.panels.request.RequestPanel',
-    'debug_toolbar.panels.sql.SQLPanel',
-    'debug_toolbar.panels.staticfiles.StaticFilesPanel',
-    'debug_toolbar.panels.templates.TemplatesPanel',
-    'debug_toolbar.panels.alerts.AlertsPanel',
-    'debug_toolbar.panels.cache.CachePanel',
-    'debug_toolbar.panels.signals.SignalsPanel',
-    'debug_toolbar.panels.community.CommunityPanel',
-    'debug_toolbar.panels.redirects.RedirectsPanel',
-    'debug_toolbar.panels.profiling.ProfilingPanel',
-]
\ No newline at end of file
+# Per-view latency histograms and SQL totals (apps.abstracts.metrics),
+# scraped from /metrics with "Authorization: Bearer <METRICS_AUTH_TOKEN>".
+# Without a token /metrics is only served when DEBUG is on.
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_SERVER_TIMING = config("METRICS_SERVER_TIMING", default=True, cast=bool)
+METRICS_AUTH_TOKEN = config("METRICS_AUTH_TOKEN", default="")
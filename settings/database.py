@@ -0,0 +1,80 @@
+"""
+Helpers turning database URLs into DATABASES entries.
+
+Supported schemes: postgres:// (also postgresql://, pgsql://) and
+sqlite:/// (relative path) or sqlite://// (absolute path). Query string
+parameters of PostgreSQL URLs are passed to the driver, e.g.
+``postgres://app:secret@db:5432/expenses?sslmode=require``.
+"""
+
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+
+POSTGRES_ENGINE = "django.db.backends.postgresql"
+SQLITE_ENGINE = "django.db.backends.sqlite3"
+
+ENGINES = {
+    "postgres": POSTGRES_ENGINE,
+    "postgresql": POSTGRES_ENGINE,
+    "pgsql": POSTGRES_ENGINE,
+    "sqlite": SQLITE_ENGINE,
+}
+
+
+def database_from_url(
+    url: str,
+    *,
+    conn_max_age: int = 0,
+    conn_health_checks: bool = False,
+    pool: bool = False,
+    pool_min_size: int = 2,
+    pool_max_size: int = 10,
+    pool_timeout: int = 10,
+    statement_timeout_ms: int = 0,
+) -> dict[str, Any]:
+    """
+    Build one DATABASES entry.
+
+    conn_max_age keeps connections open between requests and
+    conn_health_checks pings reused ones first. pool switches PostgreSQL to a
+    psycopg_pool connection pool (requires ``psycopg[pool]``); Django does not
+    combine pooling with persistent connections, so CONN_MAX_AGE is 0 then.
+    statement_timeout_ms aborts PostgreSQL queries running longer than that.
+    """
+    parts = urlsplit(url)
+    try:
+        engine: str = ENGINES[parts.scheme]
+    except KeyError:
+        raise ValueError(f"Unsupported database URL scheme: '{parts.scheme}'.")
+
+    if engine == SQLITE_ENGINE:
+        return {
+            "ENGINE": engine,
+            "NAME": unquote(parts.path[1:]) or ":memory:",
+            "CONN_MAX_AGE": conn_max_age,
+            "CONN_HEALTH_CHECKS": conn_health_checks,
+        }
+
+    options: dict[str, Any] = dict(parse_qsl(parts.query))
+    if statement_timeout_ms:
+        options["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    if pool:
+        options["pool"] = {
+            "min_size": pool_min_size,
+            "max_size": pool_max_size,
+            "timeout": pool_timeout,
+        }
+        conn_max_age = 0
+
+    return {
+        "ENGINE": engine,
+        "NAME": unquote(parts.path[1:]),
+        "USER": unquote(parts.username or ""),
+        "PASSWORD": unquote(parts.password or ""),
+        "HOST": parts.hostname or "",
+        "PORT": str(parts.port or ""),
+        "CONN_MAX_AGE": conn_max_age,
+        "CONN_HEALTH_CHECKS": conn_health_checks,
+        "OPTIONS": options,
+    }
@@ -1,4 +1,7 @@
+from decouple import Csv, config
+
 from settings.base import *  # noqa
+from settings.conf import password_hashers
 
 DEBUG = True
 
@@ -10,3 +13,47 @@ DATABASES = {
         "NAME": "db.sqlite3",
     }
 }
+
+# Optional SQLite files acting as read replicas, e.g.
+# SQLITE_REPLICAS=db-replica.sqlite3; refresh them with
+# `manage.py sync_sqlite_replicas`.
+for index, name in enumerate(config("SQLITE_REPLICAS", default="", cast=Csv()), start=1):
+    DATABASES[f"replica_{index}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS = [*DATABASE_REPLICAS, f"replica_{index}"]
+
+# ----------------------------------------------
+# Password hashing
+#
+# Cheap hashes keep local logins, tests and generate_test_data fast.
+PASSWORD_HASHERS = password_hashers(config("PASSWORD_HASH_PROFILE", default="pbkdf2"))
+PASSWORD_PBKDF2_ITERATIONS = config("PASSWORD_PBKDF2_ITERATIONS", default=100_000, cast=int)
+PASSWORD_SCRYPT_WORK_FACTOR = config("PASSWORD_SCRYPT_WORK_FACTOR", default=2**12, cast=int)
+
+# ----------------------------------------------
+# Debug Toolbar
+#
+# Local only: the toolbar instruments every request.
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+MIDDLEWARE = [*MIDDLEWARE, "debug_toolbar.middleware.DebugToolbarMiddleware"]
+
+DEBUG_TOOLBAR_PANELS = [
+    'debug_toolbar.panels.history.HistoryPanel',
+    'debug_toolbar.panels.versions.VersionsPanel',
+    'debug_toolbar.panels.timer.TimerPanel',
+    'debug_toolbar.panels.settings.SettingsPanel',
+    'debug_toolbar.panels.headers.HeadersPanel',
+    'debug_toolbar.panels.request.RequestPanel',
+    'debug_toolbar.panels.sql.SQLPanel',
+    'debug_toolbar.panels.staticfiles.StaticFilesPanel',
+    'debug_toolbar.panels.templates.TemplatesPanel',
+    'debug_toolbar.panels.alerts.AlertsPanel',
+    'debug_toolbar.panels.cache.CachePanel',
+    'debug_toolbar.panels.signals.SignalsPanel',
+    'debug_toolbar.panels.community.CommunityPanel',
+    'debug_toolbar.panels.redirects.RedirectsPanel',
+    'debug_toolbar.panels.profiling.ProfilingPanel',
+]
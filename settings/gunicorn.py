@@ -0,0 +1,74 @@
+"""
+Gunicorn configuration for production containers:
+
+    gunicorn --config python:settings.gunicorn settings.wsgi:application
+
+Set GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker and serve
+settings.asgi:application to run the async endpoints under ASGI.
+
+The app is preloaded in the master so workers fork with Django already
+imported. SIGHUP gracefully replaces the workers (new settings, same code);
+to roll out new code send SIGUSR2 then SIGQUIT to the old master, or
+restart the container.
+"""
+
+# Python modules
+import os
+from typing import Any
+
+from decouple import config
+
+
+def cpu_count() -> int:
+    """CPUs this process may run on, honouring container CPU sets."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# ----------------------------------------------
+# Server socket
+#
+bind = config("GUNICORN_BIND", default="0.0.0.0:8000")
+backlog = config("GUNICORN_BACKLOG", default=2048, cast=int)
+
+# ----------------------------------------------
+# Workers
+#
+# Sync workers: (2 x cores) + 1. Async (uvicorn) workers multiplex requests,
+# so one per core is enough.
+worker_class = config("GUNICORN_WORKER_CLASS", default="sync")
+workers = config(
+    "WEB_CONCURRENCY",
+    default=cpu_count() if "uvicorn" in worker_class else cpu_count() * 2 + 1,
+    cast=int,
+)
+threads = config("GUNICORN_THREADS", default=1, cast=int)
+preload_app = config("GUNICORN_PRELOAD", default=True, cast=bool)
+
+# Recycle workers now and then so slow leaks cannot build up; the jitter
+# keeps them from restarting all at once.
+max_requests = config("GUNICORN_MAX_REQUESTS", default=1000, cast=int)
+max_requests_jitter = config("GUNICORN_MAX_REQUESTS_JITTER", default=100, cast=int)
+
+timeout = config("GUNICORN_TIMEOUT", default=30, cast=int)
+graceful_timeout = config("GUNICORN_GRACEFUL_TIMEOUT", default=30, cast=int)
+keepalive = config("GUNICORN_KEEPALIVE", default=5, cast=int)
+
+# Worker heartbeats go to tmpfs instead of the container's overlay disk.
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# ----------------------------------------------
+# Logging
+#
+accesslog = config("GUNICORN_ACCESS_LOG", default="-")
+errorlog = "-"
+loglevel = config("GUNICORN_LOG_LEVEL", default="info")
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Never share database connections opened in the master with workers."""
+    from django.db import connections
+
+    connections.close_all()
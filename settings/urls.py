@@ -9,25 +9,40 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
-from debug_toolbar.toolbar import debug_toolbar_urls
 
 # Django modules
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
+# Project modules
+from apps.abstracts.metrics import metrics_view
+from apps.abstracts.static import serve_static
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path(route="api/auths/", view=include("apps.auths.urls")),
     path(route="api/expense-tracker/", view=include("apps.category.urls")),
     path(route="api/expense-tracker/", view=include("apps.expense.urls")),
+    path(route="api/expense-tracker/", view=include("apps.budget.urls")),
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
-]+ debug_toolbar_urls()
+    path('metrics', metrics_view, name='metrics'),
+]
+
+if "debug_toolbar" in settings.INSTALLED_APPS:
+    from debug_toolbar.toolbar import debug_toolbar_urls
+
+    urlpatterns += debug_toolbar_urls()
 
-urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+if settings.DEBUG:
+    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+elif settings.SERVE_STATIC:
+    urlpatterns += [
+        re_path(rf"^{settings.STATIC_URL.lstrip('/')}(?P<path>.*)$", serve_static),
+    ]